@@ -0,0 +1,42 @@
+"""
+Encoding ``Dixt`` objects as bytes: ``to_bytes()``/``from_bytes()`` against
+``json()``/``from_json()`` and ``pickle``, for time and size.
+
+Unlike JSON, the binary format keeps the hidden items and the metadata of
+the keys, and it is the smallest. The encoder and decoder are pure Python,
+while ``json`` and ``pickle`` are implemented in C, so it is not faster.
+
+Usage::
+
+    python -m benchmarks.binary
+"""
+
+import pickle
+import timeit
+
+from lxdx import Dixt
+from benchmarks.loading import document
+
+
+SIZES = (1000, 10000)
+
+
+def main():
+    print(f'{"items":>8} {"format":>8} {"encode msec":>12} {"decode msec":>12} {"KB":>8}')
+    for size in SIZES:
+        dx = Dixt.from_json(document(size))
+        formats = {
+            'json': (dx.json, Dixt.from_json),
+            'pickle': (lambda: pickle.dumps(dx, pickle.HIGHEST_PROTOCOL), pickle.loads),
+            'binary': (dx.to_bytes, Dixt.from_bytes),
+        }
+        for name, (encode, decode) in formats.items():
+            data = encode()
+            assert decode(data) == dx
+            encoding = min(timeit.repeat(encode, number=1, repeat=5)) * 1e3
+            decoding = min(timeit.repeat(lambda: decode(data), number=1, repeat=5)) * 1e3
+            print(f'{size:>8} {name:>8} {encoding:>12.1f} {decoding:>12.1f} {len(data) / 1e3:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Construction time of ``Dixt`` objects against the depth of the data.
+
+Each level of the data has the same number of items, so the total size
+grows linearly with the depth. Construction time should grow the same way.
+
+Usage::
+
+    python -m benchmarks.construction
+"""
+
+import timeit
+
+from lxdx import Dixt
+
+
+WIDTH = 10
+DEPTHS = (25, 50, 100, 200)
+
+
+def nested(depth, width=WIDTH):
+    data = {f'leaf-{i}': i for i in range(width)}
+    for level in range(depth):
+        data = {f'leaf-{i}': i for i in range(width)} | {f'level-{level}': data}
+    return data
+
+
+def main():
+    print(f'{"depth":>8} {"usec":>12} {"usec/level":>12}')
+    for depth in DEPTHS:
+        data = nested(depth)
+        number = 200
+        seconds = min(timeit.repeat(lambda: Dixt(data), number=number, repeat=5))
+        usec = seconds / number * 1e6
+        print(f'{depth:>8} {usec:>12.1f} {usec / depth:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""
+Copying ``Dixt`` objects with ``copy.copy()`` and ``copy.deepcopy()``,
+against copying the equivalent ``dict``.
+
+Usage::
+
+    python -m benchmarks.copying
+"""
+
+import copy
+import timeit
+
+from lxdx import Dixt
+from benchmarks.loading import document
+
+
+SIZES = (1000, 10000)
+
+
+def main():
+    print(f'{"items":>8} {"method":>24} {"msec":>10}')
+    for size in SIZES:
+        dx = Dixt.from_json(document(size))
+        data = dx.dict()
+        methods = {
+            'copy.copy(dx)': lambda: copy.copy(dx),
+            'copy.deepcopy(dx)': lambda: copy.deepcopy(dx),
+            'copy.deepcopy(dict)': lambda: copy.deepcopy(data),
+        }
+        for name, func in methods.items():
+            msec = min(timeit.repeat(func, number=1, repeat=5)) * 1e3
+            print(f'{size:>8} {name:>24} {msec:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Writing ``Dixt`` objects as JSON.
+
+``json()``, ``iterencode()``, and ``dump()`` encode the internal data of
+the objects directly, instead of converting the objects to ``dict`` first.
+The peak memory is measured with ``tracemalloc``, separately from the time.
+
+Usage::
+
+    python -m benchmarks.dumping
+"""
+
+import io
+import json
+import timeit
+import tracemalloc
+
+from lxdx import Dixt
+from benchmarks.loading import document
+
+
+SIZES = (1000, 10000)
+
+
+class NullFile(io.TextIOBase):
+    def write(self, text):
+        return len(text)
+
+
+def peak(func):
+    tracemalloc.start()
+    func()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result / 2 ** 20
+
+
+def main():
+    print(f'{"items":>8} {"method":>24} {"msec":>10} {"peak MiB":>10}')
+    for size in SIZES:
+        dx = Dixt.from_json(document(size))
+        methods = {
+            'json.dumps(dx.dict())': lambda: json.dumps(dx.dict()),
+            'dx.json()': dx.json,
+            'json.dump(dx.dict(), f)': lambda: json.dump(dx.dict(), NullFile()),
+            'dx.dump(f)': lambda: dx.dump(NullFile()),
+        }
+        for name, func in methods.items():
+            msec = min(timeit.repeat(func, number=1, repeat=5)) * 1e3
+            print(f'{size:>8} {name:>24} {msec:>10.1f} {peak(func):>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
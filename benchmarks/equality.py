@@ -0,0 +1,63 @@
+"""
+Comparing independently loaded ``Dixt`` objects, against comparing
+the equivalent ``dict`` objects, and only the keys of the objects.
+
+Usage::
+
+    python -m benchmarks.equality
+"""
+
+import json
+import timeit
+
+from lxdx import Dixt
+
+
+SIZES = (1000, 10000)
+
+
+def document(size, value=0):
+    return json.dumps({f'group {i}': {'name': f'name {i}', 'tags': ['a', 'b'],
+                                      'entries': [{'value': j, 'label': f'label {j}'} for j in range(10)]}
+                       for i in range(size)} | {'last': {'value': value}})
+
+
+def nested(depth):
+    dx = Dixt(child=None)
+    for _ in range(depth):
+        dx = Dixt(child=dx)
+    return dx
+
+
+def keys(this, other):
+    # the keys of all nested objects
+    pending = [(this, other)]
+    while pending:
+        this, other = pending.pop()
+        if this.keys() != other.keys():
+            return False
+        pending.extend((value, other[key]) for key, value in this.items() if isinstance(value, Dixt))
+    return True
+
+
+def main():
+    print(f'{"groups":>8} {"method":>28} {"msec":>10}')
+    for size in SIZES:
+        text, changed = document(size), document(size, value=1)
+        dx, same, other = Dixt.from_json(text), Dixt.from_json(text), Dixt.from_json(changed)
+        data, other_data = json.loads(text), json.loads(changed)
+        deep, deep_copy = nested(size), nested(size)
+        methods = {
+            'dict == dict, one change': lambda: data == other_data,
+            'dx == same': lambda: dx == same,
+            'dx == other, one change': lambda: dx == other,
+            'keys of dx and other': lambda: keys(dx, other),
+            f'{size} levels == copy': lambda: deep == deep_copy,
+        }
+        for name, func in methods.items():
+            msec = min(timeit.repeat(func, number=1, repeat=5)) * 1e3
+            print(f'{size:>8} {name:>28} {msec:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
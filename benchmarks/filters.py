@@ -0,0 +1,43 @@
+"""
+Filtering items by a path with a filter predicate, compiled once,
+against the equivalent hand-written comprehension.
+
+Usage::
+
+    python -m benchmarks.filters
+"""
+
+import random
+import timeit
+
+from lxdx import Dixt
+
+
+SIZES = (100, 1000, 10000)
+PATH = "$.orders[?(@.status == 'open' && @.total > 100)]"
+
+
+def orders(size):
+    rng = random.Random(size)
+    return Dixt(orders=[{'id': i,
+                         'status': rng.choice(['open', 'closed']),
+                         'total': rng.randint(1, 200)} for i in range(size)])
+
+
+def main():
+    path = Dixt.compile_path(PATH)
+    print(f'{"items":>8} {"path usec":>12} {"comprehension usec":>20} {"ratio":>8}')
+    for size in SIZES:
+        dx = orders(size)
+        assert path.get(dx) == [o for o in dx.orders if o.status == 'open' and o.total > 100]
+        number = max(1, 20000 // size)
+        by_path = min(timeit.repeat(lambda: path.get(dx), number=number, repeat=5))
+        by_hand = min(timeit.repeat(
+            lambda: [o for o in dx.orders if o.status == 'open' and o.total > 100],
+            number=number, repeat=5))
+        print(f'{size:>8} {by_path / number * 1e6:>12.1f} {by_hand / number * 1e6:>20.1f} '
+              f'{by_path / by_hand:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
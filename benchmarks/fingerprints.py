@@ -0,0 +1,47 @@
+"""
+Fingerprints of ``Dixt`` objects with ``fingerprint()``, against hashing
+the JSON of sorted keys, also after a small change of tracked objects.
+
+Usage::
+
+    python -m benchmarks.fingerprints
+"""
+
+import hashlib
+import timeit
+
+from lxdx import Dixt
+
+
+SIZES = (1000, 10000)
+
+
+def build(size):
+    return Dixt({f'group {i}': {'name': f'name {i}', 'tags': ['a', 'b'],
+                                'entries': {f'item {j}': {'value': j, 'label': f'label {j}'} for j in range(10)}}
+                 for i in range(size)})
+
+
+def main():
+    print(f'{"groups":>8} {"method":>34} {"msec":>10}')
+    for size in SIZES:
+        dx, tracked = build(size), build(size)
+        tracked.track()
+        tracked.fingerprint()
+
+        def change(dx):
+            dx.group_1.entries.item_1.value += 1
+            return dx.fingerprint()
+
+        methods = {
+            'blake2b(dx.json(sort_keys=True))': lambda: hashlib.blake2b(dx.json(sort_keys=True).encode()).hexdigest(),
+            'dx.fingerprint()': lambda: dx.fingerprint(),
+            'tracked: change, fingerprint()': lambda: change(tracked),
+        }
+        for name, func in methods.items():
+            msec = min(timeit.repeat(func, number=1, repeat=5)) * 1e3
+            print(f'{size:>8} {name:>34} {msec:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
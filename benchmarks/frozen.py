@@ -0,0 +1,38 @@
+"""
+Deriving new versions of ``FrozenDixt`` objects, which share the unchanged
+items, against copying ``Dixt`` objects with ``|``, and hashing the versions.
+
+Usage::
+
+    python -m benchmarks.frozen
+"""
+
+import timeit
+
+from lxdx import Dixt, FrozenDixt
+
+
+SIZES = (1000, 10000, 100000)
+
+
+def main():
+    print(f'{"items":>8} {"method":>28} {"usec":>10}')
+    for size in SIZES:
+        data = {f'key {i}': i for i in range(size)}
+        dx, frozen = Dixt(data), FrozenDixt(data)
+        hash(frozen)
+        methods = {
+            "dx | {'key 1': 0}": lambda: dx | {'key 1': 0},
+            "frozen | {'key 1': 0}": lambda: frozen | {'key 1': 0},
+            "frozen.set('key 1', 0)": lambda: frozen.set('key 1', 0),
+            "hash(frozen.set('new', 0))": lambda: hash(frozen.set('new', 0)),
+            'hash(FrozenDixt(data))': lambda: hash(FrozenDixt(data)),
+        }
+        for name, func in methods.items():
+            number = 10 if 'FrozenDixt(' in name or name.startswith('dx') else 1000
+            usec = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+            print(f'{size:>8} {name:>28} {usec:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
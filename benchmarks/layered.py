@@ -0,0 +1,48 @@
+"""
+Changing and reading settings of four layers through ``LayeredDixt``,
+against merging the layers with ``|`` after each change.
+
+Usage::
+
+    python -m benchmarks.layered
+"""
+
+import timeit
+
+from lxdx import Dixt, LayeredDixt
+
+
+SIZES = (1000, 10000)
+
+
+def main():
+    print(f'{"items":>8} {"method":>28} {"usec":>10}')
+    for size in SIZES:
+        defaults = Dixt({f'key {i}': i for i in range(size)})
+        file = Dixt({f'key {i}': -i for i in range(0, size, 10)})
+        env, cli = Dixt(), Dixt()
+        view = LayeredDixt(cli, env, file, defaults)
+
+        def merged():
+            cli.key_1 = 0
+            return (defaults | file | env | cli).key_1
+
+        def layered():
+            view.key_1 = 0
+            return view.key_1
+
+        methods = {
+            'merge with |, and get': merged,
+            'LayeredDixt set, and get': layered,
+            'LayeredDixt get (cached)': lambda: view.key_10,
+            'Dixt get': lambda: defaults.key_10,
+            'push() and pop()': lambda: view.push(env) or view.pop(),
+        }
+        for name, func in methods.items():
+            number = 10 if func is merged else 10000
+            usec = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+            print(f'{size:>8} {name:>28} {usec:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Loading JSON documents into ``Dixt`` objects.
+
+``Dixt.from_json()`` builds the objects while parsing, instead of
+converting the result of ``json.loads()`` afterwards. ``Dixt.iter_json()``
+reads JSON Lines in chunks, so the peak memory does not depend on the
+number of records. ``Dixt.from_json(..., lazy=True)`` decodes only the top
+level, so editing one item of a large document and writing it back takes
+the time of validating the document, and not of converting it.
+``Dixt.from_file()`` decodes memory-mapped files directly from the page cache,
+without reading the file into memory first.
+
+Usage::
+
+    python -m benchmarks.loading
+"""
+
+import io
+import json
+import os
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from lxdx import Dixt
+
+
+SIZES = (100, 1000, 10000)
+LINES = (10000, 100000)
+
+
+def document(size):
+    return json.dumps({'Items': [{'ID': i, 'Name': f'item-{i}', 'Tags': ['a', 'b'],
+                                  'Meta': {'x': i, 'y': [{'z': i}]}} for i in range(size)]})
+
+
+def lines(size):
+    return ''.join(json.dumps({'ID': i, 'Event': 'click', 'Tags': ['a', 'b'], 'Meta': {'x': i}}) + '\n'
+                   for i in range(size)).encode()
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds * 1e3, peak / 2 ** 20
+
+
+def streaming():
+    print(f'{"lines":>8} {"from_json msec":>16} {"MiB":>8} {"iter_json msec":>16} {"MiB":>8}')
+    for size in LINES:
+        doc = lines(size)
+        whole = b'{"records": [' + doc.strip().replace(b'\n', b',') + b']}'
+        loaded = measure(lambda: sum(1 for _ in Dixt.from_json(whole).records))
+        streamed = measure(lambda: sum(1 for _ in Dixt.iter_json(io.BytesIO(doc))))
+        print(f'{size:>8} {loaded[0]:>16.1f} {loaded[1]:>8.1f} {streamed[0]:>16.1f} {streamed[1]:>8.1f}')
+
+
+def editing():
+    print(f'{"items":>8} {"MB":>8} {"eager msec":>12} {"lazy msec":>12}')
+    for size in (10000, 100000):
+        doc = json.dumps({'meta': {'version': 1}, 'records': json.loads(document(size))['Items']})
+
+        def edit(lazy):
+            dx = Dixt.from_json(doc, lazy=lazy)
+            dx.meta.version = 2
+            return dx.json()
+
+        results = [min(timeit.repeat(lambda: edit(lazy), number=1, repeat=3)) * 1e3 for lazy in (False, True)]
+        print(f'{size:>8} {len(doc) / 1e6:>8.1f} {results[0]:>12.1f} {results[1]:>12.1f}')
+
+
+def files():
+    print(f'{"items":>8} {"MB":>8} {"mmap":>6} {"msec":>10} {"peak MiB":>10}')
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (10000, 100000):
+            path = os.path.join(directory, f'{size}.json')
+            with open(path, 'w') as file:
+                file.write(document(size))
+            for use_mmap in (False, True):
+                def load():
+                    return Dixt.from_file(path, mmap=use_mmap, lazy=True)
+
+                msec = min(timeit.repeat(load, number=1, repeat=3)) * 1e3
+                print(f'{size:>8} {os.path.getsize(path) / 1e6:>8.1f} {str(use_mmap):>6} '
+                      f'{msec:>10.1f} {measure(load)[1]:>10.1f}')
+
+
+def main():
+    print(f'{"items":>8} {"json.loads msec":>16} {"Dixt(loads) msec":>18} {"from_json msec":>16}')
+    for size in SIZES:
+        doc = document(size)
+        number = max(1, 2000 // size)
+        results = [min(timeit.repeat(func, number=number, repeat=5)) / number * 1e3
+                   for func in (lambda: json.loads(doc),
+                                lambda: Dixt(json.loads(doc)),
+                                lambda: Dixt.from_json(doc))]
+        print(f'{size:>8} {results[0]:>16.2f} {results[1]:>18.2f} {results[2]:>16.2f}')
+    print()
+    streaming()
+    print()
+    editing()
+    print()
+    files()
+
+
+if __name__ == '__main__':
+    main()
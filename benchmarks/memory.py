@@ -0,0 +1,46 @@
+"""
+Memory used per ``Dixt`` object, measured with ``tracemalloc``.
+
+Each object has two items, the size of the items themselves included.
+``dict`` objects of the same items are measured for reference.
+
+Usage::
+
+    python -m benchmarks.memory
+"""
+
+import sys
+import tracemalloc
+
+from lxdx import Dixt
+
+
+COUNT = 10_000
+
+
+def measure(factory, count=COUNT):
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [factory(i) for i in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (end - start) / count
+
+
+def main():
+    print(f'{"object":>24} {"bytes/object":>14}')
+    print(f'{"dict":>24} {measure(lambda i: {"id": i, "name": "n"}):>14.0f}')
+    print(f'{"Dixt":>24} {measure(lambda i: Dixt({"id": i, "name": "n"})):>14.0f}')
+    print(f'{"Dixt (hidden item)":>24} {measure(_hidden):>14.0f}')
+    print(f'{"sys.getsizeof(Dixt())":>24} {sys.getsizeof(Dixt()):>14}')
+
+
+def _hidden(i):
+    dx = Dixt({'id': i, 'name': 'n'})
+    dx.keymeta('name', hidden=True)
+    return dx
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Merging a patch of 1000 keys into ``Dixt`` objects of growing size
+with ``merge()``, against merging the ``dict`` data and rebuilding the object.
+
+Usage::
+
+    python -m benchmarks.merging
+"""
+
+import timeit
+
+from lxdx import Dixt
+
+
+SIZES = (10000, 100000, 1000000)
+GROUP_SIZE = 1000
+
+
+def tree(size):
+    return {f'group {g}': {f'key {i}': i for i in range(GROUP_SIZE)}
+            for g in range(size // GROUP_SIZE)}
+
+
+def patch(size):
+    groups = size // GROUP_SIZE
+    return {f'group {g}': {f'key {i}': -i for i in range(GROUP_SIZE // groups or 1)}
+            for g in range(min(groups, GROUP_SIZE))}
+
+
+def merged(data, other):
+    """Deep merge of ``dict`` objects, creating a new one."""
+    result = dict(data)
+    for key, value in other.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            value = merged(result[key], value)
+        result[key] = value
+    return result
+
+
+def main():
+    print(f'{"items":>8} {"method":>32} {"msec":>10}')
+    for size in SIZES:
+        dx, other = Dixt(tree(size)), patch(size)
+        methods = {
+            'dx.merge(patch)': lambda: dx.merge(other),
+            'Dixt(merged(dx.dict(), patch))': lambda: Dixt(merged(dx.dict(), other)),
+        }
+        for name, func in methods.items():
+            msec = min(timeit.repeat(func, number=1, repeat=3)) * 1e3
+            print(f'{size:>8} {name:>32} {msec:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
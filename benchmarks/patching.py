@@ -0,0 +1,51 @@
+"""
+Sending changes of ``Dixt`` objects as JSON Patch operations created by ``diff()``,
+against sending the whole object as JSON.
+
+Usage::
+
+    python -m benchmarks.patching
+"""
+
+import json
+import timeit
+
+from lxdx import Dixt
+from benchmarks.loading import document
+
+
+SIZES = (1000, 10000)
+
+
+def settings(size):
+    return Dixt({f'group {g}': {'enabled': True, 'limits': {'min': g, 'max': g * 2}, 'tags': ['a', 'b']}
+                 for g in range(size)})
+
+
+def main():
+    print(f'{"items":>8} {"method":>32} {"msec":>10} {"KB":>10}')
+    for size in SIZES:
+        source = settings(size)
+        shared = source.copy()
+        shared['group 1'] = {'enabled': False}
+        separate = source.copy(deep=True)
+        separate.group_2.limits.max = 0
+
+        items = Dixt.from_json(document(size))
+        inserted = items.copy(deep=True)
+        inserted['Items'].insert(size // 2, Dixt(ID=-1))
+
+        methods = {
+            'json() of settings': lambda: source.json(),
+            'diff(), shared objects': lambda: json.dumps(Dixt.diff(source, shared)),
+            'diff(), deep copy': lambda: json.dumps(Dixt.diff(source, separate)),
+            'json() of list': lambda: items.json(),
+            'diff(), item inserted in list': lambda: json.dumps(Dixt.diff(items, inserted)),
+        }
+        for name, func in methods.items():
+            msec = min(timeit.repeat(func, number=1, repeat=5)) * 1e3
+            print(f'{size:>8} {name:>32} {msec:>10.2f} {len(func()) / 1024:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""
+Matching a small template against ``Dixt`` objects of growing size
+with ``is_submap_of()`` and ``is_supermap_of()``.
+
+Usage::
+
+    python -m benchmarks.submaps
+"""
+
+import timeit
+
+from lxdx import Dixt
+
+
+SIZES = (1000, 10000, 100000)
+
+
+def main():
+    print(f'{"items":>8} {"method":>32} {"usec":>10}')
+    template = {'key 1': 1, 'group': {'name': 'x', 'tags': ['a', 'b']}}
+    small = Dixt(template)
+    for size in SIZES:
+        dx = Dixt({f'key {i}': i for i in range(size)} | template)
+        methods = {
+            'template.is_submap_of(dx)': lambda: small.is_submap_of(dx),
+            'dx.is_supermap_of(template)': lambda: dx.is_supermap_of(template),
+        }
+        for name, func in methods.items():
+            usec = min(timeit.repeat(func, number=100, repeat=5)) / 100 * 1e6
+            print(f'{size:>8} {name:>32} {usec:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Encoding ``Dixt`` objects as JSON again after a small change,
+with and without tracking the changes.
+
+Usage::
+
+    python -m benchmarks.tracking
+"""
+
+import timeit
+
+from lxdx import Dixt
+
+
+SIZES = (1000, 10000)
+
+
+def build(size):
+    return Dixt({f'group {i}': {'name': f'name {i}', 'tags': ['a', 'b'],
+                                'entries': {f'item {j}': {'value': j, 'label': f'label {j}'} for j in range(10)}}
+                 for i in range(size)})
+
+
+def main():
+    print(f'{"groups":>8} {"method":>26} {"msec":>10}')
+    for size in SIZES:
+        plain, tracked = build(size), build(size)
+        tracked.track()
+        tracked.json()
+
+        def change(dx):
+            dx.group_1.entries.item_1.value += 1
+            return dx.json()
+
+        def retrack():
+            # the cached encodings are dropped
+            tracked.track(False)
+            tracked.track()
+
+        methods = {
+            'dx.json()': (lambda: plain.json(), None),
+            'change, dx.json()': (lambda: change(plain), None),
+            'tracked: change, json()': (lambda: change(tracked), None),
+            'tracked: first json()': (lambda: tracked.json(), retrack),
+        }
+        for name, (func, setup) in methods.items():
+            msec = min(timeit.repeat(func, setup or 'pass', number=1, repeat=5)) * 1e3
+            print(f'{size:>8} {name:>26} {msec:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Updating ``Dixt`` objects with ``update()`` and ``|=``,
+against updating the equivalent ``dict``.
+
+Usage::
+
+    python -m benchmarks.updating
+"""
+
+import timeit
+
+from lxdx import Dixt
+
+
+SIZES = (10000, 100000)
+
+
+def main():
+    print(f'{"items":>8} {"method":>24} {"msec":>10}')
+    for size in SIZES:
+        items = {f'key {i}': i for i in range(size)}
+        patch = {'key 1': 0, 'new': 1}
+        dx = Dixt(items)
+        methods = {
+            'dict().update(items)': lambda: {}.update(items),
+            'Dixt().update(items)': lambda: Dixt().update(items),
+            'dx.update(items)': lambda: dx.update(items),
+            'dx = dx | patch': lambda: dx | patch,
+            'dx |= patch': lambda: dx.__ior__(patch),
+        }
+        for name, func in methods.items():
+            msec = min(timeit.repeat(func, number=1, repeat=5)) * 1e3
+            print(f'{size:>8} {name:>24} {msec:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
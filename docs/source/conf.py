@@ -64,3 +64,14 @@ html_theme = 'furo'
 # relative to this directory. They are copied after the builtin static files,
 # so a file named "default.css" will overwrite the builtin "default.css".
 # html_static_path = ['_static']
+
+
+# -- Hooks -------------------------------------------------------------------
+
+def _public_bases(app, name, obj, options, bases):
+    # hide the private bases shared by the classes, e.g. of normalised keys
+    bases[:] = [base for base in bases if not base.__name__.startswith('_')]
+
+
+def setup(app):
+    app.connect('autodoc-process-bases', _public_bases)
@@ -1,4 +1,6 @@
-from .dixt import Dixt
+from .dixt import Dixt, key_normaliser
+from .frozen import FrozenDixt
+from .layered import LayeredDixt
 
 
-__all__ = ['Dixt']
+__all__ = ['Dixt', 'FrozenDixt', 'LayeredDixt', 'key_normaliser']
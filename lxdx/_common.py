@@ -0,0 +1,51 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from types import MappingProxyType
+
+from .jsonio import RawJSON
+
+# Definitions shared by the modules of the package.
+
+# marker for nonexistent keys and items, as keys can be any hashable
+_MISSING = object()
+
+# set the value of slots, bypassing __setattr__()
+_setslot = object.__setattr__
+
+# values which are shared instead of copied by deep copies
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), bytes, complex, RawJSON})
+
+# values which are compared directly, instead of by their items
+_SCALAR_TYPES = _IMMUTABLE_TYPES - {RawJSON}
+
+# Shared placeholder of the side-tables (__keymeta__, __hidden__)
+# until they are first written to.
+_EMPTY = MappingProxyType({})
@@ -0,0 +1,476 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import struct
+
+from typing import Any, BinaryIO, Iterator, Optional, Type
+
+from ._common import _setslot
+from .jsonio import RawJSON
+
+__all__ = ['MAGIC', 'Reader', 'Writer', 'dumps', 'loads']
+
+# header of the data, with the version of the format
+MAGIC = b'LXDX\x02'
+
+# Tags of the values. Integers are zigzag-encoded varints, and the sizes of
+# strings, bytes, and containers are varints. Dixt objects are written as
+# their items, hidden items, and metadata of keys; the keymap is rebuilt.
+# The str keys of the items are numbered in order of first appearance (KEY),
+# and are written as their number (KEYREF) after that.
+# The sequences of str keys of the objects (shapes) are numbered the same way,
+# so that the objects with a known shape are written as their values only.
+# The items of the objects with other keys are written in full (shape 0).
+NONE, FALSE, TRUE, INT, FLOAT, STR, BYTES, LIST, TUPLE, DIXT, KEY, KEYREF = range(12)
+
+_DOUBLE = struct.Struct('<d')
+
+
+def dumps(obj: Any, /) -> bytes:
+    """Encode the ``Dixt`` object (or any supported value) to bytes,
+    including the hidden items and the metadata of the keys.
+
+    Supported values are ``None``, ``bool``, ``int``, ``float``, ``str``,
+    ``bytes``, ``list``, ``tuple``, ``dict``, and ``Dixt`` objects.
+    ``dict`` objects are decoded as ``Dixt`` objects.
+
+    :raises TypeError: When a value is not supported.
+    """
+    encoder = _Encoder(MAGIC)
+    encoder.encode(obj)
+    return bytes(encoder.out)
+
+
+def loads(data: bytes, /, cls: Type) -> Any:
+    """Decode the bytes from :func:`dumps`, as objects of `cls`
+    (``Dixt`` or a subclass).
+
+    :raises ValueError: When the data is invalid or truncated.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError('Invalid header')
+    return _Decoder(bytes(data), cls, len(MAGIC)).decode_all()
+
+
+class Writer:
+    """Write ``Dixt`` objects to a binary file object, one record at a time.
+    Each record is prefixed by its size, so the file can be read back one
+    record at a time by :class:`Reader`.
+
+    Example:
+        .. code-block::
+
+            with open('cache.bin', 'wb') as file:
+                writer = Writer(file)
+                for dx in objects:
+                    writer.write(dx)
+    """
+
+    def __init__(self, fp: BinaryIO, /):
+        self.fp = fp
+        fp.write(MAGIC)
+
+    def write(self, obj: Any, /):
+        """Write one record. See :func:`dumps` for the supported values."""
+        encoder = _Encoder()
+        encoder.encode(obj)
+        size = bytearray()
+        _write_uvarint(size, len(encoder.out))
+        self.fp.write(size + encoder.out)
+
+
+class Reader:
+    """Read the records written by :class:`Writer` from a binary file object,
+    as objects of `cls` (``Dixt`` or a subclass). Only one record at a time
+    is held in memory.
+
+    :raises ValueError: When the data is invalid or truncated.
+    """
+
+    def __init__(self, fp: BinaryIO, /, cls: Type):
+        self.fp = fp
+        self.cls = cls
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise ValueError('Invalid header')
+
+    def __iter__(self) -> Iterator:
+        while (size := self.__record_size()) is not None:
+            record = self.fp.read(size)
+            if len(record) < size:
+                raise ValueError('Truncated data')
+            yield _Decoder(record, self.cls).decode_all()
+
+    def __record_size(self) -> Optional[int]:
+        result, shift = 0, 0
+        while byte := self.fp.read(1):
+            result |= (byte[0] & 0x7f) << shift
+            if byte[0] < 0x80:
+                return result
+            shift += 7
+        if shift:
+            raise ValueError('Truncated data')
+        return None
+
+
+class _Encoder:
+    """Encoder of values to `out`, with the numbers of the str keys."""
+
+    def __init__(self, header: bytes = b''):
+        self.out = bytearray(header)
+        self.keys = {}
+        self.shapes = {}
+
+    def encode(self, value):
+        if (writer := _WRITERS.get(type(value))) is None:
+            writer = _writer_of(value)
+        writer(self, value)
+
+
+def _writer_of(value):
+    from .dixt import Dixt  # lxdx.dixt imports this module
+    if isinstance(value, Dixt):
+        _WRITERS.setdefault(Dixt, _write_dixt)
+        return _write_dixt
+    for cls, writer in _WRITERS.items():
+        if isinstance(value, cls):
+            return writer
+    raise TypeError(f'Object of type {type(value).__name__} is not supported')
+
+
+def _write_uvarint(out, number):
+    while number >= 0x80:
+        out.append(number & 0x7f | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _write_none(encoder, _):
+    encoder.out.append(NONE)
+
+
+def _write_bool(encoder, value):
+    encoder.out.append(TRUE if value else FALSE)
+
+
+def _write_int(encoder, value):
+    encoder.out.append(INT)
+    _write_uvarint(encoder.out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _write_float(encoder, value):
+    encoder.out.append(FLOAT)
+    encoder.out += _DOUBLE.pack(value)
+
+
+def _write_str(encoder, value, tag=STR):
+    encoded = value.encode('utf-8', 'surrogatepass')
+    out = encoder.out
+    out.append(tag)
+    _write_uvarint(out, len(encoded))
+    out += encoded
+
+
+def _write_bytes(encoder, value):
+    encoder.out.append(BYTES)
+    _write_uvarint(encoder.out, len(value))
+    encoder.out += value
+
+
+def _write_sequence(encoder, value):
+    encoder.out.append(TUPLE if isinstance(value, tuple) else LIST)
+    _write_uvarint(encoder.out, len(value))
+    for item in value:
+        encoder.encode(item)
+
+
+def _write_key(encoder, key):
+    if type(key) is not str:
+        encoder.encode(key)
+    elif (number := encoder.keys.get(key)) is not None:
+        encoder.out.append(KEYREF)
+        _write_uvarint(encoder.out, number)
+    else:
+        encoder.keys[key] = len(encoder.keys)
+        _write_str(encoder, key, KEY)
+
+
+def _write_items(encoder, items):
+    _write_uvarint(encoder.out, len(items))
+    for key, value in items.items():
+        _write_key(encoder, key)
+        encoder.encode(value)
+
+
+def _write_shape(encoder, shape):
+    # the number of the shape, from 1; a new shape is followed by its keys
+    out, shapes = encoder.out, encoder.shapes
+    if (number := shapes.get(shape)) is not None:
+        _write_uvarint(out, number)
+        return
+    shapes[shape] = len(shapes) + 1
+    _write_uvarint(out, len(shapes))
+    _write_uvarint(out, len(shape))
+    for key in shape:
+        _write_key(encoder, key)
+
+
+def _write_dixt(encoder, dx):
+    out, data = encoder.out, dx.__data__
+    out.append(DIXT)
+    shape = tuple(data)
+    # shapes of other keys could be equal to others, as True == 1
+    if shape in encoder.shapes or all(type(key) is str for key in shape):
+        _write_shape(encoder, shape)
+        encode = encoder.encode
+        for value in data.values():
+            encode(value)
+    else:
+        out.append(0)
+        _write_items(encoder, data)
+    _write_items(encoder, dx.__hidden__)
+    _write_uvarint(encoder.out, len(dx.__keymeta__))
+    for nkey, meta in dx.__keymeta__.items():
+        encoder.encode(nkey)
+        _write_items(encoder, meta)
+
+
+def _write_raw(encoder, value):
+    # spans of lazy JSON documents
+    encoder.encode(value.decode())
+
+
+def _write_dict(encoder, value):
+    # raw items of lazy objects are Dixt objects when accessed
+    encoder.out += bytes((DIXT, 0))
+    _write_items(encoder, value)
+    encoder.out += b'\x00\x00'
+
+
+_WRITERS = {
+    type(None): _write_none,
+    bool: _write_bool,
+    int: _write_int,
+    float: _write_float,
+    str: _write_str,
+    bytes: _write_bytes,
+    list: _write_sequence,
+    tuple: _write_sequence,
+    dict: _write_dict,
+    RawJSON: _write_raw,
+}
+
+
+class _Decoder:
+    """Decoder of the values in the `data` from `pos`."""
+
+    def __init__(self, data: bytes, cls: Type, pos: int = 0):
+        self.data = data
+        self.cls = cls
+        self.normalise = cls.__normaliser__
+        self.pos = pos
+        self.keys = []  # pairs of str keys and their normalised keys, by number
+        self.shapes = [None]  # keys of the shapes and their keymaps, by number
+
+    def decode_all(self):
+        try:
+            value = self.decode()
+        except IndexError:
+            raise ValueError('Truncated data') from None
+        if self.pos > len(self.data):
+            # strings are sliced without checking the size first
+            raise ValueError('Truncated data')
+        if self.pos != len(self.data):
+            raise ValueError(f'Extra data at position {self.pos}')
+        return value
+
+    def decode(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+        return _READERS[tag](self)
+
+    def uvarint(self):
+        data, pos = self.data, self.pos
+        byte = data[pos]
+        result, shift = byte & 0x7f, 7
+        while byte >= 0x80:
+            pos += 1
+            byte = data[pos]
+            result |= (byte & 0x7f) << shift
+            shift += 7
+        self.pos = pos + 1
+        return result
+
+    def chunk(self):
+        size = self.uvarint()
+        start, self.pos = self.pos, self.pos + size
+        if self.pos > len(self.data):
+            raise IndexError
+        return self.data[start:self.pos]
+
+    def int(self):
+        number = self.uvarint()
+        return -(number + 1 >> 1) if number & 1 else number >> 1
+
+    def float(self):
+        start, self.pos = self.pos, self.pos + 8
+        try:
+            return _DOUBLE.unpack_from(self.data, start)[0]
+        except struct.error:
+            raise IndexError from None
+
+    def str(self):
+        return str(self.chunk(), 'utf-8', 'surrogatepass')
+
+    def bytes(self):
+        return self.chunk()
+
+    def list(self):
+        count = self.uvarint()
+        values, pos = [], self.pos
+        for _ in range(count):
+            value, pos = self.value(pos)
+            values.append(value)
+        self.pos = pos
+        return values
+
+    def value(self, pos):
+        """Decode the value at `pos`, returning it with the position after it.
+        Small numbers, short strings, and constants are decoded inline,
+        as they are most of the values.
+        """
+        data = self.data
+        tag = data[pos]
+        if tag == STR and (size := data[pos + 1]) < 0x80:
+            pos += size + 2
+            return str(data[pos - size:pos], 'utf-8', 'surrogatepass'), pos
+        if tag == INT and (number := data[pos + 1]) < 0x80:
+            return -(number + 1 >> 1) if number & 1 else number >> 1, pos + 2
+        if tag <= TRUE:
+            return _CONSTANTS[tag], pos + 1
+        self.pos = pos + 1
+        return _READERS[tag](self), self.pos
+
+    def tuple(self):
+        return tuple(self.decode() for _ in range(self.uvarint()))
+
+    def key(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == KEYREF:
+            return self.keys[self.uvarint()]
+        if tag == KEY:
+            key = self.str()
+            self.keys.append((key, self.normalise(key)))
+            return self.keys[-1]
+        key = _READERS[tag](self)
+        return key, self.normalise(key)
+
+    def items(self, keymap):
+        count = self.uvarint()
+        items, data, keys, cls, pos = {}, self.data, self.keys, self.cls, self.pos
+        for _ in range(count):
+            if data[pos] == KEYREF and data[pos + 1] < 0x80:
+                key, nkey = keys[data[pos + 1]]
+                pos += 2
+            else:
+                self.pos = pos
+                key, nkey = self.key()
+                pos = self.pos
+            value, pos = self.value(pos)
+            items[key] = value
+            keymap[nkey] = key
+            if type(value) is cls:
+                _setslot(value, '__key__', key)
+        self.pos = pos
+        return items
+
+    def shape(self):
+        shapes = self.shapes
+        if (number := self.data[self.pos]) < min(len(shapes), 0x80):
+            self.pos += 1
+            return shapes[number]
+        number = self.uvarint()
+        if number == len(shapes):
+            pairs = [self.key() for _ in range(self.uvarint())]
+            shapes.append((tuple(key for key, _ in pairs), {nkey: key for key, nkey in pairs}))
+        elif number > len(shapes):
+            raise ValueError(f'Invalid shape at position {self.pos - 1}')
+        return shapes[number]
+
+    def values(self, keys):
+        values, pos, cls = [], self.pos, self.cls
+        for key in keys:
+            value, pos = self.value(pos)
+            values.append(value)
+            if type(value) is cls:
+                _setslot(value, '__key__', key)
+        self.pos = pos
+        return dict(zip(keys, values))
+
+    def dixt(self):
+        dx = self.cls.__new__(self.cls)
+        if shape := self.shape():
+            _setslot(dx, '__data__', self.values(shape[0]))
+            keymap = shape[1].copy()
+        else:
+            keymap = {}
+            _setslot(dx, '__data__', self.items(keymap))
+        if self.data[self.pos:self.pos + 2] == b'\x00\x00':
+            # no hidden items nor metadata of keys, as most objects
+            self.pos += 2
+        else:
+            self.extras(dx, keymap)
+        _setslot(dx, '__keymap__', keymap)
+        return dx
+
+    def extras(self, dx, keymap):
+        if hidden := self.items(keymap):
+            _setslot(dx, '__hidden__', hidden)
+        if count := self.uvarint():
+            _setslot(dx, '__keymeta__', {self.decode(): self.items({}) for _ in range(count)})
+
+    def invalid(self):
+        raise ValueError(f'Invalid tag at position {self.pos - 1}')
+
+
+_CONSTANTS = (None, False, True)
+
+_READERS = (
+    lambda _: None,
+    lambda _: False,
+    lambda _: True,
+    _Decoder.int,
+    _Decoder.float,
+    _Decoder.str,
+    _Decoder.bytes,
+    _Decoder.list,
+    _Decoder.tuple,
+    _Decoder.dixt,
+) + (_Decoder.invalid,) * 246
@@ -28,18 +28,124 @@ ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import copy
+import hashlib
+import io
 import json
+import pickle
 import re
+import secrets
+import sys
+import weakref
 
-from collections import defaultdict
-from collections.abc import KeysView, ItemsView, ValuesView, MutableMapping
-from copy import deepcopy
-from typing import Any, Dict, List, Mapping, Tuple, Union, Hashable
+from collections.abc import Iterable, KeysView, ItemsView, ValuesView, MutableMapping, Sized
+from functools import lru_cache
+from itertools import islice
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union, Hashable
 
-__all__ = ['Dixt']
+from . import binary, patch
+from ._common import _EMPTY, _IMMUTABLE_TYPES, _MISSING, _SCALAR_TYPES, _setslot
+from .jsonio import CHUNK_SIZE, RawJSON, _decoded, iter_records, read_text, scan_document, scan_object
+from .path import CompiledPath, compile_path
 
+__all__ = ['Dixt', 'key_normaliser']
 
-class Dixt(MutableMapping):
+# maximum number of cached normalised keys, per normaliser
+NORMALISER_CACHE_SIZE = 2 ** 14
+
+# minimum size of bytes values pickled as out-of-band buffers (protocol 5)
+PICKLE_BUFFER_SIZE = 2 ** 16
+
+# size in bytes of the BLAKE2 digests of fingerprint()
+DIGEST_SIZE = 32
+
+# default character replacements when normalising keys
+_REPLACEMENTS = {' ': '_', '-': '_'}
+
+# values of lazy objects, which are hydrated when accessed
+_RAW_TYPES = (dict, list, tuple, RawJSON)
+
+
+def key_normaliser(replacements: Optional[Mapping[str, str]] = None, /, *,
+                   strip=True, lower=True, maxsize=NORMALISER_CACHE_SIZE) -> Callable:
+    """Create a key normaliser, e.g., for a ``Dixt`` subclass.
+
+    The character `replacements` are compiled once into a translation table.
+    The results are cached, see :func:`functools.lru_cache` for the
+    statistics through ``cache_info()``.
+
+    :param replacements: Map of characters to their replacements.
+                         Defaults to spaces and hyphens into underscores.
+    :param strip: Strip leading and trailing whitespaces.
+    :param lower: Convert to lower-case.
+    :param maxsize: Maximum number of cached keys.
+
+    Example:
+        .. code-block::
+
+            class Config(Dixt):
+                __normaliser__ = key_normaliser({'.': '_', '-': '_'})
+    """
+    table = str.maketrans(_REPLACEMENTS if replacements is None else replacements)
+
+    def normalise(key: str) -> str:
+        if strip:
+            key = key.strip()
+        key = key.translate(table)
+        return key.lower() if lower else key
+
+    return _cached_normaliser(normalise, maxsize)
+
+
+def _cached_normaliser(func, maxsize=NORMALISER_CACHE_SIZE):
+    """Memoise the normaliser `func`, which is applied only to ``str`` keys.
+    Normalised keys are interned, so objects with the same keys share them.
+
+    Internal dict handles the incoming keys,
+    so the item's hashability is not checked here.
+    """
+    @lru_cache(maxsize=maxsize)
+    def normalise(key: Hashable) -> Hashable:
+        if isinstance(key, str):
+            nkey = func(key)
+            return sys.intern(nkey) if type(nkey) is str else nkey
+        return key
+
+    return normalise
+
+
+_normalise_key = key_normaliser()
+
+
+def _init_normaliser(cls):
+    """Cache the normaliser assigned to the class, if any."""
+    normaliser = cls.__dict__.get('__normaliser__')
+    if isinstance(normaliser, staticmethod):
+        normaliser = normaliser.__func__
+    if normaliser is not None and not hasattr(normaliser, 'cache_info'):
+        normaliser = _cached_normaliser(normaliser)
+    if normaliser is not None:
+        cls.__normaliser__ = staticmethod(normaliser)
+
+
+class _NormalisedKeys:
+    """Base of the classes accessible by normalised keys,
+    i.e., ``Dixt``, ``FrozenDixt``, and ``LayeredDixt``.
+    """
+
+    __slots__ = ()
+
+    # Converts keys to attribute names. Subclasses can assign
+    # any function, which will be cached, or use key_normaliser().
+    __normaliser__ = staticmethod(_normalise_key)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _init_normaliser(cls)
+
+
+class Dixt(_NormalisedKeys, MutableMapping):
     """``Dixt`` is an "extended" Python ``dict``, works just like ``dict``,
     but with metadata and attribute-accessibility by normalising keys.
 
@@ -47,6 +153,9 @@ class Dixt(MutableMapping):
     submap/supermap comparison, and others.
     """
 
+    __slots__ = ('__data__', '__keymap__', '__keymeta__', '__hidden__',
+                 '__key__', '__parent__', '__raw__', '__weakref__')
+
     # supported meta flags
     __metas__ = {'hidden': bool}
 
@@ -54,14 +163,32 @@ class Dixt(MutableMapping):
     __meta_resets__ = {'hidden': False}
 
     def __new__(cls, data=None, /, **kwargs):
-        # use deepcopy 'cause sometimes data can be an iterator,
-        # so it won't be 'used up' before __init__()
-        spec = dict(deepcopy(data) or {}) | kwargs
+        # Data is not touched here, so iterators are
+        # not 'used up' before __init__(). Only the keymap is
+        # needed for attribute access of partially built objects,
+        # e.g., during copy.deepcopy().
         dx = super().__new__(cls)
 
+        # holds all original keys and their values
+        _setslot(dx, '__data__', {})
+
         # holds all normalised keys including non-str keys
-        dx.__dict__['__keymap__'] = {_normalise_key(key): key
-                                     for key in spec.keys()}
+        _setslot(dx, '__keymap__', {})
+
+        # container for keys and their meta flags
+        _setslot(dx, '__keymeta__', _EMPTY)
+
+        # Container for hidden items as effect of the hidden flag.
+        # Items in __data__ are moved here until the hidden flag is reset.
+        _setslot(dx, '__hidden__', _EMPTY)
+
+        _setslot(dx, '__key__', None)
+
+        _setslot(dx, '__parent__', None)
+
+        # Original keys of items still holding raw (non-hydrated) containers.
+        # None if this object is not lazy.
+        _setslot(dx, '__raw__', None)
         return dx
 
     def __init__(self, data=None, /, **kwargs):
@@ -74,27 +201,49 @@ class Dixt(MutableMapping):
                        (if there are same keys) ``data``.
         """
         super().__init__()
-        spec = dict(data or {}) | kwargs
-
-        # holds all original keys and their values
-        self.__dict__['__data__'] = _hype(spec)
-
-        # container for keys and their meta flags
-        self.__dict__['__keymeta__'] = defaultdict(dict)
-
-        # Container for hidden items as effect of the hidden flag.
-        # Items in __data__ are moved here until the hidden flag is reset.
-        self.__dict__['__hidden__'] = {}
-
-        self.__dict__['__key__'] = None
+        if not isinstance(data, dict):
+            # iterators are consumed only here
+            data = dict(data or {})
+        self.__setup((data, kwargs))
+
+    def __copy__(self):
+        """Create a shallow copy of this object, which has its own
+        items, keymap, metadata, and hidden items, but shares the values.
+        """
+        dx = self.__class__.__new__(self.__class__)
+        _setslot(dx, '__data__', dict(self.__data__))
+        _setslot(dx, '__keymap__', dict(self.__keymap__))
+        if self.__keymeta__:
+            _setslot(dx, '__keymeta__', {nkey: dict(meta) for nkey, meta in self.__keymeta__.items()})
+        if self.__hidden__:
+            _setslot(dx, '__hidden__', dict(self.__hidden__))
+        if self.__raw__ is not None:
+            _setslot(dx, '__raw__', set(self.__raw__))
+        _setslot(dx, '__key__', self.__key__)
+        return dx
 
-        self.__dict__['__parent__'] = None
+    def __deepcopy__(self, memo):
+        """Create a deep copy of this object in a single pass over the items.
+        Values of immutable types are shared instead of copied.
+        """
+        dx = self.__class__.__new__(self.__class__)
+        memo[id(self)] = dx
+        _setslot(dx, '__data__', {key: _deepcopy(value, memo) for key, value in self.__data__.items()})
+        _setslot(dx, '__keymap__', dict(self.__keymap__))
+        if self.__keymeta__:
+            _setslot(dx, '__keymeta__', {nkey: dict(meta) for nkey, meta in self.__keymeta__.items()})
+        if self.__hidden__:
+            _setslot(dx, '__hidden__', {key: _deepcopy(value, memo) for key, value in self.__hidden__.items()})
+        if self.__raw__ is not None:
+            _setslot(dx, '__raw__', set(self.__raw__))
+        _setslot(dx, '__key__', self.__key__)
+        return dx
 
     def __contains__(self, origkey):
         """``True`` if this object contains the original (non-normalised) key,
         otherwise ``False``. This retains the original behaviour of ``dict``.
         """
-        return not _contents(self.__data__, origkey)[1]
+        return origkey in self.__data__
 
     def __delattr__(self, attr):
         """Remove the key-value entry in this object.
@@ -104,42 +253,66 @@ class Dixt(MutableMapping):
 
         :raises KeyError: When original key is not found.
         """
-        if origkey := self.__get_orig_key(attr):
-            if origkey in self.whats_hidden():
-                del self.__hidden__[origkey]
-                del self.__keymeta__[origkey]
-            else:
-                del self.__data__[origkey]
-            del self.__keymap__[_normalise_key(attr)]
-        else:
+        nkey = self.__normaliser__(attr)
+        origkey = self.__keymap__.get(nkey, _MISSING)
+        if origkey is _MISSING:
             raise KeyError(f"Dixt object has no attribute '{attr}'")
 
+        if origkey in self.__hidden__:
+            del self.__hidden__[origkey]
+            self.__keymeta__.pop(nkey, None)
+        else:
+            del self.__data__[origkey]
+        if self.__raw__:
+            self.__raw__.discard(origkey)
+        del self.__keymap__[nkey]
+        if self.__parent__ is not None:
+            _changed(self, origkey)
+
     def __delitem__(self, key):
         self.__delattr__(key)
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, Dixt):
-            return self.__data__.__eq__(other.__data__)
-        if isinstance(other, Mapping):
-            return self.__data__.__eq__(other)
+            other = other.__data__
+        elif not isinstance(other, dict):
+            return self.__eq_pairs(other)
+        data = self.__data__
+        if len(data) != len(other) or data.keys() != other.keys():
+            return False
         try:
-            return self.__data__.__eq__(_dictify_kvp(other))
-        except ValueError:
+            return data == other
+        except RecursionError:
+            # too deep to be compared recursively
+            return _deep_equal(data, other)
+
+    def __eq_pairs(self, other):
+        if isinstance(other, (Mapping, str, bytes)) or not isinstance(other, Iterable):
+            # e.g., FrozenDixt objects and spans of lazy JSON documents
+            # can compare themselves
+            return NotImplemented
+        if isinstance(other, Sized) and len(other) < len(self.__data__):
+            # too few key-value pairs
             return False
+        try:
+            other = dict(other)
+        except (TypeError, ValueError):
+            return NotImplemented
+        return self == other
 
     def __getattr__(self, key):
-        if origkey := self.__get_orig_key(key):
-            if origkey in self.whats_hidden():
-                return self.__hidden__[origkey]
-            return self.__data__[origkey]
-        return super().__getattribute__(key)
+        origkey = self.__keymap__.get(self.__normaliser__(key), _MISSING)
+        if origkey is _MISSING:
+            return super().__getattribute__(key)
+        return self.__fetch(origkey)
 
     def __getitem__(self, key):
-        try:
-            key = self.__get_orig_key(key) or key
-            return self.__getattr__(key)
-        except AttributeError as e:
-            raise KeyError(key) from e
+        origkey = self.__keymap__.get(self.__normaliser__(key), _MISSING)
+        if origkey is _MISSING:
+            raise KeyError(key)
+        return self.__fetch(origkey)
 
     def __iter__(self):
         return iter(self.__data__)
@@ -151,43 +324,134 @@ class Dixt(MutableMapping):
         return self.__str__()
 
     def __setattr__(self, attr, value):
-        nkey = _normalise_key(attr)
-        origkey = self.__get_orig_key(attr) or attr
-        if nkey not in self.__keymap__:
-            self.__keymap__[nkey] = attr
+        self.__put(self.__normaliser__(attr), attr, value)
+
+    def __setitem__(self, key, value):
+        nkey = self.__normaliser__(key)
+        origkey = self.__keymap__.get(nkey, key)
+        if key != origkey:
+            # No two keys should have the same normalised key,
+            # or the new key will overwrite the other original key.
+            raise KeyError(f'Cannot add "{key}" overwriting "{origkey}"')
+        self.__put(nkey, key, value)
+
+    def __reduce_ex__(self, protocol):
+        """Pickle only the items, and the hidden items, metadata of keys,
+        and raw items of lazy objects if any. The keymap is rebuilt when
+        unpickled. With protocol 5, large ``bytes`` values are pickled as
+        ``PickleBuffer``, which can be transferred out-of-band.
+        """
+        data = self.__data__
+        buffered = ()
+        if protocol >= 5:
+            buffered = tuple([key for key, value in data.items()
+                              if type(value) is bytes and len(value) >= PICKLE_BUFFER_SIZE])
+            if buffered:
+                data = {**data, **{key: pickle.PickleBuffer(data[key]) for key in buffered}}
+
+        args = (self.__class__, data, self.__hidden__ or None, self.__keymeta__ or None,
+                self.__raw__, buffered)
+        while args[-1] is None or args[-1] == ():
+            # the defaults of _unpickle()
+            args = args[:-1]
+        return _unpickle, args
+
+    def __str__(self):
+        if not self.__raw__:
+            return str(self.__data__)
+        # spans of lazy JSON documents are shown decoded, without hydrating them
+        return str({key: _decoded(value) for key, value in self.__data__.items()})
+
+    def __put(self, nkey, attr, value):
+        """Set the value of the item of the normalised key `nkey`,
+        adding the item with `attr` as original key if not yet existing.
+        """
+        origkey = self.__keymap__.setdefault(nkey, attr)
 
         container = self.__data__
-        if not _contents(self.__hidden__, origkey)[1]:
+        if origkey in self.__hidden__:
             container = self.__hidden__
 
-        if isinstance(value, Dixt):
+        if self.__raw__ is not None:
+            container[origkey] = value
+            self.__mark_raw(origkey, value)
+        elif isinstance(value, Dixt):
             container[origkey] = value
-        elif isinstance(value, dict):
-            container[origkey] = Dixt(value)
         else:
-            container[origkey] = _hype(value)
+            container[origkey] = _hype(value, self.__class__, origkey)
 
-    def __setitem__(self, key, value):
-        if origkey := self.__get_orig_key(key):
-            if key != origkey:
-                # No two keys should have the same normalised key,
-                # or the new key will overwrite the other original key.
-                raise KeyError(f'Cannot add "{key}" overwriting "{origkey}"')
-        self.__setattr__(key, value)
+        if self.__parent__ is not None:
+            _changed(self, origkey, container[origkey])
 
-    def __str__(self):
-        return str(self.__data__)
+    def __put_all(self, spec):
+        """Set the items of the mapping `spec` as :meth:`__put` in bulk.
+        Keys of existing items are already known, only new keys are normalised.
+        """
+        normalise = self.__normaliser__
+        if self.__raw__ is not None:
+            for key, value in spec.items():
+                self.__put(normalise(key), key, value)
+            return
+
+        values, data = spec, self.__data__
+        if not spec.keys() <= data.keys():
+            values = self.__add_keys(spec)
+
+        values = _hype_values(values, self.__class__)
+        if self.__parent__ is not None:
+            for origkey, value in values.items():
+                _changed(self, origkey, value)
+        if self.__hidden__ and (hidden := self.__hidden__.keys() & values.keys()):
+            values = dict(values)
+            for origkey in hidden:
+                self.__hidden__[origkey] = values.pop(origkey)
+        data.update(values)
+
+    def __add_keys(self, spec):
+        """Normalise the new keys of the mapping `spec`, returning the mapping
+        with the original keys, since new keys normalised to existing keys
+        update the existing items.
+        """
+        normalise, data, renamed = self.__normaliser__, self.__data__, {}
+        for key in [key for key in spec.keys() if key not in data]:
+            origkey = self.__keymap__.setdefault(normalise(key), key)
+            if origkey != key:
+                renamed[key] = origkey
+        if renamed:
+            return {renamed.get(key, key): value for key, value in spec.items()}
+        return spec
+
+    def __merge_items(self, other, strategy, lists):
+        """Merge the items of the mapping `other` as :meth:`merge`,
+        returning the pairs of nested objects to be merged.
+        """
+        nested = []
+        for key, value in other.items():
+            nkey = self.__normaliser__(key)
+            origkey = self.__keymap__.get(nkey, _MISSING)
+            if origkey is _MISSING:
+                # only new subtrees are converted
+                self.__put(nkey, key, _incoming(value))
+                continue
+
+            current = self.__fetch(origkey)
+            if isinstance(current, Dixt) and isinstance(value, Mapping):
+                nested.append((current, value))
+            elif lists == 'append' and type(current) is list and isinstance(value, (list, tuple)):
+                current.extend(_hype(_incoming(item), self.__class__) for item in value)
+                if self.__parent__ is not None:
+                    _changed(self, origkey, current)
+            elif strategy == 'override':
+                self.__put(nkey, origkey, _incoming(value))
+            elif strategy != 'keep':
+                self.__put(nkey, origkey, strategy(origkey, current, value))
+        return nested
 
     def __or__(self, other):
         """Implement union operator for this object.
 
         :returns: ``Dixt`` object
         """
-        # This function will also be called for in-place operations.
-        # So no need to implement __ior__(). For example:
-        #   dx = Dixt()
-        #   dx |= <Mapping>
-        #   dx |= <iterable key-value pairs>
         if isinstance(other, Dixt):
             other = other.dict()
         elif not isinstance(other, (tuple, list, Mapping)):
@@ -195,6 +459,16 @@ class Dixt(MutableMapping):
 
         return Dixt(self.dict() | _dictify_kvp(other))
 
+    def __ior__(self, other):
+        """Implement in-place union operator, updating this object
+        as :meth:`update`, which keeps its hidden items and metadata.
+        """
+        if not isinstance(other, (tuple, list, Mapping)):
+            raise TypeError(f'Invalid type ({type(other)}) for operation |=')
+
+        self.update(other)
+        return self
+
     def __ror__(self, other) -> Dict:
         """This reverse union operator is called
         when the other object does not support union operator.
@@ -205,6 +479,26 @@ class Dixt(MutableMapping):
         # Call dict() to avoid maximum recursion error
         return _dictify_kvp(other) | dict(self)
 
+    def changes(self) -> List[Tuple]:
+        """Get the paths of the items changed since :meth:`track` or the last
+        :meth:`checkpoint`, in order of their first change. Each path is a ``tuple``
+        of the original keys from the tracked object. Changes inside of lists
+        are recorded as changes of the items holding the lists.
+
+        :raises ValueError: When the changes of this object are not tracked.
+        """
+        return list(self.__tracker().changes)
+
+    def checkpoint(self) -> List[Tuple]:
+        """Get the changes as :meth:`changes`, then start recording anew.
+
+        :raises ValueError: When the changes of this object are not tracked.
+        """
+        tracker = self.__tracker()
+        changes = list(tracker.changes)
+        tracker.changes.clear()
+        return changes
+
     def contains(self, *keys, assert_all=True) -> Union[bool, Tuple]:
         """Evaluate if all enumerated keys exist.
 
@@ -220,6 +514,38 @@ class Dixt(MutableMapping):
         result, _ = _contents(self.__data__, *keys)
         return all(result) if assert_all else result
 
+    def copy(self, deep=False):
+        """Create a copy of this object.
+
+        :param deep: If ``False``, the values, including nested ``Dixt`` objects,
+                     are shared with this object, as in ``copy.copy()``.
+                     Otherwise, the nested objects are also copied,
+                     as in ``copy.deepcopy()``.
+        """
+        return copy.deepcopy(self) if deep else self.__copy__()
+
+    def fingerprint(self) -> str:
+        """Get the digest of the content of this object, as a hex string, which is
+        the same for equal objects regardless of the order of the items, e.g., as
+        a cache key. Equal numbers, e.g., ``1`` and ``1.0``, have the same digests,
+        and hidden items are not included. Computed with BLAKE2 over the canonical
+        forms of the values, of ``DIGEST_SIZE`` bytes.
+
+        While tracked, see :meth:`track`, the digests of the items are cached,
+        so only the changed items and the items holding them are computed again.
+
+        :raises TypeError: When a value is not supported.
+        """
+        tracker = None if self.__parent__ is None else _tracker(self)
+        return _mapping_digest(self, tracker)[0].hex()
+
+    def freeze(self):
+        """Create an immutable, hashable snapshot of this object,
+        as :class:`~lxdx.frozen.FrozenDixt`. Hidden items are not included.
+        """
+        from .frozen import FrozenDixt
+        return FrozenDixt(self)
+
     def clear(self):
         """Remove all items in this object."""
         try:
@@ -236,6 +562,15 @@ class Dixt(MutableMapping):
         except KeyError:
             pass
 
+        if self.__raw__:
+            self.__raw__.clear()
+
+        # hidden items are removed as well
+        _setslot(self, '__hidden__', _EMPTY)
+        _setslot(self, '__keymeta__', _EMPTY)
+        if self.__parent__ is not None:
+            _changed(self, None)
+
     def dict(self) -> Dict:
         """Convert this object to ``dict``, with non-normalised keys."""
         def _dictify(this):
@@ -243,12 +578,28 @@ class Dixt(MutableMapping):
                 return {key: _dictify(value)
                         for key, value
                         in this.__data__.items()}
-            if isinstance(this, list):
-                return [_dictify(item) for item in this]
+            if isinstance(this, dict):
+                # raw items of lazy objects
+                return {key: _dictify(value)
+                        for key, value
+                        in this.items()}
+            if isinstance(this, (list, tuple)):
+                return this.__class__(_dictify(item) for item in this)
+            if isinstance(this, RawJSON):
+                return this.decode()
             return this
 
         return _dictify(self)
 
+    def get(self, key, default=None) -> Any:
+        """Get the value of the normalised or non-normalised `key`,
+        or `default` if not found.
+        """
+        origkey = self.__keymap__.get(self.__normaliser__(key), _MISSING)
+        if origkey is _MISSING:
+            return default
+        return self.__fetch(origkey)
+
     def getx(self, *attrs, default=None) -> Any:
         """Get one or more items specified in `attrs`.
         Replace nonexistent item(s) with value(s) in default.
@@ -306,57 +657,105 @@ class Dixt(MutableMapping):
 
         .. note::
             - Path is only evaluated for public *attributes*.
-            - Only one (1) item can be accessed from any ``list``. That is, no slicing.
+            - Paths are compiled once and cached, see :meth:`compile_path`.
+
+        Paths can also match multiple items, in which a ``list`` of the
+        matched items is returned instead:
+
+            * ``[*]`` or ``.*`` for all items of a ``list`` or a ``Dixt``
+            * ``[start:stop:step]`` for slices of a ``list``
+            * ``..key`` for the items of the key at any depth
+
+        Nonexistent keys and indices are skipped for these paths.
+        See :meth:`iter_from` for getting the items lazily.
         """
-        _validate_path(path)
-        _path = path.replace('[', '.[').strip('$.').split('.')
-        value = _get_by_path(self, _path)
-        if isinstance(value, Exception):
-            raise value from None
-        return value
+        return compile_path(path).get(self)
+
+    def iter_from(self, path: str, /) -> Iterator:
+        """Lazily yield the items matched by the path. Useful for large objects,
+        as no intermediate ``list`` is built. See :meth:`get_from` for the format.
+
+        :raises TypeError, ValueError: Invalid path.
+
+        Example:
+            .. code-block::
+
+                for order_id in dixt.iter_from('$.orders[*].id'):
+                    ...
+                sum(dixt.iter_from('$..price'))
+        """
+        return compile_path(path).iter(self)
 
-    def is_submap_of(self, other: Union[Mapping, List[Tuple]]) -> bool:
+    def is_submap_of(self, other: Union[Mapping, List[Tuple]], /, *, compare_lists=False) -> bool:
         """Evaluate if all of this object's keys and values are contained
         and equal to the `other`'s, recursively. This is the opposite of
         :func:`is_supermap_of`.
 
+        Only the items of this object are compared, directly on the data of both
+        objects, without converting them.
+
         :param other: Other ``dict``, ``Dixt``, or ``Mapping`` objects to compare to.
+        :param compare_lists: If ``True``, lists of the same length are compared
+                              item by item, so mappings in lists are also
+                              evaluated as submaps. Otherwise, lists must be equal.
         """
-        def _is_submap(this, reference):
-            for key, value in this.items():
-                if key not in reference:
-                    return False
-                if not hasattr(value, 'keys'):
-                    if reference[key] != value:
-                        return False
-                elif not _is_submap(this[key], reference[key]):
-                    return False
-            return True
-
-        if not isinstance(other, (tuple, list, Mapping)):
-            raise TypeError(f'Invalid type ({type(other)})')
-        if not isinstance(other, Dixt):
-            other = _dictify_kvp(other)
-        return _is_submap(self, other)
+        return _is_submap(self, _mapping(other), compare_lists)
 
-    def is_supermap_of(self, other: Union[Mapping, List[Tuple]]) -> bool:
+    def is_supermap_of(self, other: Union[Mapping, List[Tuple]], /, *, compare_lists=False) -> bool:
         """Evaluate if all the `other` object's keys and values are contained
         and equal to this object's, recursively. This is the opposite of
         :func:`is_submap_of`.
 
         :param other: Other ``dict``, ``Dixt``, or ``Mapping`` objects to compare to.
+        :param compare_lists: See :func:`is_submap_of`.
         """
-        return Dixt(other).is_submap_of(self)
+        return _is_submap(_mapping(other), self, compare_lists)
 
     def items(self) -> ItemsView:
         """Return a set-like object providing a view
         to this object's key-value pairs.
         """
-        return ItemsView(self.__data__)
+        # Lazy objects go through __getitem__() to hydrate the values.
+        return ItemsView(self.__data__ if self.__raw__ is None else self)
+
+    def json(self, *, indent=None, sort_keys=False, hidden=False, **kwargs) -> str:
+        """Convert this object to JSON string. The internal data is
+        encoded directly, without converting this object to ``dict`` first.
+
+        :param indent: Indentation of the JSON arrays and objects, as in ``json.dumps()``.
+        :param sort_keys: If ``True``, sort the items of the JSON objects by key.
+        :param hidden: If ``True``, include the hidden items.
+        :param kwargs: Additional arguments passed to ``json.JSONEncoder``,
+                       e.g., ``ensure_ascii``.
+        """
+        encoder = _json_encoder(hidden, self.__cache(indent, sort_keys, hidden, kwargs),
+                                indent=indent, sort_keys=sort_keys, **kwargs)
+        return encoder.encode(self)
+
+    def iterencode(self, *, indent=None, sort_keys=False, hidden=False, **kwargs) -> Iterator[str]:
+        """Yield the JSON string of this object in chunks, as they are encoded.
+        Same arguments as :meth:`json`.
+        """
+        encoder = _json_encoder(hidden, self.__cache(indent, sort_keys, hidden, kwargs),
+                                indent=indent, sort_keys=sort_keys, **kwargs)
+        return encoder.iterencode(self)
 
-    def json(self) -> str:
-        """Convert this object to JSON string."""
-        return json.dumps(self.dict())
+    def dump(self, fp, /, *, indent=None, sort_keys=False, hidden=False, **kwargs):
+        """Write the JSON string of this object to the file object `fp`,
+        in chunks, as they are encoded. Same arguments as :meth:`json`.
+
+        :param fp: File object opened in text mode, or in binary mode
+                   (e.g., from ``socket.makefile('wb')``) written as UTF-8.
+        """
+        binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(fp, 'mode', '')
+        chunks, size = [], 0
+        for chunk in self.iterencode(indent=indent, sort_keys=sort_keys, hidden=hidden, **kwargs):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= CHUNK_SIZE:
+                _write_chunks(fp, chunks, binary)
+                chunks, size = [], 0
+        _write_chunks(fp, chunks, binary)
 
     def keymeta(self, *keys, **flags):
         """Add metadata to one or more `keys`. If no `flags` are specified,
@@ -373,7 +772,7 @@ class Dixt(MutableMapping):
         .. note::
             Non-supported flags are silently bypassed.
         """
-        nkeys = [_normalise_key(k) for k in keys]
+        nkeys = [self.__normaliser__(k) for k in keys]
         if not_found := _contents(self.__keymap__, *nkeys)[1]:
             raise KeyError(f'Key(s not found: {not_found}')
 
@@ -382,16 +781,16 @@ class Dixt(MutableMapping):
             if not isinstance(flags[flag], self.__metas__[flag]):  # noqa
                 raise TypeError(f'{flag} must be {self.__metas__[flag]}')
 
-        retval = {}
-        for key in keys:
-            nkey = _normalise_key(key)
-            retval[nkey] = self.__keymeta__[nkey]
+        if not flags:
+            return {nkey: dict(self.__keymeta__.get(nkey, {}))
+                    for nkey in nkeys}
+
+        for nkey in nkeys:
             for flag in supported_flags:
                 add_meta_func = f'_Dixt__add_{flag}_meta'
                 getattr(self, add_meta_func)(nkey, flags[flag])
             self.__cleanup_meta(nkey)
-
-        return retval if not flags else None
+        return None
 
     def keys(self) -> KeysView:
         """Return a set-like object providing a view
@@ -399,6 +798,66 @@ class Dixt(MutableMapping):
         """
         return KeysView(self.__data__)
 
+    def mark_changed(self, key):
+        """Record the item of `key` as changed, if the changes of this object
+        are tracked. Needed only after changing ``list`` values in place,
+        e.g., with ``append()``, which is not tracked.
+
+        :raises KeyError: When the key is not found.
+        """
+        origkey = self.__keymap__.get(self.__normaliser__(key), _MISSING)
+        if origkey is _MISSING:
+            raise KeyError(key)
+        if self.__parent__ is not None:
+            _changed(self, origkey, self.__fetch(origkey))
+
+    def merge(self, other, /, strategy='override', lists='replace'):
+        """Merge `other` into this object recursively, in place. Nested
+        ``Dixt`` objects of the same keys are merged as well, instead of replaced,
+        so the cost depends on the size of `other`, not of this object.
+
+        :param other: ``Mapping`` object (e.g., ``dict``, ``Dixt``)
+                      or iterable key-value pairs.
+        :param strategy: For items in both objects which are not both mappings,
+                         ``'override'`` to set the value of `other`, ``'keep'`` to keep
+                         the existing value, or a function ``(key, current, incoming)``
+                         returning the value to set.
+        :param lists: ``'replace'`` to handle ``list`` values as in `strategy`,
+                      or ``'append'`` to extend the existing lists.
+
+        :raises ValueError: When the strategy is not supported.
+        """
+        if strategy not in ('override', 'keep') and not callable(strategy):
+            raise ValueError(f'Invalid merge strategy: {strategy}')
+        if lists not in ('replace', 'append'):
+            raise ValueError(f'Invalid merge strategy of lists: {lists}')
+        if not hasattr(other, 'keys'):
+            other = _dictify_kvp(other)
+
+        # pairs of objects to merge, not recursive for deep objects
+        pending = [(self, other)]
+        while pending:
+            dx, other = pending.pop()
+            if isinstance(other, Dixt) and other.__raw__ is None:
+                other = other.__data__
+            pending.extend(dx.__merge_items(other, strategy, lists))
+
+    def apply_patch(self, operations: List[Dict], /):
+        """Apply the ``add``, ``remove``, and ``replace`` operations of JSON Patch
+        (RFC 6902), e.g., from :meth:`diff`, to this object in place. Operations
+        are applied one by one, so if one fails, the previous ones remain applied.
+
+        :raises ValueError: When an operation or a path is invalid.
+        :raises KeyError: When a key of the path is not found.
+        :raises IndexError: When an index of the path is out of range.
+        """
+        def touch(steps):
+            # changes of lists are not tracked by themselves
+            _touch_path(self, steps, singular=True)
+
+        patch.apply_patch(self, operations, convert=lambda value: _hype(value, self.__class__),
+                          applied=None if self.__parent__ is None else touch)
+
     def pop(self, key, default=..., /) -> Any:
         """Get the value associated with the `key`, then remove the item.
 
@@ -438,9 +897,19 @@ class Dixt(MutableMapping):
         return Dixt({value: key for key, value in self.__data__.items()})
 
     def set_by_path(self, path: str, value) -> None:
-        _validate_path(path)
-        _path = path.replace('[', '.[').strip('$.').split('.')
-        _set_by_path(self, _path, value)
+        """Set the value of the existing item at the specified path.
+        See :meth:`get_from` for the format of the `path`.
+
+        :raises TypeError, ValueError: Invalid path.
+        :raises KeyError: Key is not found.
+        :raises IndexError: Invalid list index.
+        """
+        compiled = compile_path(path)
+        try:
+            compiled.set(self, value)
+        finally:
+            if self.__parent__ is not None:
+                _touch_path(self, compiled.steps, compiled.singular)
 
     def setdefault(self, key, default=None) -> Any:
         """Get value associated with `key`. If `key` exists, return ``self[key]``;
@@ -450,22 +919,54 @@ class Dixt(MutableMapping):
         """
         return super().setdefault(key, default)
 
+    def to_bytes(self) -> bytes:
+        """Convert this object to compact bytes, which, unlike JSON,
+        also keep the hidden items and the metadata of the keys, and
+        non-``str`` keys, ``tuple`` and ``bytes`` values. See :mod:`lxdx.binary`.
+
+        The bytes are smaller than JSON, but slower to encode and decode,
+        as the format is implemented in pure Python.
+
+        :raises TypeError: When a value is not supported.
+        """
+        return binary.dumps(self)
+
+    def track(self, enabled=True):
+        """Start tracking the changes of this object and its nested objects,
+        listed by :meth:`changes`, or stop if `enabled` is ``False``.
+
+        While tracked, the JSON encodings of the items are cached for :meth:`json`,
+        :meth:`iterencode`, and :meth:`dump` without arguments, so only the changed
+        items and the items holding them are encoded again, and likewise for
+        :meth:`fingerprint`. Changes of ``list`` values in place, e.g., with ``append()``,
+        are neither listed nor encoded until recorded with :meth:`mark_changed`.
+        """
+        if not enabled:
+            _link(self, None, self.__key__)
+        elif type(self.__parent__) is not _Tracker:
+            _link(self, _Tracker(), self.__key__)
+
     def update(self, other=(), /, **kwargs):
         """Update this object from another ``Mapping`` objects (e.g., ``dict``, ``Dixt``),
         from an iterable key-value pairs, or through keyword arguments.
+
+        As with setting attributes, an item of which the key is normalised to an
+        existing key updates the existing item, keeping its original key.
         """
         if not hasattr(other, 'keys'):
             other = _dictify_kvp(other)
 
         for container in (other, kwargs):
-            for k, v in container.items():
-                self.__setattr__(k, v)
+            if isinstance(container, Dixt) and container.__raw__ is None:
+                container = container.__data__
+            if container:
+                self.__put_all(container)
 
     def values(self) -> ValuesView:
         """Return a set-like object providing a view
         to this object's values.
         """
-        return ValuesView(self.__data__)
+        return ValuesView(self.__data__ if self.__raw__ is None else self)
 
     def whats_hidden(self) -> tuple:
         """Get all keys that have the ``hidden`` metadata.
@@ -475,148 +976,859 @@ class Dixt(MutableMapping):
         return tuple(self.__hidden__.keys())
 
     @staticmethod
-    def from_json(json_str, /):
-        """Convert a JSON string to a ``Dixt`` object."""
-        return Dixt(json.loads(json_str))  # let json handle errors
+    def diff(source: Mapping, target: Mapping, /) -> List[Dict]:
+        """Create the operations of JSON Patch (RFC 6902) changing `source`
+        into `target`, e.g., to send only the changes of an object.
+        Apply the operations with :meth:`apply_patch`.
+
+        Only ``add``, ``remove``, and ``replace`` operations are created.
+        Objects which are the same in both are skipped, and lists are compared
+        by their items, so that inserted or removed items are not replaced one by one.
+
+        :param source: ``Dixt`` or any ``Mapping`` object. Hidden items are excluded.
+        :param target: ``Dixt`` or any ``Mapping`` object. Hidden items are excluded.
+
+        :raises TypeError: When a key of the changed items is not a string.
+
+        Example:
+            .. code-block::
+
+                ops = Dixt.diff(dx, changed)
+                dx.apply_patch(ops)
+                assert dx == changed
+        """
+        return patch.diff(source, target)
+
+    @staticmethod
+    def compile_path(path: str, /) -> CompiledPath:
+        """Compile the `path` into a reusable accessor for any object,
+        which does not parse the path again. See :meth:`get_from` for the format.
+
+        :raises TypeError, ValueError: Invalid path.
+
+        Example:
+            .. code-block::
+
+                name = Dixt.compile_path('$.group.items[1].name')
+                for dx in objects:
+                    print(name.get(dx, default=None))
+                    name.set(dx, 'new name')
+        """
+        return compile_path(path)
+
+    @classmethod
+    def lazy(cls, data=None, /, **kwargs):
+        """Create a lazy object. Same as calling the constructor, but
+        nested ``dict`` objects (including those inside ``list`` or ``tuple``)
+        are kept as they are until first accessed through attributes,
+        items, or paths, i.e., :meth:`get_from`. Then they are converted
+        to lazy ``Dixt`` objects, and stored in place of the raw values.
+
+        Useful for large data where only a few items are needed.
+        """
+        dx = cls.__new__(cls)
+        if not isinstance(data, dict):
+            data = dict(data or {})
+        dx.__setup((data, kwargs), lazy=True)
+        return dx
+
+    @classmethod
+    def from_json(cls, source, /, *, lazy=False, **kwargs):
+        """Convert a JSON document to a ``Dixt`` object (or the subclass).
+
+        The objects are built while parsing, i.e., each JSON object
+        is converted, and its keys normalised, only once.
+
+        :param source: The JSON document as ``str``, ``bytes``,
+                       or a file object opened in text or binary mode.
+        :param lazy: If ``True``, decode only the top level of the document, i.e.,
+                     nested JSON objects and arrays are kept as spans of the text
+                     until first accessed, as the items of :meth:`lazy` objects.
+                     Arrays are decoded entirely when accessed.
+                     Unchanged spans are written as they are by :meth:`json`,
+                     :meth:`iterencode`, and :meth:`dump`. The whole document
+                     is still validated when loaded.
+        :param kwargs: Additional arguments passed to ``json.loads()``,
+                       e.g., ``parse_float``. Not supported if `lazy`.
+
+        :raises ValueError: When `kwargs` are given with `lazy`.
+        """
+        if hasattr(source, 'read'):
+            source = source.read()
+
+        if lazy:
+            if kwargs:
+                raise ValueError(f'Unsupported arguments for lazy documents: {list(kwargs)}')
+            if (pairs := scan_document(source)) is not None:
+                return cls.lazy(dict(pairs))
+
+        # let json handle errors
+        result = json.loads(source, object_pairs_hook=_json_object_builder(cls), **kwargs)
+        return _json_record(cls, result)
+
+    @classmethod
+    def from_bytes(cls, data, /):
+        """Convert the bytes from :meth:`to_bytes` to a ``Dixt`` object (or the subclass),
+        including the hidden items and the metadata of the keys.
+
+        :raises ValueError: When the data is invalid or truncated.
+        """
+        return binary.loads(data, cls)
+
+    @classmethod
+    def iter_bytes(cls, fp, /) -> Iterator:
+        """Yield the ``Dixt`` objects (or the subclass) written to the binary
+        file object `fp` by :class:`lxdx.binary.Writer`, one at a time.
+
+        :raises ValueError: When the data is invalid or truncated.
+
+        Example:
+            .. code-block::
+
+                with open('cache.bin', 'wb') as file:
+                    writer = lxdx.binary.Writer(file)
+                    for dx in objects:
+                        writer.write(dx)
+
+                with open('cache.bin', 'rb') as file:
+                    objects = list(Dixt.iter_bytes(file))
+        """
+        return iter(binary.Reader(fp, cls))
+
+    @classmethod
+    def from_file(cls, path, /, *, mmap=True, lazy=False, **kwargs):
+        """Load the JSON file as a ``Dixt`` object (or the subclass).
 
-    def __get_orig_key(self, key):
-        return self.__keymap__.get(_normalise_key(key))
+        :param path: Path of the JSON file, encoded in UTF-8, -16, or -32.
+        :param mmap: If ``True``, memory-map the file, and decode the text directly
+                     from the mapped pages, instead of reading the file into memory
+                     first. The pages are in the OS page cache, shared by all
+                     processes loading the same file.
+        :param lazy: See :meth:`from_json`.
+        :param kwargs: See :meth:`from_json`.
+
+        :raises OSError: When the file cannot be opened.
+        """
+        return cls.from_json(read_text(path, use_mmap=mmap), lazy=lazy, **kwargs)
+
+    @classmethod
+    def iter_json(cls, fileobj, /, format='ndjson', batch_size=None,
+                  chunk_size=CHUNK_SIZE, **kwargs) -> Iterator:
+        """Yield the records of a JSON Lines file, or the items of a JSON array,
+        as ``Dixt`` objects (or the subclass). The file is read in chunks, so only
+        the records being converted are in memory, regardless of the file size.
+
+        :param fileobj: File object opened in text or binary (UTF-8) mode.
+        :param format: ``'ndjson'`` for JSON Lines (blank lines are skipped),
+                       or ``'array'`` for a single JSON array.
+        :param batch_size: If given, yield lists of up to this number of records.
+        :param chunk_size: Number of characters (or bytes) read at a time.
+        :param kwargs: Additional arguments passed to ``json.JSONDecoder``,
+                       e.g., ``parse_float``.
+
+        :raises ValueError: When the format, chunk size, or batch size is not supported.
+        :raises json.JSONDecodeError: When a record is not valid JSON.
+
+        Example:
+            .. code-block::
+
+                with open('events.ndjson', 'rb') as file:
+                    for batch in Dixt.iter_json(file, batch_size=1000):
+                        store(batch)
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f'Invalid batch size: {batch_size}')
+
+        decoder = json.JSONDecoder(object_pairs_hook=_json_object_builder(cls), **kwargs)
+        records = iter_records(fileobj, decoder, format=format, chunk_size=chunk_size)
+        records = (_json_record(cls, record) for record in records)
+        if batch_size is None:
+            return records
+        return iter(lambda: list(islice(records, batch_size)), [])
+
+    def __setup(self, specs, lazy=False):
+        """Build the object from the `specs` mappings in a single pass.
+        Each key is normalised, and each nested ``dict`` is built, only once.
+        """
+        keymap, data = {}, {}
+        raw = set() if lazy else None
+        for spec in specs:
+            for key, value in spec.items():
+                keymap[self.__normaliser__(key)] = key
+                if lazy:
+                    data[key] = value
+                    if isinstance(value, _RAW_TYPES):
+                        raw.add(key)
+                else:
+                    data[key] = _hype(value, self.__class__, key)
+
+        _setslot(self, '__data__', data)
+        _setslot(self, '__keymap__', keymap)
+        _setslot(self, '__keymeta__', _EMPTY)
+        _setslot(self, '__hidden__', _EMPTY)
+        _setslot(self, '__raw__', raw)
+
+    def __cache(self, indent, sort_keys, hidden, kwargs):
+        """Get the tracker of which the cached encodings are used,
+        only for the default encoding options.
+        """
+        if self.__parent__ is None or indent is not None or sort_keys or hidden or kwargs:
+            return None
+        return _tracker(self)
+
+    def __tracker(self):
+        if (tracker := _tracker(self)) is None:
+            raise ValueError('Changes of the object are not tracked')
+        return tracker
+
+    def __own(self, table):
+        """Get the side-table (__keymeta__ or __hidden__) for writing,
+        allocating it on first use.
+        """
+        container = getattr(self, table)
+        if container is _EMPTY:
+            container = {}
+            _setslot(self, table, container)
+        return container
+
+    def __fetch(self, origkey):
+        """Get the value of the original key, hydrating it if still raw."""
+        # Hidden items are checked directly in their (usually empty)
+        # container, so reads do not depend on the number of hidden items.
+        container = self.__data__
+        if origkey in self.__hidden__:
+            container = self.__hidden__
+
+        if self.__raw__ and origkey in self.__raw__:
+            container[origkey] = _hydrate(container[origkey], self.__class__)
+            self.__raw__.discard(origkey)
+            if self.__parent__ is not None:
+                _link(container[origkey], self, origkey)
+        return container[origkey]
+
+    def __mark_raw(self, origkey, value):
+        if isinstance(value, _RAW_TYPES):
+            self.__raw__.add(origkey)
+        else:
+            self.__raw__.discard(origkey)
 
     def __add_hidden_meta(self, key, value):
-        self.__keymeta__[key]['hidden'] = value
-        origkey = self.__get_orig_key(key)
-        if value:
-            self.__hidden__[origkey] = self.__data__[origkey]
-            del self.__data__[origkey]
+        self.__own('__keymeta__').setdefault(key, {})['hidden'] = value
+        origkey = self.__keymap__[key]
+        if value and origkey in self.__data__:
+            self.__own('__hidden__')[origkey] = self.__data__.pop(origkey)
+        elif not value and origkey in self.__hidden__:
+            self.__data__[origkey] = self.__hidden__.pop(origkey)
         else:
-            self.__data__[origkey] = self.__hidden__[origkey]
-            del self.__hidden__[origkey]
+            return
+        if self.__parent__ is not None:
+            _changed(self, origkey)
 
     def __cleanup_meta(self, key):
         """Remove empty, None, or any 'reset' values of flags
         note: key should be normalised beforehand
         """
+        if (meta := self.__keymeta__.get(key)) is None:
+            return
+
         for flag, value in self.__meta_resets__.items():
-            if self.__keymeta__[key].get(flag, 'xxx') == value:
-                del self.__keymeta__[key][flag]
+            if meta.get(flag, _MISSING) == value:
+                del meta[flag]
 
         # remove key completely if there's no more flags
-        if not self.__keymeta__[key].keys():
+        if not meta:
             del self.__keymeta__[key]
 
 
-def _hype(spec):
-    if isinstance(spec, Dixt):
-        return spec
+def _hype(spec, cls=None, key=None):
+    """Convert ``dict`` objects to ``Dixt`` (or the subclass `cls`),
+    including those inside of ``list``/``tuple``, recursively.
+    """
+    if isinstance(spec, dict):
+        dx = (cls or Dixt)(spec)
+        _setslot(dx, '__key__', key)
+        return dx
 
     if isinstance(spec, (list, tuple)):
-        return spec.__class__(
-            Dixt(item)
-            if isinstance(item, dict) else _hype(item)
-            for item in spec)
-
-    if issubclass(type(spec), dict):
-        data = {}
-        for key, value in spec.items():
-            if issubclass(type(value), dict):
-                data[key] = Dixt(value)
-                data[key].__dict__['__key__'] = key
-            elif isinstance(value, (list, tuple)):
-                data[key] = _hype(value)
-            else:
-                data[key] = value
-        return data
+        return spec.__class__(_hype(item, cls) for item in spec)
 
     return spec
 
 
-def _normalise_key(key: Hashable) -> Hashable:
-    """Internal dict handles the incoming keys,
-    so the item's hashability is not checked here.
+class _Tracker:
+    """Changes of a tracked ``Dixt`` object, linked as the parent of the object,
+    and the cached JSON encodings and digests of the items of the object and its
+    nested objects.
     """
-    if isinstance(key, str):
-        return key.strip()\
-                  .replace(' ', '_')\
-                  .replace('-', '_')\
-                  .lower()
-    return key
 
+    __slots__ = ('changes', 'cached')
 
-def _dictify_kvp(sequence):
-    try:
-        return dict(sequence or {})
-    except (TypeError, ValueError) as e:
-        msg = f'Sequence {sequence} is not ' \
-              f'iterable key-value pairs'
-        raise ValueError(msg) from e
+    def __init__(self):
+        # paths of the changed items, as an ordered set
+        self.changes = {}
 
+        # id of object: [weak reference to the object, {key: JSON of the item},
+        # {key: canonical form of the item}, digest of the object or None], items are
+        # removed when changed, and entries when the objects are deleted
+        self.cached = {}
 
-def _contents(container, *keys):
-    result, not_found = [], []
-    for key in keys:
-        if key in container:
-            result.append(True)
+    def entry(self, obj):
+        """Get the cache entry of `obj`, added if not yet existing."""
+        key, cached = id(obj), self.cached
+        entry = cached.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry
+
+        def evict(ref):
+            if (entry := cached.get(key)) is not None and entry[0] is ref:
+                del cached[key]
+
+        entry = cached[key] = [weakref.ref(obj, evict), {}, {}, None]
+        return entry
+
+
+def _tracker(dx):
+    """Get the tracker of `dx` or its parents, ``None`` if not tracked."""
+    node = dx.__parent__
+    while isinstance(node, Dixt):
+        node = node.__parent__
+    return node
+
+
+def _link(value, parent, key, tracker=None):
+    """Link the ``Dixt`` objects of `value`, including the nested ones, to their
+    parents, starting with `parent`. Objects in lists are linked to the parent of
+    the list, with the key of the list. Cached encodings in `tracker` are removed.
+    """
+    pending, linked = [(value, parent, key)], set()
+    while pending:
+        value, parent, key = pending.pop()
+        if isinstance(value, Dixt):
+            if id(value) in linked:
+                continue
+            linked.add(id(value))
+            _setslot(value, '__parent__', parent)
+            _setslot(value, '__key__', key)
+            if tracker is not None:
+                tracker.cached.pop(id(value), None)
+            # unlinked as well when tracking is stopped
+            owner = None if parent is None else value
+            for items in (value.__data__, value.__hidden__):
+                pending.extend((item, owner, itemkey) for itemkey, item in items.items()
+                               if type(item) not in _SCALAR_TYPES)
+        elif isinstance(value, (list, tuple)):
+            pending.extend((item, parent, key) for item in value if type(item) not in _SCALAR_TYPES)
+
+
+def _changed(dx, key, value=_MISSING):
+    """Record the change of the item of the original `key` of the tracked `dx`,
+    or of the whole object if ``None``, linking the new `value` if specified.
+    The cached encodings and digests of the items up to the root object are removed.
+    """
+    path, items, node = [] if key is None else [key], [(dx, key)], dx
+    while type(parent := node.__parent__) is not _Tracker:
+        if parent is None:
+            # no longer in the tracked object
+            return
+        if _holds(parent, node):
+            path.append(node.__key__)
         else:
-            result.append(False)
-            not_found.append(key)
-    return tuple(result), not_found
+            # in a list, recorded as the change of the list
+            path = [node.__key__]
+        items.append((parent, node.__key__))
+        node = parent
+
+    for node, itemkey in items:
+        if (entry := parent.cached.get(id(node))) is not None:
+            entry[3] = None
+            for items in (entry[1], entry[2]):
+                if itemkey is None:
+                    items.clear()
+                else:
+                    items.pop(itemkey, None)
+    if value is not _MISSING:
+        _link(value, dx, key, parent)
+    parent.changes[tuple(reversed(path))] = None
+
+
+def _holds(parent, node):
+    key = node.__key__
+    return parent.__data__.get(key) is node or parent.__hidden__.get(key) is node
+
+
+def _touch_path(dx, steps, singular):
+    """Record the changes of the tracked `dx` set at the path `steps`, of
+    which the items of lists are not tracked by themselves. Items matched by
+    non-singular paths may be anywhere, so all cached encodings are removed.
+    """
+    node, key = dx, None
+    for step in steps[:-1]:
+        if type(step) is not str:
+            break
+        child = node.get(step)
+        if not isinstance(child, Dixt):
+            key = node.__keymap__.get(node.__normaliser__(step), step)
+            break
+        node = child
+    else:
+        if singular:
+            # set as the item of an object, already recorded
+            return
+
+    if not singular and (tracker := _tracker(dx)) is not None:
+        tracker.cached.clear()
+    _changed(node, key)
+
+
+def _number_bytes(value):
+    # equal numbers, e.g., True, 1, and 1.0, have the same canonical form
+    if type(value) is complex:
+        if value.imag:
+            return b'c' + repr(value).encode()
+        value = value.real
+    if type(value) is float and not value.is_integer():
+        return b'f' + repr(value).encode()
+    return b'i' + str(int(value)).encode()
+
+
+# canonical forms of the scalar values for their digests
+_CANONICAL = {
+    str: lambda value: b's' + value.encode('utf-8', 'surrogatepass'),
+    bytes: lambda value: b'b' + value,
+    int: _number_bytes,
+    bool: _number_bytes,
+    float: _number_bytes,
+    complex: _number_bytes,
+    type(None): lambda value: b'n',
+}
+
+
+def _blake2b(data):
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+def _mapping_digest(obj, tracker=None):
+    """Get the digest of the mapping `obj`, and whether it is up to date as long as
+    the changes are tracked. The canonical forms of the items are sorted, so the
+    order of the items does not matter. With the `tracker` of `obj`, the forms
+    of the items not changed since computed are reused.
+    """
+    if tracker is None:
+        items = obj.__data__ if isinstance(obj, Dixt) else obj
+        return _blake2b(b''.join(sorted([_item_bytes(key, value, obj, None)[0]
+                                         for key, value in items.items()]))), True
+
+    entry = tracker.entry(obj)
+    if entry[3] is not None:
+        return entry[3], True
+
+    cached, forms, tracked = entry[2], [], True
+    for key, value in obj.__data__.items():
+        if (form := cached.get(key)) is None:
+            form, cacheable = _item_bytes(key, value, obj, tracker)
+            if cacheable:
+                cached[key] = form
+            else:
+                # objects not linked, e.g., added to lists in place
+                tracked = False
+        forms.append(form)
 
+    digest = _blake2b(b''.join(sorted(forms)))
+    if tracked:
+        entry[3] = digest
+    return digest, tracked
 
-def _validate_path(path):
-    if not isinstance(path, str):
-        raise TypeError(f'Invalid path: {path}')
-    if not path.startswith('$.'):
-        raise ValueError(f'Invalid path: {path}')
-    if path.strip().lstrip('$.') == '':
-        raise ValueError(f'Invalid path: {path}')
-    if re.match(r'^\$(\.\w+(\[\d+])*)+$', path) is None:
-        raise ValueError(f'Invalid path: {path}')
 
+def _item_bytes(key, value, parent, tracker):
+    """Get the canonical form of the item, prefixed with the sizes of the forms of
+    the key and the item, and whether it is up to date as long as the changes are tracked.
+    """
+    # scalars, the most common, without going through _canonical()
+    if (canonical := _CANONICAL.get(type(key))) is not None:
+        form = canonical(key)
+    else:
+        form = _canonical(key, parent, None, None)[0]
+    if (canonical := _CANONICAL.get(type(value))) is not None:
+        value, tracked = canonical(value), True
+    else:
+        value, tracked = _canonical(value, parent, key, tracker)
+    return b'%d:%d:%b%b' % (len(form) + len(value), len(form), form, value), tracked
 
-def _get_by_path(obj: Dixt, attrs: list):
-    if not attrs:
-        # We have successfully got obj from previous call
-        # so obj must be the correct value.
-        return obj
 
-    attr = attrs.pop(0)
+def _canonical(value, parent, key, tracker):
+    """Get the canonical form of `value`, of the item `key` of `parent`, and whether
+    it is up to date as long as the changes are tracked.
 
-    if isinstance(obj, (list, tuple)):
-        try:
-            _obj = eval('obj' + attr)
-        except IndexError as e:
-            return e
-        return _get_by_path(_obj, attrs)
+    :raises TypeError: When the value is not supported.
+    """
+    if (canonical := _CANONICAL.get(type(value))) is not None:
+        return canonical(value), True
+    if isinstance(value, (list, tuple)):
+        forms, tracked = [], True
+        for item in value:
+            item, cacheable = _canonical(item, parent, key, tracker)
+            forms.append(b'%d:%b' % (len(item), item))
+            tracked = tracked and cacheable
+        return (b'l' if isinstance(value, list) else b't') + _blake2b(b''.join(forms)), tracked
+    if isinstance(value, Dixt) and tracker is not None:
+        if value.__parent__ is not parent or value.__key__ != key:
+            # linked elsewhere, e.g., also held by another item
+            return b'm' + _mapping_digest(value)[0], False
+        digest, tracked = _mapping_digest(value, tracker)
+        return b'm' + digest, tracked
+    if isinstance(value, (dict, Dixt, Mapping)):
+        return b'm' + _mapping_digest(value)[0], True
+    if isinstance(value, RawJSON):
+        return _canonical(value.decode(), parent, key, None)[0], True
+    raise TypeError(f'Unsupported type: {type(value).__name__}')
+
+
+def _hype_values(values, cls):
+    """Convert the values of the mapping as :func:`_hype`, returning the same
+    mapping if all the values are of immutable types, or already ``Dixt``.
+    """
+    if set(map(type, values.values())) <= _IMMUTABLE_TYPES:
+        return values
+    return {key: value if type(value) in _IMMUTABLE_TYPES or isinstance(value, Dixt)
+            else _hype(value, cls, key)
+            for key, value in values.items()}
 
-    if isinstance(obj, Dixt):
-        if obj.getx(attr, default=...) is Ellipsis:
-            return KeyError(attr)
-        return _get_by_path(getattr(obj, attr), attrs)
 
-    return KeyError(attr)
+def _mapping(other):
+    """Validate the `other` object to compare to, converting key-value pairs."""
+    if not isinstance(other, (tuple, list, Mapping)):
+        raise TypeError(f'Invalid type ({type(other)})')
+    return other if isinstance(other, Mapping) else _dictify_kvp(other)
 
 
-def _set_by_path(obj: Dixt, attrs: list, value):
-    attr = attrs.pop(0)
+def _raw_mapping(value):
+    """Get the underlying mapping of `value` to compare, or ``None``."""
+    if type(value) is dict:
+        return value
+    if isinstance(value, Dixt):
+        return value.__data__
+    return value if isinstance(value, Mapping) else None
 
-    if isinstance(obj, (list, tuple)):
-        try:
-            _obj = eval('obj' + attr)
-        except IndexError as e:
-            raise e
 
-        if not attrs:
-            obj[int(attr.strip('[]'))] = value
+def _is_submap(this, reference, compare_lists):
+    """Evaluate :meth:`Dixt.is_submap_of`, with an explicit stack
+    instead of recursion, for very deep objects.
+    """
+    pending = [(this, reference)]
+    while pending:
+        this, reference = pending.pop()
+        if this is reference:
+            continue
+        if type(this) is RawJSON or type(reference) is RawJSON:
+            # spans of lazy JSON documents
+            this, reference = _decoded(this), _decoded(reference)
+
+        if (mapping := _raw_mapping(this)) is not None:
+            matched = _push_items(mapping, _raw_mapping(reference), pending)
+        elif compare_lists and isinstance(this, (list, tuple)):
+            matched = isinstance(reference, (list, tuple)) and len(this) == len(reference)
+            pending.extend(zip(this, reference) if matched else ())
         else:
-            _set_by_path(_obj, attrs, value)
+            matched = this == reference
+        if not matched:
+            return False
+    return True
 
-    elif isinstance(obj, Dixt):
-        if obj.getx(attr, default=...) is Ellipsis:
-            raise KeyError(attr)
-        if not attrs:
-            setattr(obj, attr, value)
+
+def _push_items(mapping, reference, pending):
+    """Compare the values of immutable types of `mapping` to those of `reference`,
+    adding the other values to `pending`. ``False`` if there are differences.
+    """
+    if reference is None or len(mapping) > len(reference):
+        return False
+    for key, value in mapping.items():
+        found = reference.get(key, _MISSING)
+        if found is _MISSING:
+            return False
+        if type(value) in _SCALAR_TYPES:
+            if value != found:
+                return False
+        elif value is not found:
+            pending.append((value, found))
+    return True
+
+
+def _deep_equal(this, other):
+    """Evaluate :meth:`Dixt.__eq__` on the data of the objects, with an explicit
+    stack instead of recursion, for very deep objects. Containers of only immutable
+    values are compared directly, as ``dict`` or ``list``.
+    """
+    pending = [(this, other)]
+    while pending:
+        this, other = pending.pop()
+        if this is other:
+            continue
+        if type(this) is RawJSON or type(other) is RawJSON:
+            # spans of lazy JSON documents
+            this, other = _decoded(this), _decoded(other)
+
+        if type(this) in (list, tuple) and type(other) is type(this):
+            if len(this) != len(other):
+                return False
+            if set(map(type, this)) <= _SCALAR_TYPES:
+                matched = this == other
+            else:
+                pending.extend(zip(this, other))
+                continue
+        elif (mapping := _raw_mapping(this)) is not None and (reference := _raw_mapping(other)) is not None:
+            matched = _push_nested(mapping, reference, pending)
         else:
-            _set_by_path(getattr(obj, attr), attrs, value)
+            matched = this == other
+        if not matched:
+            return False
+    return True
 
-    else:
-        raise KeyError(attr)
+
+def _push_nested(mapping, reference, pending):
+    """Compare the keys, then the values of immutable types, of `mapping` to those
+    of `reference`, adding the other values to `pending`. ``False`` if there are differences.
+    """
+    if len(mapping) != len(reference) or mapping.keys() != reference.keys():
+        return False
+    if set(map(type, mapping.values())) <= _SCALAR_TYPES:
+        return mapping == reference
+    for key, value in mapping.items():
+        found = reference[key]
+        if type(value) in _SCALAR_TYPES:
+            if value != found and value is not found:
+                return False
+        elif value is not found:
+            pending.append((value, found))
+    return True
+
+
+def _incoming(value):
+    """Copy the ``Dixt`` object `value` merged into another object, which would
+    otherwise be changed by later merges into the other object.
+    """
+    return copy.deepcopy(value) if isinstance(value, Dixt) else value
+
+
+def _json_object_builder(cls):
+    """Create the ``object_pairs_hook`` building ``cls`` objects directly
+    from the key-value pairs of the JSON objects. The values are already
+    converted, since inner objects are completed first by the parser.
+    """
+    normalise = cls.__normaliser__
+
+    def build(pairs):
+        dx = cls.__new__(cls)
+        data, keymap = dx.__data__, dx.__keymap__
+        for key, value in pairs:
+            data[key] = value
+            keymap[normalise(key)] = key
+            if isinstance(value, Dixt):
+                _setslot(value, '__key__', key)
+        return dx
+    return build
+
+
+def _deepcopy(value, memo):
+    """Copy the value for :meth:`Dixt.__deepcopy__`, handling the usual
+    types of the values directly, instead of through ``copy.deepcopy()``.
+    """
+    cls = type(value)
+    if cls in _IMMUTABLE_TYPES:
+        return value
+    if (copied := memo.get(id(value), _MISSING)) is not _MISSING:
+        return copied
+
+    if isinstance(value, Dixt):
+        return value.__deepcopy__(memo)
+    if cls is list:
+        copied = memo[id(value)] = []
+        copied += [_deepcopy(item, memo) for item in value]
+        return copied
+    if cls is tuple:
+        copied = memo[id(value)] = tuple([_deepcopy(item, memo) for item in value])
+        return copied
+    if cls is dict:
+        # raw items of lazy objects
+        copied = memo[id(value)] = {}
+        copied.update((key, _deepcopy(item, memo)) for key, item in value.items())
+        return copied
+    return copy.deepcopy(value, memo)
+
+
+def _unpickle(cls, data, hidden=None, keymeta=None, raw=None, buffered=()):
+    """Create the object from the pickled items of :meth:`Dixt.__reduce_ex__`."""
+    for key in buffered:
+        # buffers may be given out-of-band as any bytes-like object
+        data[key] = bytes(data[key])
+
+    normalise = cls.__normaliser__
+    keymap = {normalise(key): key for key in data}
+    for key, value in data.items():
+        if isinstance(value, Dixt):
+            _setslot(value, '__key__', key)
+
+    dx = cls.__new__(cls)
+    _setslot(dx, '__data__', data)
+    _setslot(dx, '__raw__', raw)
+    if hidden:
+        keymap.update((normalise(key), key) for key in hidden)
+        _setslot(dx, '__hidden__', hidden)
+    if keymeta:
+        _setslot(dx, '__keymeta__', keymeta)
+    _setslot(dx, '__keymap__', keymap)
+    return dx
+
+
+# JSON of the values of tracked objects, without going through the encoder
+_SCALAR_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+}
+
+
+def _json_encoder(hidden, tracker=None, **kwargs):
+    return _Encoder(hidden=hidden, tracker=tracker, **kwargs)
+
+
+class _Encoder(json.JSONEncoder):
+    """JSON encoder of ``Dixt`` objects, which encodes the internal data
+    of the objects in place of the objects.
+
+    Spans of lazy JSON documents are written as they are, if not indented
+    nor sorted, and if ASCII or not ``ensure_ascii``. Since encoders cannot
+    output raw JSON, the spans are encoded as marker strings first, which
+    are then replaced in the output.
+    """
+
+    def __init__(self, *, hidden=False, default=None, tracker=None, **kwargs):
+        super().__init__(**kwargs)
+        self.hidden = hidden
+        self.fallback = default
+        # cached encodings of tracked objects, and the [object, key, cacheable]
+        # frames of the items of tracked objects being encoded
+        self.tracker = tracker
+        self.frames = []
+        self.verbatim = self.indent is None and not self.sort_keys
+        self.spans = []
+        marker = secrets.token_hex(8)
+        self.marker = f'\0{marker}:'
+        self.encoded_marker = re.compile(r'"\\u0000' + marker + r':(\d+)\\u0000"')
+
+    def default(self, obj):
+        if isinstance(obj, Dixt):
+            if self.tracker is not None:
+                return self.__tracked(obj)
+            if self.hidden and obj.__hidden__:
+                return {**obj.__data__, **obj.__hidden__}
+            return obj.__data__
+        if isinstance(obj, RawJSON):
+            if not self.verbatim or (self.ensure_ascii and not obj.raw().isascii()):
+                return obj.decode()
+            self.spans.append(obj)
+            return f'{self.marker}{len(self.spans) - 1}\0'
+        if self.fallback is not None:
+            return self.fallback(obj)
+        return super().default(obj)
+
+    def iterencode(self, o, _one_shot=False):
+        for chunk in super().iterencode(o, _one_shot):
+            if self.spans:
+                chunk = self.encoded_marker.sub(self.__raw_span, chunk)
+            yield chunk
+
+    def __tracked(self, obj):
+        """Encode the tracked object `obj` as a span, from the cached encodings
+        of the items not changed since. Objects linked elsewhere, e.g., added
+        to lists in place, or also held by other items, are encoded as usual,
+        and the items holding them are not cached.
+        """
+        frames = self.frames
+        if frames and (obj.__parent__ is not frames[-1][0] or obj.__key__ != frames[-1][1]):
+            for frame in frames:
+                frame[2] = False
+            return obj.__data__
+
+        self.spans.append(self.__compose(obj))
+        return f'{self.marker}{len(self.spans) - 1}\0'
+
+    def __compose(self, obj):
+        """Get the JSON of the tracked object `obj`, encoding only the items
+        of which the cached encodings were removed when changed.
+        """
+        items, parts, frames = self.tracker.entry(obj)[1], [], self.frames
+        for key, value in obj.__data__.items():
+            if (part := items.get(key)) is None:
+                frame = [obj, key, True]
+                frames.append(frame)
+                try:
+                    part = self.__item(obj, key, value)
+                finally:
+                    frames.pop()
+                if frame[2]:
+                    items[key] = part
+            parts.append(part)
+        return f'{{{self.item_separator.join(parts)}}}'
+
+    def __item(self, obj, key, value):
+        if type(key) is str:
+            # the default options, e.g., ensure_ascii, of cached encodings
+            if (encode := _SCALAR_ENCODERS.get(type(value))) is not None:
+                return f'{encode_basestring_ascii(key)}{self.key_separator}{encode(value)}'
+            if isinstance(value, Dixt) and value.__parent__ is obj and value.__key__ == key:
+                return f'{encode_basestring_ascii(key)}{self.key_separator}{self.__compose(value)}'
+        return ''.join(self.iterencode({key: value}, _one_shot=True))[1:-1]
+
+    def __raw_span(self, match):
+        span = self.spans[int(match.group(1))]
+        return span if type(span) is str else span.raw()
+
+
+def _write_chunks(fp, chunks, binary):
+    if chunks:
+        text = ''.join(chunks)
+        fp.write(text.encode() if binary else text)
+
+
+def _json_record(cls, result):
+    if not isinstance(result, cls):
+        # e.g., array of key-value pairs
+        return cls(result)
+    return result
+
+
+def _hydrate(value, cls):
+    """Convert the raw value to lazy ``Dixt`` objects (or the subclass `cls`).
+    That is, the ``dict`` value, the ``dict`` items of the ``list``/``tuple``
+    value (recursively), or the span of a JSON object or array.
+    """
+    if isinstance(value, dict):
+        return cls.lazy(value)
+    if isinstance(value, (list, tuple)):
+        return value.__class__(_hydrate(item, cls) for item in value)
+    if isinstance(value, RawJSON):
+        if value.is_object:
+            return cls.lazy(dict(scan_object(value.text, value.start)[0]))
+        return value.decode(object_pairs_hook=_json_object_builder(cls))
+    return value
+
+
+def _dictify_kvp(sequence):
+    try:
+        return dict(sequence or {})
+    except (TypeError, ValueError) as e:
+        msg = f'Sequence {sequence} is not ' \
+              f'iterable key-value pairs'
+        raise ValueError(msg) from e
+
+
+def _contents(container, *keys):
+    result, not_found = [], []
+    for key in keys:
+        if key in container:
+            result.append(True)
+        else:
+            result.append(False)
+            not_found.append(key)
+    return tuple(result), not_found
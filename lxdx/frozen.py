@@ -0,0 +1,432 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional
+
+from ._common import _setslot
+from .dixt import Dixt, _NormalisedKeys
+from .path import compile_path
+
+__all__ = ['FrozenDixt']
+
+# bits of the hashes of the keys per level of the trie
+_BITS = 5
+_FRAGMENT = (1 << _BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+# modulus of the cached sums of the hashes of the items
+_HASH_MODULUS = 1 << 61
+
+
+class FrozenDixt(_NormalisedKeys, Mapping):
+    """Immutable ``Dixt``, which is hashable, e.g., for snapshots of
+    configurations used as keys of ``dict`` objects or caches.
+
+    Items are stored in a persistent hash array mapped trie (HAMT) by their
+    normalised keys. So changes like :meth:`set`, :meth:`update`, ``|``, and
+    :meth:`set_by_path` create new versions in *O(log n)* time, sharing the
+    unchanged parts, including the unchanged nested objects, with the old version.
+    The hash is computed once, and updated, not recomputed, for new versions.
+
+    Nested ``dict`` and ``Dixt`` objects are frozen as ``FrozenDixt`` objects,
+    and ``list`` objects as ``tuple``. Items are in insertion order, and accessible
+    by normalised keys as in ``Dixt``, but there are no hidden items nor metadata.
+    """
+
+    __slots__ = ('_root', '_size', '_seq', '_hash_sum', '_ordered', '__weakref__')
+
+    def __new__(cls, data=None, /, **kwargs):
+        if not isinstance(data, Mapping):
+            data = dict(data or {})
+
+        leaves, seq = {}, 0
+        normalise = cls.__normaliser__
+        for spec in (data, kwargs):
+            for key, value in spec.items():
+                nkey = normalise(key)
+                if nkey in leaves:
+                    # the same item, keeping its original key and position
+                    _, key, _, position = leaves[nkey]
+                else:
+                    position, seq = seq, seq + 1
+                leaves[nkey] = (nkey, key, _freeze(value, cls), position)
+
+        return cls._create(_build([(_hash(nkey), leaf) for nkey, leaf in leaves.items()], 0),
+                           len(leaves), seq, None)
+
+    @classmethod
+    def _create(cls, root, size, seq, hash_sum):
+        fd = super().__new__(cls)
+        _setslot(fd, '_root', root)
+        _setslot(fd, '_size', size)
+        _setslot(fd, '_seq', seq)
+        _setslot(fd, '_hash_sum', hash_sum)
+        _setslot(fd, '_ordered', None)
+        return fd
+
+    def __getattr__(self, key):
+        if (leaf := self._leaf(key)) is None:
+            return super().__getattribute__(key)
+        return leaf[2]
+
+    def __getitem__(self, key):
+        if (leaf := self._leaf(key)) is None:
+            raise KeyError(key)
+        return leaf[2]
+
+    def __contains__(self, origkey):
+        """``True`` if this object contains the original (non-normalised) key."""
+        leaf = self._leaf(origkey)
+        return leaf is not None and leaf[1] == origkey
+
+    def __iter__(self) -> Iterator:
+        return (leaf[1] for leaf in self._leaves())
+
+    def __len__(self):
+        return self._size
+
+    def __setattr__(self, key, value):
+        raise TypeError(f'{self.__class__.__name__} object is immutable')
+
+    __delattr__ = __setattr__
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, FrozenDixt):
+            if len(self) != len(other):
+                return False
+            if self._hash_sum is not None and other._hash_sum is not None \
+                    and self._hash_sum != other._hash_sum:
+                return False
+        elif isinstance(other, Mapping):
+            # e.g., with lists instead of tuples
+            other = self.__class__(other)
+        else:
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __hash__(self):
+        if self._hash_sum is None:
+            total = sum(hash((leaf[1], leaf[2])) for leaf in _walk(self._root))
+            _setslot(self, '_hash_sum', total % _HASH_MODULUS)
+        return hash((FrozenDixt, self._size, self._hash_sum))
+
+    def __or__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return self.update(other)
+
+    def __ror__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return self.__class__(other).update(self)
+
+    def __reduce__(self):
+        return self.__class__, (list(self.items()),)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict(self.items())})'
+
+    def get(self, key, default=None) -> Any:
+        """Get the value of the normalised or non-normalised `key`,
+        or `default` if not found.
+        """
+        leaf = self._leaf(key)
+        return default if leaf is None else leaf[2]
+
+    def set(self, key, value) -> 'FrozenDixt':
+        """Return a new version of this object with the item of `key` set to `value`.
+        Existing items keep their original keys and positions.
+        """
+        nkey = self.__normaliser__(key)
+        hashed = _hash(nkey)
+        old = _get(self._root, hashed, nkey)
+        seq = self._seq if old is None else old[3]
+        leaf = (nkey, key if old is None else old[1], _freeze(value, self.__class__), seq)
+        if old is not None and old[2] is leaf[2]:
+            return self
+
+        root = _assoc(self._root, 0, hashed, leaf)
+        return self._create(root, self._size + (old is None), self._seq + (old is None),
+                            self._updated_hash(old, leaf))
+
+    def delete(self, key) -> 'FrozenDixt':
+        """Return a new version of this object without the item of `key`.
+
+        :raises KeyError: When the key is not found.
+        """
+        nkey = self.__normaliser__(key)
+        hashed = _hash(nkey)
+        if (old := _get(self._root, hashed, nkey)) is None:
+            raise KeyError(key)
+        root = _dissoc(self._root, 0, hashed, nkey) or _EMPTY_NODE
+        return self._create(root, self._size - 1, self._seq, self._updated_hash(old, None))
+
+    def update(self, other=(), /, **kwargs) -> 'FrozenDixt':
+        """Return a new version of this object with the items of
+        `other` and `kwargs`, as :meth:`set` for each item.
+        """
+        if not isinstance(other, Mapping):
+            other = dict(other)
+        result = self
+        for spec in (other, kwargs):
+            for key, value in spec.items():
+                result = result.set(key, value)
+        return result
+
+    def set_by_path(self, path: str, value) -> 'FrozenDixt':
+        """Return a new version of this object with the item of the `path`
+        set to `value`. Only the objects, and tuples, on the path are replaced.
+
+        :raises ValueError: When the path is invalid, or matches multiple items.
+        :raises KeyError: When a key on the path is not found.
+        :raises IndexError: When an index on the path is out of range.
+        """
+        compiled = compile_path(path)
+        if not compiled.singular:
+            raise ValueError(f'Path of multiple items is not supported: {path}')
+        return _set_in(self, compiled.steps, _freeze(value, self.__class__))
+
+    def get_from(self, path: str) -> Any:
+        """Get the item(s) of the `path`, as :meth:`Dixt.get_from`."""
+        return compile_path(path).get(self)
+
+    def iter_from(self, path: str) -> Iterator:
+        """Yield the item(s) of the `path`, as :meth:`Dixt.iter_from`."""
+        return compile_path(path).iter(self)
+
+    def thaw(self) -> Dixt:
+        """Convert this object to a (mutable) ``Dixt`` object,
+        and the nested tuples to ``list``.
+        """
+        return Dixt(_thaw(self))
+
+    def dict(self) -> dict:
+        """Convert this object to ``dict``, with non-normalised keys,
+        and the nested tuples to ``list``.
+        """
+        return _thaw(self)
+
+    def _leaf(self, key) -> Optional[tuple]:
+        nkey = self.__normaliser__(key)
+        return _get(self._root, _hash(nkey), nkey)
+
+    def _leaves(self):
+        """Leaves of the trie in insertion order, cached per version."""
+        if self._ordered is None:
+            _setslot(self, '_ordered', sorted(_walk(self._root), key=_position))
+        return self._ordered
+
+    def _updated_hash(self, old, new):
+        """Update the cached hash for the item changed from `old` to `new`,
+        or unset the hash, if not yet computed or if a value is unhashable.
+        """
+        if self._hash_sum is None:
+            return None
+        try:
+            total = self._hash_sum
+            if old is not None:
+                total -= hash((old[1], old[2]))
+            if new is not None:
+                total += hash((new[1], new[2]))
+        except TypeError:
+            return None
+        return total % _HASH_MODULUS
+
+
+def _position(leaf):
+    return leaf[3]
+
+
+def _hash(nkey):
+    return hash(nkey) & _HASH_MASK
+
+
+def _freeze(value, cls):
+    if isinstance(value, FrozenDixt):
+        return value
+    if isinstance(value, (dict, Dixt)):
+        return cls(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item, cls) for item in value)
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, FrozenDixt):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _set_in(node, steps, value):
+    step, child = steps[0], _child(node, steps[0])
+    if len(steps) > 1:
+        value = _set_in(child, steps[1:], value)
+    if isinstance(step, int):
+        return node[:step] + (value,) + (node[step + 1:] if step != -1 else ())
+    return node.set(step, value)
+
+
+def _child(node, step):
+    if isinstance(step, int):
+        if not isinstance(node, tuple):
+            raise KeyError(f'[{step}]')
+        return node[step]
+    if not isinstance(node, FrozenDixt) or (leaf := node._leaf(step)) is None:
+        raise KeyError(step)
+    return leaf[2]
+
+
+# Nodes of the trie. Leaves are tuples of the normalised key,
+# original key, value, and insertion sequence number of the items.
+
+class _BitmapNode:
+    """Node of up to 32 leaves or child nodes, where the bits
+    set in the bitmap are the fragments of the hashes present.
+    """
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _CollisionNode:
+    """Node of the leaves of which the keys have the same hash."""
+    __slots__ = ('hash', 'entries')
+
+    def __init__(self, hash_, entries):
+        self.hash = hash_
+        self.entries = entries
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+def _index(bitmap, bit):
+    return bin(bitmap & (bit - 1)).count('1')
+
+
+def _get(node, hashed, nkey):
+    shift = 0
+    while True:
+        if type(node) is _CollisionNode:
+            return next((leaf for leaf in node.entries if leaf[0] == nkey), None)
+        bit = 1 << (hashed >> shift & _FRAGMENT)
+        if not node.bitmap & bit:
+            return None
+        entry = node.entries[_index(node.bitmap, bit)]
+        if type(entry) is tuple:
+            return entry if entry[0] == nkey else None
+        node, shift = entry, shift + _BITS
+
+
+def _assoc(node, shift, hashed, leaf):
+    if type(node) is _CollisionNode:
+        if node.hash == hashed:
+            entries = tuple(entry for entry in node.entries if entry[0] != leaf[0])
+            return _CollisionNode(hashed, entries + (leaf,))
+        # e.g., a new key which only shares a part of the hash
+        node = _BitmapNode(1 << (node.hash >> shift & _FRAGMENT), (node,))
+
+    bit = 1 << (hashed >> shift & _FRAGMENT)
+    index = _index(node.bitmap, bit)
+    entries = node.entries
+    if not node.bitmap & bit:
+        return _BitmapNode(node.bitmap | bit, entries[:index] + (leaf,) + entries[index:])
+
+    entry = entries[index]
+    if type(entry) is not tuple:
+        entry = _assoc(entry, shift + _BITS, hashed, leaf)
+    elif entry[0] == leaf[0]:
+        entry = leaf
+    else:
+        entry = _build([(_hash(entry[0]), entry), (hashed, leaf)], shift + _BITS)
+    return _BitmapNode(node.bitmap, entries[:index] + (entry,) + entries[index + 1:])
+
+
+def _dissoc(node, shift, hashed, nkey):
+    """Remove the leaf of `nkey`. Return the new node, a leaf if it is the only
+    entry left (to be inlined by the parent), or ``None`` if nothing is left.
+    """
+    if type(node) is _CollisionNode:
+        entries = tuple(entry for entry in node.entries if entry[0] != nkey)
+        return entries[0] if len(entries) == 1 else _CollisionNode(node.hash, entries)
+
+    bit = 1 << (hashed >> shift & _FRAGMENT)
+    index = _index(node.bitmap, bit)
+    entry = node.entries[index]
+    if type(entry) is not tuple:
+        entry = _dissoc(entry, shift + _BITS, hashed, nkey)
+
+    if entry is None or type(entry) is tuple and entry[0] == nkey:
+        bitmap, entries = node.bitmap & ~bit, node.entries[:index] + node.entries[index + 1:]
+    else:
+        bitmap, entries = node.bitmap, node.entries[:index] + (entry,) + node.entries[index + 1:]
+
+    if not entries:
+        return None
+    if len(entries) == 1 and type(entries[0]) is tuple and shift:
+        return entries[0]
+    return _BitmapNode(bitmap, entries)
+
+
+def _build(hashed_leaves, shift):
+    """Build the node of the leaves, with their hashes, in a single pass."""
+    if shift >= _HASH_BITS:
+        return _CollisionNode(hashed_leaves[0][0], tuple(leaf for _, leaf in hashed_leaves))
+
+    groups = {}
+    for hashed, leaf in hashed_leaves:
+        groups.setdefault(hashed >> shift & _FRAGMENT, []).append((hashed, leaf))
+
+    bitmap, entries = 0, []
+    for fragment in sorted(groups):
+        group = groups[fragment]
+        bitmap |= 1 << fragment
+        entries.append(group[0][1] if len(group) == 1 else _build(group, shift + _BITS))
+    return _BitmapNode(bitmap, tuple(entries))
+
+
+def _walk(node):
+    """Yield all the leaves under the node."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for entry in node.entries:
+            if type(entry) is tuple:
+                yield entry
+            else:
+                stack.append(entry)
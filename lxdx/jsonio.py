@@ -0,0 +1,318 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import codecs
+import json
+import mmap
+import os
+import re
+
+from json.decoder import scanstring
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+__all__ = ['RawJSON', 'iter_records', 'read_text', 'scan_document', 'scan_object']
+
+# size of the chunks read from files at a time
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+# longest incomplete token, e.g., "-Infinit", of records split between chunks
+_PARTIAL_TOKEN = len('-Infinity')
+
+
+def _discard(*_):
+    return None
+
+
+# decoder of values, and "decoder" only validating and finding
+# the end of nested objects and arrays without building them
+_DECODER = json.JSONDecoder()
+_SKIPPER = json.JSONDecoder(object_pairs_hook=_discard, parse_int=_discard,
+                            parse_float=_discard, parse_constant=_discard)
+
+_SPACE = re.compile(r'[ \t\n\r]*')
+_OPEN = re.compile(r'[ \t\n\r]*{[ \t\n\r]*(})?')
+_KEY = re.compile(r'[ \t\n\r]*"')
+_COLON = re.compile(r'[ \t\n\r]*:[ \t\n\r]*')
+_NEXT = re.compile(r'[ \t\n\r]*([,}])')
+
+
+class RawJSON:
+    """Span of an undecoded JSON object or array in a JSON text."""
+    __slots__ = ('text', 'start', 'end')
+
+    def __init__(self, text: str, start: int, end: int):
+        self.text = text
+        self.start = start
+        self.end = end
+
+    def __eq__(self, other):
+        if isinstance(other, RawJSON):
+            other = other.decode()
+        return self.decode() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.raw()[:40]!r}...)'
+
+    def __reduce__(self):
+        # only the span is pickled, not the whole text
+        return self.__class__, (self.raw(), 0, self.end - self.start)
+
+    @property
+    def is_object(self) -> bool:
+        return self.text.startswith('{', self.start)
+
+    def raw(self) -> str:
+        """The JSON text of the span."""
+        return self.text[self.start:self.end]
+
+    def decode(self, **kwargs):
+        """Decode the span with ``json.loads()`` and the `kwargs`."""
+        return json.loads(self.raw(), **kwargs)
+
+
+def _decoded(value):
+    return value.decode() if type(value) is RawJSON else value
+
+
+def scan_document(text: Union[str, bytes], /) -> Optional[List[Tuple]]:
+    """Decode only the top level of the JSON document, if it is a JSON object.
+    See :func:`scan_object`. Bytes-like documents are decoded to ``str`` first.
+
+    :returns: The key-value pairs of the object, or ``None`` if the document
+              is not a JSON object.
+    """
+    if not isinstance(text, str):
+        text = str(text, json.detect_encoding(text[:4]))
+    start = _SPACE.match(text).end()
+    if not text.startswith('{', start):
+        return None
+
+    pairs, end = scan_object(text, start)
+    if (end := _SPACE.match(text, end).end()) != len(text):
+        raise json.JSONDecodeError('Extra data', text, end)
+    return pairs
+
+
+def scan_object(text: str, pos: int = 0, /) -> Tuple[List[Tuple], int]:
+    """Decode only the top level of the JSON object at `pos` of the `text`.
+    Nested objects and arrays are validated, but not built,
+    and are kept as :class:`RawJSON` instead.
+
+    :returns: The key-value pairs of the object, and the position after the object.
+
+    :raises json.JSONDecodeError: When the object is not valid JSON.
+    """
+    if (match := _OPEN.match(text, pos)) is None:
+        raise json.JSONDecodeError("Expecting '{'", text, pos)
+    pairs, pos = [], match.end()
+    if match.group(1):
+        return pairs, pos
+
+    while True:
+        if (match := _KEY.match(text, pos)) is None:
+            raise json.JSONDecodeError('Expecting property name enclosed in double quotes', text, pos)
+        key, pos = scanstring(text, match.end())
+        if (match := _COLON.match(text, pos)) is None:
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+
+        start = match.end()
+        if text.startswith(('{', '['), start):
+            end = _SKIPPER.raw_decode(text, start)[1]
+            pairs.append((key, RawJSON(text, start, end)))
+        else:
+            value, end = _DECODER.raw_decode(text, start)
+            pairs.append((key, value))
+
+        if (match := _NEXT.match(text, end)) is None:
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, end)
+        pos = match.end()
+        if match.group(1) == '}':
+            return pairs, pos
+
+
+def read_text(path: Union[str, os.PathLike], /, *, use_mmap: bool = True) -> str:
+    """Read the JSON text of the file, detecting its encoding (UTF-8, -16, or -32).
+
+    If `use_mmap`, the file is memory-mapped, and decoded directly from
+    the mapped pages of the OS page cache, which are shared between processes.
+    That is, without reading the contents into a ``bytes`` object first.
+    Empty files, and files which cannot be mapped, are read as usual.
+    """
+    with open(path, 'rb') as file:
+        if use_mmap and os.fstat(file.fileno()).st_size > 0:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # e.g., special files
+                pass
+            else:
+                with mapped:
+                    return str(mapped, json.detect_encoding(mapped[:4]))
+
+        contents = file.read()
+        return contents.decode(json.detect_encoding(contents))
+
+
+def iter_records(fileobj, decoder: json.JSONDecoder, /, *,
+                 format: str = 'ndjson', chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """Yield the decoded records of a JSON Lines file, or of a file
+    of a JSON array, reading the file in chunks of `chunk_size`.
+    Only the chunks of the records being decoded are held in memory.
+
+    :param fileobj: File object opened in text or binary (UTF-8) mode.
+    :param decoder: Decoder of the records.
+    :param format: ``'ndjson'`` for JSON Lines, or ``'array'``.
+    :param chunk_size: Number of characters (or bytes) read at a time.
+
+    :raises ValueError: When the format or chunk size is not supported.
+    :raises json.JSONDecodeError: When a record is not valid JSON,
+                                  or the file is not a JSON array.
+    """
+    readers = {'ndjson': _ndjson_records, 'array': _array_records}
+    if format not in readers:
+        raise ValueError(f'Unsupported format: {format}')
+    if chunk_size < 1:
+        raise ValueError(f'Invalid chunk size: {chunk_size}')
+    return readers[format](_chunks(fileobj, chunk_size), decoder)
+
+
+def _chunks(fileobj, size):
+    """Read the text of the file in chunks, decoding binary files
+    incrementally so characters split between chunks are kept whole.
+    """
+    decoder = None
+    while chunk := fileobj.read(size):
+        if isinstance(chunk, (bytes, bytearray)):
+            decoder = decoder or codecs.getincrementaldecoder('utf-8-sig')()
+            chunk = decoder.decode(chunk)
+        yield chunk
+    if decoder is not None:
+        decoder.decode(b'', final=True)
+
+
+def _ndjson_records(chunks, decoder):
+    # chunks of the incomplete line, joined once the line is complete
+    pending = []
+    for chunk in chunks:
+        pending.append(chunk)
+        if '\n' in chunk:
+            lines = ''.join(pending).split('\n')
+            pending = [lines.pop()]
+            yield from _decode_lines(lines, decoder.decode)
+    yield from _decode_lines([''.join(pending)], decoder.decode)
+
+
+def _decode_lines(lines, decode: Callable):
+    for line in lines:
+        if line and not line.isspace():
+            yield decode(line)
+
+
+def _array_records(chunks, decoder):
+    """Decode the items of the array one by one with ``raw_decode()``,
+    reading more chunks when an item is incomplete.
+    """
+    buffer = _Buffer(chunks)
+    buffer.expect('[')
+    if buffer.peek() == ']':
+        buffer.pos += 1
+    else:
+        while True:
+            yield buffer.decode(decoder)
+            if buffer.expect(',]') == ']':
+                break
+    if buffer.peek() != '':
+        buffer.error('Extra data')
+
+
+class _Buffer:
+    """Text read so far from the chunks, from which the parsed
+    text is discarded to keep the memory bounded.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.text = ''
+        self.pos = 0
+
+    def more(self, size=1):
+        """Read at least `size` more characters, in chunks, or the rest of the file.
+        ``False`` if already at the end of the file.
+        """
+        chunks, count = [], 0
+        while count < size and (chunk := next(self.chunks, None)) is not None:
+            chunks.append(chunk)
+            count += len(chunk)
+        if not chunks:
+            return False
+        self.text = self.text[self.pos:] + ''.join(chunks)
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """The next non-whitespace character, or an empty string at the end."""
+        while True:
+            end = len(self.text)
+            while self.pos < end and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < end or not self.more():
+                return self.text[self.pos:self.pos + 1]
+
+    def expect(self, chars):
+        if (char := self.peek()) == '' or char not in chars:
+            self.error(f'Expecting {" or ".join(map(repr, chars))}')
+        self.pos += 1
+        return char
+
+    def decode(self, decoder):
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                # Incomplete records fail at their ends, or in strings. They are
+                # decoded again with at least twice the text, so large records
+                # are not decoded once per chunk.
+                incomplete = e.pos > len(self.text) - _PARTIAL_TOKEN or e.msg.startswith('Unterminated string')
+                if incomplete and self.more(len(self.text) - self.pos):
+                    continue
+                raise
+
+            # e.g., numbers may continue in the next chunk, as "3." of "3.5"
+            if end <= len(self.text) - _PARTIAL_TOKEN or not self.more(_PARTIAL_TOKEN):
+                self.pos = end
+                return value
+
+    def error(self, msg):
+        raise json.JSONDecodeError(msg, self.text, self.pos)
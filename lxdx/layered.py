@@ -0,0 +1,232 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterator, Tuple
+
+from ._common import _MISSING, _setslot
+from .dixt import Dixt, _NormalisedKeys
+from .path import compile_path
+
+__all__ = ['LayeredDixt']
+
+
+class LayeredDixt(_NormalisedKeys, Mapping):
+    """View of a stack of ``Dixt`` layers, e.g., of default, file, environment,
+    and command-line settings, as a single object, without merging the layers.
+
+    As in ``collections.ChainMap``, the layers are searched from the first,
+    and changes are made to the first layer. Layers are added and removed
+    at the top of the stack, in constant time.
+
+    Items are accessible by normalised keys. The layer holding a key is cached,
+    until it is changed through this object, or the layers are added or removed.
+    Keys not found are not cached. Changes made directly to the layers which add
+    keys already in other layers require :meth:`refresh`.
+
+    Nested ``Dixt`` objects of the same key in several layers are also resolved as
+    ``LayeredDixt`` objects, and a nested object in a single layer is returned as
+    it is. Changes to the nested objects, e.g., ``view.db.host = 'example.com'``,
+    are made to the first layer holding them, which may be a lower layer, e.g.,
+    of the defaults. To change only the first layer, set the whole nested object,
+    e.g., ``view.db = {**view.db, 'host': 'example.com'}``.
+
+    Like ``Dixt``, this class has to be subclassed to use another normaliser.
+    """
+
+    __slots__ = ('_layers', '_cache', '_generation', '__weakref__')
+
+    def __init__(self, *layers):
+        """Create the view of the `layers`, from the highest priority.
+        Mappings which are not ``Dixt`` objects are converted.
+        """
+        # From the lowest priority, so the top of the stack is at the end.
+        _setslot(self, '_layers', [_layer(layer) for layer in reversed(layers)])
+
+        # normalised keys to their generation, layer, nested view,
+        # and the nested objects of the view with their layers
+        _setslot(self, '_cache', {})
+
+        # incremented when the layers are added or removed
+        _setslot(self, '_generation', 0)
+
+    def __contains__(self, origkey):
+        """``True`` if any of the layers contains the original (non-normalised) key."""
+        return any(origkey in layer for layer in self._layers)
+
+    def __delattr__(self, key):
+        """Remove the item from the first layer.
+
+        :raises KeyError: When the key is not found in the first layer.
+        """
+        self.__delitem__(key)
+
+    def __delitem__(self, key):
+        del self._top()[key]
+        self._cache.pop(self.__normaliser__(key), None)
+
+    def __getattr__(self, key):
+        if (value := self.get(key, _MISSING)) is _MISSING:
+            return super().__getattribute__(key)
+        return value
+
+    def __getitem__(self, key):
+        if (value := self.get(key, _MISSING)) is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator:
+        # normalised keys to the original keys of the highest layers
+        keys = {}
+        normalise = self.__normaliser__
+        for layer in self._layers:
+            keys.update(zip(map(normalise, layer), layer))
+        return iter(keys.values())
+
+    def __len__(self):
+        return len({self.__normaliser__(key) for layer in self._layers for key in layer})
+
+    def __reduce__(self):
+        return self.__class__, tuple(self.layers)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({", ".join(map(repr, reversed(self._layers)))})'
+
+    def __setattr__(self, key, value):
+        """Set the item in the first layer, as attribute of ``Dixt``."""
+        setattr(self._top(), key, value)
+        self._cache.pop(self.__normaliser__(key), None)
+
+    def __setitem__(self, key, value):
+        self._top()[key] = value
+        self._cache.pop(self.__normaliser__(key), None)
+
+    @property
+    def layers(self) -> Tuple[Dixt, ...]:
+        """The layers, from the highest priority."""
+        return tuple(reversed(self._layers))
+
+    def push(self, layer):
+        """Add the `layer` as the first layer, of the highest priority."""
+        self._layers.append(_layer(layer))
+        _setslot(self, '_generation', self._generation + 1)
+
+    def pop(self) -> Dixt:
+        """Remove the first layer, and return it.
+
+        :raises IndexError: When there are no layers.
+        """
+        layer = self._layers.pop()
+        _setslot(self, '_generation', self._generation + 1)
+        return layer
+
+    def refresh(self):
+        """Clear the cached layers of the keys, e.g., after changing the layers directly."""
+        self._cache.clear()
+        _setslot(self, '_generation', self._generation + 1)
+
+    def get(self, key, default=None) -> Any:
+        """Get the value of the normalised or non-normalised `key`
+        from the first layer which has it, or `default` if not found.
+        """
+        nkey = self.__normaliser__(key)
+        entry = self._cache.get(nkey)
+        if entry is None or entry[0] != self._generation:
+            entry = self._resolve(nkey, key)
+        _, layer, view, nested = entry
+        if view is not None:
+            if all(origin.get(key, _MISSING) is value for origin, value in nested):
+                return view
+        elif layer is not None and (value := layer.get(key, _MISSING)) is not _MISSING:
+            return value
+        if layer is not None:
+            # removed or replaced directly in the layers
+            del self._cache[nkey]
+            return self.get(key, default)
+        return default
+
+    def get_from(self, path: str, /) -> Any:
+        """Get the item(s) of the `path`, as :meth:`Dixt.get_from`."""
+        return compile_path(path).get(self)
+
+    def iter_from(self, path: str, /) -> Iterator:
+        """Yield the item(s) of the `path`, as :meth:`Dixt.iter_from`."""
+        return compile_path(path).iter(self)
+
+    def flatten(self) -> Dixt:
+        """Merge the layers into a new ``Dixt`` object, as :meth:`Dixt.merge`.
+        Hidden items are not included.
+        """
+        result = Dixt()
+        for layer in self._layers:
+            result.merge(layer.dict())
+        return result
+
+    def _top(self) -> Dixt:
+        if not self._layers:
+            raise KeyError('No layers')
+        return self._layers[-1]
+
+    def _resolve(self, nkey, key):
+        """Find the layer of the key, and the nested ``Dixt`` objects of the key
+        in the following layers, until a layer with another type of value.
+        """
+        layer, nested = None, []
+        for candidate in reversed(self._layers):
+            if (value := candidate.get(key, _MISSING)) is _MISSING:
+                continue
+            if not isinstance(value, Dixt):
+                break
+            layer = layer or candidate
+            nested.append((candidate, value))
+        else:
+            value = _MISSING
+
+        if not nested:
+            if value is _MISSING:
+                # not cached, as the key can be added directly to any layer
+                return self._generation, None, None, ()
+            layer, view = candidate, None
+        elif len(nested) == 1:
+            view = nested[0][1]
+        else:
+            view = self.__class__(*(value for _, value in nested))
+        # the layers and their nested objects are kept to check that the view is
+        # still up to date, as the nested objects can be replaced directly
+        entry = self._cache[nkey] = (self._generation, layer, view, tuple(nested))
+        return entry
+
+
+def _layer(layer):
+    if isinstance(layer, Dixt):
+        return layer
+    if isinstance(layer, Mapping):
+        return Dixt(layer)
+    raise TypeError(f'Invalid type ({type(layer)}) of layer')
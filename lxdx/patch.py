@@ -0,0 +1,316 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import json
+
+from collections.abc import Mapping
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, List
+
+from ._common import _MISSING, _SCALAR_TYPES
+from .jsonio import RawJSON, _decoded
+
+__all__ = ['apply_patch', 'diff']
+
+
+def diff(source, target, /) -> List[Dict[str, Any]]:
+    """Create the operations of JSON Patch (RFC 6902) changing `source` into `target`.
+    Only ``add``, ``remove``, and ``replace`` operations are created, with the values
+    as plain ``dict`` and ``list`` objects, e.g., to be sent as JSON.
+
+    Objects which are the same in both are skipped without being compared.
+    Lists are compared after their common start and end, by the items which
+    are equal, so that items inserted or removed are not replaced one by one.
+
+    :param source: ``Mapping`` object, e.g. ``Dixt``, hidden items are excluded.
+    :param target: ``Mapping`` object, e.g. ``Dixt``, hidden items are excluded.
+
+    :raises TypeError: When a key of the changed items is not a string,
+                       which JSON Pointers cannot refer to.
+    """
+    operations = []
+    _diff('', source, target, operations)
+    if any(operation['path'] is None for operation in operations):
+        raise TypeError('Keys of the changed items must be strings')
+    return operations
+
+
+def apply_patch(obj, operations, /, convert: Callable = None, applied: Callable = None):
+    """Apply the JSON Patch `operations` to `obj` in place. The operations
+    are applied one by one, so if one fails, the previous ones remain applied.
+
+    :param operations: ``add``, ``remove``, and ``replace`` operations.
+    :param convert: Function to convert the values added to lists,
+                    e.g. ``dict`` objects to ``Dixt``.
+    :param applied: Function called with the keys and indices (as ``str``)
+                    of the path of each operation applied, except to the whole object.
+
+    :raises ValueError: When an operation or a path is invalid.
+    :raises KeyError: When a key of the path is not found.
+    :raises IndexError: When an index of the path is out of range.
+    """
+    for operation in operations:
+        op, path = operation.get('op'), operation.get('path')
+        if op not in _OPERATIONS or not isinstance(path, str):
+            raise ValueError(f'Invalid operation: {operation}')
+        if op != 'remove' and 'value' not in operation:
+            raise ValueError(f'Invalid operation without value: {operation}')
+
+        value = operation.get('value')
+        if path == '':
+            # the whole object
+            if op == 'remove':
+                raise ValueError(f'Invalid operation: {operation}')
+            obj.clear()
+            obj.update(value)
+            continue
+
+        steps = _parse_pointer(path)
+        container = obj
+        for step in steps[:-1]:
+            container = _child(container, step)
+        _OPERATIONS[op](container, steps[-1], value, convert or _same)
+        if applied is not None:
+            applied(steps)
+
+
+def _diff(path, source, target, operations):
+    pending = [(path, source, target)]
+    while pending:
+        path, source, target = pending.pop()
+        if source is target:
+            continue
+        if type(source) is RawJSON or type(target) is RawJSON:
+            # spans of lazy JSON documents
+            source, target = _decoded(source), _decoded(target)
+
+        if isinstance(source, (list, tuple)) and isinstance(target, (list, tuple)):
+            _diff_lists(path, source, target, operations)
+        elif (mapping := _mapping(source)) is not None and (other := _mapping(target)) is not None:
+            _diff_mappings(path, mapping, other, operations, pending)
+        elif not _equal(source, target):
+            operations.append({'op': 'replace', 'path': path, 'value': _plain(target)})
+
+
+def _diff_mappings(path, mapping, other, operations, pending):
+    if mapping.keys() != other.keys():
+        for key in mapping.keys():
+            if key not in other:
+                operations.append({'op': 'remove', 'path': _member(path, key)})
+
+    nested = []
+    for key, value in other.items():
+        old = mapping.get(key, _MISSING)
+        if old is _MISSING:
+            operations.append({'op': 'add', 'path': _member(path, key), 'value': _plain(value)})
+        elif old is not value:
+            if type(value) in _SCALAR_TYPES and type(old) is type(value):
+                if old != value:
+                    operations.append({'op': 'replace', 'path': _member(path, key), 'value': value})
+            else:
+                nested.append((_member(path, key), old, value))
+    # compared in the order of the keys
+    pending.extend(reversed(nested))
+
+
+def _diff_lists(path, source, target, operations):
+    """Compare the lists, creating the operations from the end of the lists,
+    so the indices of the operations are not affected by the previous ones.
+    """
+    # the common start and end are skipped
+    start, end = 0, min(len(source), len(target))
+    while start < end and _equal(source[start], target[start]):
+        start += 1
+    stop_source, stop_target = len(source), len(target)
+    while stop_source > start and stop_target > start \
+            and _equal(source[stop_source - 1], target[stop_target - 1]):
+        stop_source, stop_target = stop_source - 1, stop_target - 1
+    if start == stop_source and start == stop_target:
+        return
+
+    # items which are equal are matched by their keys
+    matcher = SequenceMatcher(None, [_key(item) for item in source[start:stop_source]],
+                              [_key(item) for item in target[start:stop_target]], autojunk=False)
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        i1, i2, j1, j2 = i1 + start, i2 + start, j1 + start, j2 + start
+        if tag == 'equal':
+            continue
+        # items in both are compared, and the rest are removed or added
+        common = min(i2 - i1, j2 - j1)
+        for index in range(i1 + common, i2)[::-1]:
+            operations.append({'op': 'remove', 'path': _join(path, index)})
+        for index in range(j1 + common, j2):
+            operations.append({'op': 'add', 'path': _join(path, index - j1 + i1), 'value': _plain(target[index])})
+        for offset in range(common)[::-1]:
+            _diff(_join(path, i1 + offset), source[i1 + offset], target[j1 + offset], operations)
+
+
+def _equal(source, target):
+    """Compare as JSON values, e.g., 1 and True are different,
+    as well as an empty object and an empty list.
+    """
+    pending = [(source, target)]
+    while pending:
+        source, target = pending.pop()
+        if source is target:
+            continue
+        if type(source) is RawJSON or type(target) is RawJSON:
+            source, target = _decoded(source), _decoded(target)
+
+        if type(source) in _SCALAR_TYPES or type(target) in _SCALAR_TYPES:
+            if type(source) is not type(target) or source != target:
+                return False
+        elif isinstance(source, (list, tuple)):
+            if not isinstance(target, (list, tuple)) or len(source) != len(target):
+                return False
+            pending.extend(zip(source, target))
+        elif not _push_values(source, target, pending):
+            return False
+    return True
+
+
+def _push_values(source, target, pending):
+    """Add the values of the same keys of the mappings to `pending`,
+    ``False`` if the keys are different, or any of them is not a mapping.
+    """
+    mapping, other = _mapping(source), _mapping(target)
+    if mapping is None or other is None:
+        return source == target if mapping is other else False
+    if mapping.keys() != other.keys():
+        return False
+    pending.extend((value, other[key]) for key, value in mapping.items())
+    return True
+
+
+def _key(item):
+    """Hashable key of the list `item`, the same for equal items."""
+    if type(item) in _SCALAR_TYPES:
+        return type(item), item
+    try:
+        return json.dumps(_plain(item), sort_keys=True, default=repr)
+    except TypeError:
+        # e.g., keys of different types
+        return repr(_plain(item))
+
+
+def _mapping(value):
+    """Get the underlying mapping of `value`, or ``None``."""
+    if type(value) is dict:
+        return value
+    if hasattr(type(value), '__data__'):
+        # Dixt objects, without the hidden items
+        return value.__data__
+    return value if isinstance(value, Mapping) else None
+
+
+def _plain(value):
+    """Convert the value to plain ``dict`` and ``list`` objects."""
+    value = _decoded(value)
+    if (mapping := _mapping(value)) is not None:
+        return {key: _plain(item) for key, item in mapping.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _member(path, key):
+    """JSON Pointer of the `key` of the object at `path`, or ``None``
+    if the key is not a string, and operations on it cannot be created.
+    """
+    return _join(path, key) if isinstance(key, str) else None
+
+
+def _join(path, key):
+    if path is None:
+        return None
+    key = str(key)
+    if '~' in key or '/' in key:
+        key = key.replace('~', '~0').replace('/', '~1')
+    return f'{path}/{key}'
+
+
+def _parse_pointer(path):
+    if not path.startswith('/'):
+        raise ValueError(f'Invalid path: {path}')
+    return [step.replace('~1', '/').replace('~0', '~') for step in path[1:].split('/')]
+
+
+def _index(step, size):
+    if not step.isdigit() or (step.startswith('0') and step != '0'):
+        raise ValueError(f'Invalid index: {step}')
+    if (index := int(step)) >= size:
+        raise IndexError(f'Index out of range: {step}')
+    return index
+
+
+def _child(container, step):
+    if isinstance(container, list):
+        return container[_index(step, len(container))]
+    if isinstance(container, Mapping):
+        return container[step]
+    raise KeyError(step)
+
+
+def _same(value):
+    return value
+
+
+def _add(container, key, value, convert):
+    if isinstance(container, list):
+        index = len(container) if key == '-' else _index(key, len(container) + 1)
+        container.insert(index, convert(value))
+    elif isinstance(container, Mapping):
+        container[key] = value
+    else:
+        raise KeyError(key)
+
+
+def _remove(container, key, *_):
+    if isinstance(container, list):
+        del container[_index(key, len(container))]
+    elif isinstance(container, Mapping):
+        del container[key]
+    else:
+        raise KeyError(key)
+
+
+def _replace(container, key, value, convert):
+    _child(container, key)  # must be existing
+    if isinstance(container, list):
+        container[int(key)] = convert(value)
+    else:
+        container[key] = value
+
+
+_OPERATIONS = {
+    'add': _add,
+    'remove': _remove,
+    'replace': _replace,
+}
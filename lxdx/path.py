@@ -0,0 +1,545 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import operator
+import re
+
+from ast import literal_eval
+from collections.abc import Mapping
+from functools import lru_cache, reduce
+from typing import Any, Callable, Iterator, NamedTuple
+
+from ._common import _MISSING
+
+__all__ = ['CompiledPath', 'compile_path']
+
+# maximum number of compiled paths kept by compile_path()
+PATH_CACHE_SIZE = 1024
+
+_STEP = re.compile(r'\.\.(?P<descent>\w+)'
+                   r'|\.(?P<key>\w+)'
+                   r'|\[(?P<index>\d+)]'
+                   r'|(?:\.\*|\[\*])(?P<wildcard>)'
+                   r'|\[(?P<start>-?\d*):(?P<stop>-?\d*)(?::(?P<step>-?\d*))?]')
+
+# tokens of filter expressions, e.g., [?(@.price < 10 && @.tag == 'sale')]
+_TOKEN = re.compile(r'''\s*(?:
+    (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<number>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?)
+    | (?P<constant>true|false|null)\b
+    | (?P<member>@(?:\.\w+|\[\d+])*)
+    | (?P<operator>==|!=|<=|>=|<|>|&&|\|\||!|\(|\))
+)''', re.VERBOSE)
+
+_MEMBER_STEP = re.compile(r'\.(\w+)|\[(\d+)]')
+
+_COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+_CONSTANTS = {'true': True, 'false': False, 'null': None}
+
+
+class _Wildcard:
+    """All items of a mapping or a list, ``[*]`` or ``.*``"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return '*'
+
+
+class _Descent(NamedTuple):
+    """Items of the key at any depth, ``..key``"""
+    key: str
+
+
+class _Filter(NamedTuple):
+    """Items of a mapping or a list matched by the predicate, ``[?(...)]``"""
+    expression: str
+    predicate: Callable
+
+
+WILDCARD = _Wildcard()
+
+
+class CompiledPath:
+    """A path to one or more items, parsed once and reusable for any number
+    of objects. See :meth:`Dixt.get_from() <lxdx.Dixt.get_from>` for the syntax.
+
+    Create objects with :func:`compile_path` or
+    :meth:`Dixt.compile_path() <lxdx.Dixt.compile_path>`.
+    """
+
+    __slots__ = ('expression', 'steps', 'singular')
+
+    def __init__(self, expression: str, steps: tuple):
+        self.expression = expression
+
+        # Keys (str), list indices (int), slices, wildcards,
+        # and recursive descents, from the root object.
+        self.steps = steps
+
+        # whether the path points to only one item
+        self.singular = all(type(step) in (str, int) for step in steps)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.expression!r})'
+
+    def get(self, obj, default=...) -> Any:
+        """Get the item from `obj` at this path.
+
+        If the path is not singular, i.e., has wildcards, slices,
+        or recursive descents, return a ``list`` of all matched items.
+
+        :param default: Value to return when the item is not found.
+                        If not specified (``Ellipsis``), raise the error instead.
+                        Not used for non-singular paths.
+
+        :raises KeyError: Key is not found.
+        :raises IndexError: Invalid list index.
+        """
+        if not self.singular:
+            return list(self.iter(obj))
+        try:
+            for step in self.steps:
+                obj = _child(obj, step)
+        except (KeyError, IndexError):
+            if default is Ellipsis:
+                raise
+            return default
+        return obj
+
+    def iter(self, obj) -> Iterator:
+        """Lazily yield all matched items from `obj` at this path.
+        Nonexistent keys and indices are skipped.
+        """
+        nodes = iter((obj,))
+        for step in self.steps:
+            nodes = _expand(nodes, step)
+        return nodes
+
+    def set(self, obj, value) -> None:
+        """Set the existing item of `obj` at this path to `value`.
+        If the path is not singular, set all the matched items.
+
+        :raises KeyError: Key is not found, only for singular paths.
+        :raises IndexError: Invalid list index, only for singular paths.
+        """
+        *steps, last = self.steps
+        if self.singular:
+            for step in steps:
+                obj = _child(obj, step)
+            _set_child(obj, last, value)
+            return
+
+        parents = iter((obj,))
+        for step in steps:
+            parents = _expand(parents, step)
+        # collected first, as the objects are changed while setting
+        targets = [target for parent in parents for target in _targets(parent, last)]
+        for parent, key in targets:
+            _set_child(parent, key, value)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(path: str, /) -> CompiledPath:
+    """Parse and validate the `path`, e.g., ``$.group.items[1].name``.
+    Compiled paths are cached, so this can be called repeatedly with the same path.
+
+    :raises TypeError, ValueError: Invalid path.
+    """
+    if not isinstance(path, str):
+        raise TypeError(f'Invalid path: {path}')
+    if not path.startswith('$') or len(path) == 1:
+        raise ValueError(f'Invalid path: {path}')
+
+    steps, pos = [], 1
+    while pos < len(path):
+        if path.startswith('[?', pos):
+            step, pos = _FilterParser(path, pos + 2).parse()
+            steps.append(step)
+            continue
+        if (match := _STEP.match(path, pos)) is None:
+            raise ValueError(f'Invalid path: {path}')
+        steps.append(_parse_step(match, path))
+        pos = match.end()
+
+    if isinstance(steps[0], (int, slice)):
+        # the root object is not a list
+        raise ValueError(f'Invalid path: {path}')
+    return CompiledPath(path, tuple(steps))
+
+
+def _parse_step(match, path):
+    kind = match.lastgroup
+    if kind in ('key', 'index'):
+        key, index = match.group('key', 'index')
+        return key if index is None else int(index)
+    if kind == 'descent':
+        return _Descent(match.group('descent'))
+    if kind == 'wildcard':
+        return WILDCARD
+
+    start, stop, step = (int(value) if value else None
+                         for value in match.group('start', 'stop', 'step'))
+    if step == 0:
+        raise ValueError(f'Invalid path, slice step cannot be zero: {path}')
+    return slice(start, stop, step)
+
+
+def _child(obj, step):
+    if isinstance(step, int):
+        if isinstance(obj, (list, tuple)):
+            return obj[step]
+        raise KeyError(f'[{step}]')
+    if isinstance(obj, Mapping):
+        # normalised keys are handled by Dixt objects
+        if (value := obj.get(step, _MISSING)) is _MISSING:
+            raise KeyError(step)
+        return value
+    raise KeyError(step)
+
+
+def _set_child(obj, step, value):
+    if isinstance(step, int):
+        if not isinstance(obj, (list, tuple)):
+            raise KeyError(f'[{step}]')
+        obj[step] = value
+    elif isinstance(obj, Mapping):
+        _child(obj, step)  # must be existing
+        if isinstance(obj, dict) or step in obj:
+            obj[step] = value
+        else:
+            # normalised keys of Dixt objects
+            setattr(obj, step, value)
+    else:
+        raise KeyError(step)
+
+
+def _expand(nodes, step):
+    match = _MATCHES[type(step)]
+    for node in nodes:
+        yield from match(node, step)
+
+
+def _match_key(node, key):
+    if isinstance(node, Mapping):
+        if (value := node.get(key, _MISSING)) is not _MISSING:
+            yield value
+
+
+def _match_index(node, index):
+    if isinstance(node, (list, tuple)) and index < len(node):
+        yield node[index]
+
+
+def _match_all(node, _):
+    if isinstance(node, Mapping):
+        yield from node.values()
+    elif isinstance(node, (list, tuple)):
+        yield from node
+
+
+def _match_slice(node, step):
+    if isinstance(node, (list, tuple)):
+        for index in range(*step.indices(len(node))):
+            yield node[index]
+
+
+def _match_filter(node, step):
+    predicate = step.predicate
+    for item in _match_all(node, None):
+        if predicate(item):
+            yield item
+
+
+def _match_descent(node, step):
+    for child in _walk(node):
+        yield from _match_key(child, step.key)
+
+
+def _walk(node):
+    """Yield `node` and all the mappings and lists under it, in document order.
+    An explicit stack is used instead of recursion, for very deep objects.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Mapping):
+            children = list(node.values())
+        elif isinstance(node, (list, tuple)):
+            children = list(node)
+        else:
+            continue
+        yield node
+        stack.extend(reversed(children))
+
+
+def _targets(node, step):
+    """Pairs of the containers under `node` and their keys/indices
+    matched by the last `step` of the path, for setting items.
+    """
+    if isinstance(step, _Descent):
+        for child in _walk(node):
+            yield from _targets(child, step.key)
+    elif isinstance(step, (str, int)):
+        if next(_MATCHES[type(step)](node, step), _MISSING) is not _MISSING:
+            yield node, step
+    else:
+        for key in _selected_keys(node, step):
+            yield node, key
+
+
+def _selected_keys(node, step):
+    """Keys/indices of the items selected by a wildcard, slice, or filter."""
+    if isinstance(step, slice):
+        if isinstance(node, (list, tuple)):
+            yield from range(len(node))[step]
+    elif step is WILDCARD:
+        for key, _ in _items(node):
+            yield key
+    else:
+        for key, item in _items(node):
+            if step.predicate(item):
+                yield key
+
+
+def _items(node):
+    if isinstance(node, Mapping):
+        yield from node.items()
+    elif isinstance(node, (list, tuple)):
+        yield from enumerate(node)
+
+
+_MATCHES = {
+    str: _match_key,
+    int: _match_index,
+    slice: _match_slice,
+    _Wildcard: _match_all,
+    _Descent: _match_descent,
+    _Filter: _match_filter,
+}
+
+
+class _FilterParser:
+    """Compile a filter expression into a predicate, i.e., nested closures,
+    so no parsing nor ``eval()`` is done when matching the items.
+
+    Grammar::
+
+        filter      := '[?' or ']'
+        or          := and ('||' and)*
+        and         := not ('&&' not)*
+        not         := '!' not | '(' or ')' | comparison
+        comparison  := operand (('==' | '!=' | '<' | '<=' | '>' | '>=') operand)?
+        operand     := member | string | number | 'true' | 'false' | 'null'
+        member      := '@' ('.' key | '[' index ']')*
+
+    A single member operand evaluates whether the member exists,
+    and a single literal evaluates its truthiness.
+    Comparisons with nonexistent members, or of incomparable types, are false.
+    """
+
+    def __init__(self, path, pos):
+        self.path = path
+        self.start = pos
+        self.pos = pos
+
+    def parse(self):
+        """Return the filter step and the position after its closing bracket."""
+        predicate = self.parse_or()
+        end = len(self.path) - len(self.path[self.pos:].lstrip())
+        if not self.path.startswith(']', end):
+            self.error()
+        expression = self.path[self.start - 2:end + 1]
+        return _Filter(expression, predicate), end + 1
+
+    def parse_or(self):
+        operands = [self.parse_and()]
+        while self.accept('operator', '||'):
+            operands.append(self.parse_and())
+        return reduce(lambda a, b: lambda item: a(item) or b(item), operands)
+
+    def parse_and(self):
+        operands = [self.parse_not()]
+        while self.accept('operator', '&&'):
+            operands.append(self.parse_not())
+        return reduce(lambda a, b: lambda item: a(item) and b(item), operands)
+
+    def parse_not(self):
+        if self.accept('operator', '!'):
+            operand = self.parse_not()
+            return lambda item: not operand(item)
+        if self.accept('operator', '('):
+            predicate = self.parse_or()
+            if not self.accept('operator', ')'):
+                self.error()
+            return predicate
+        return self.parse_comparison()
+
+    def parse_comparison(self):
+        left = self.parse_operand()
+        kind, value, _ = self.peek()
+        if kind != 'operator' or value not in _COMPARISONS:
+            if not callable(left):
+                return lambda item: bool(left)
+            return lambda item: left(item) is not _MISSING
+
+        self.next()
+        return _comparison(_COMPARISONS[value], left, self.parse_operand())
+
+    def parse_operand(self):
+        """Return a getter of the member of the items, or a literal value."""
+        kind, value, _ = self.next()
+        if kind == 'member':
+            return _member_getter(value)
+        if kind in ('string', 'number'):
+            try:
+                return literal_eval(value)
+            except (SyntaxError, ValueError):
+                # e.g., invalid escapes of strings
+                return self.error()
+        if kind == 'constant':
+            return _CONSTANTS[value]
+        return self.error()
+
+    def peek(self):
+        if (match := _TOKEN.match(self.path, self.pos)) is None:
+            return None, None, self.pos
+        return match.lastgroup, match.group(match.lastgroup), match.end()
+
+    def next(self):
+        kind, value, self.pos = self.peek()
+        return kind, value, self.pos
+
+    def accept(self, kind, value):
+        if self.peek()[:2] == (kind, value):
+            self.next()
+            return True
+        return False
+
+    def error(self):
+        raise ValueError(f'Invalid filter at position {self.pos}: {self.path}')
+
+
+def _comparison(compare, left, right):
+    """Create the predicate comparing the operands,
+    which are either getters of members of the items or literal values.
+    """
+    if not callable(left):
+        left, right, compare = right, left, _swapped(compare)
+    if callable(right):
+        return _members_comparison(compare, left, right)
+    if not callable(left):
+        # literals only, e.g., [?(1 < 2)]
+        result = _members_comparison(compare, lambda _: left, lambda _: right)(None)
+        return lambda item: result
+
+    def predicate(item):
+        if (value := left(item)) is _MISSING:
+            return False
+        try:
+            return compare(value, right)
+        except TypeError:
+            return False
+    return predicate
+
+
+def _members_comparison(compare, left, right):
+    def predicate(item):
+        if (a := left(item)) is _MISSING or (b := right(item)) is _MISSING:
+            return False
+        try:
+            return compare(a, b)
+        except TypeError:
+            return False
+    return predicate
+
+
+def _swapped(compare):
+    """The comparison with the operands swapped, e.g., 1 < @.a to @.a > 1"""
+    return {operator.lt: operator.gt, operator.gt: operator.lt,
+            operator.le: operator.ge, operator.ge: operator.le}.get(compare, compare)
+
+
+def _member_getter(member):
+    """Create a getter of the `member` (e.g., ``@.a.b[0]``) of an item."""
+    getters = [_key_getter(key) if key else _index_getter(int(index))
+               for key, index in _MEMBER_STEP.findall(member[1:])]
+    if not getters:
+        return lambda item: item
+    if len(getters) == 1:
+        return getters[0]
+
+    def getter(item):
+        for get in getters:
+            if (item := get(item)) is _MISSING:
+                break
+        return item
+    return getter
+
+
+def _index_getter(index):
+    def getter(item):
+        if isinstance(item, (list, tuple)) and index < len(item):
+            return item[index]
+        return _MISSING
+    return getter
+
+
+def _key_getter(key):
+    """Create a getter of the `key` of items. For Dixt objects, the key is
+    normalised only once per class, and the original key is resolved directly
+    from the internal mappings, which is usually the case for the items of a list.
+    """
+    # the class and its normalised key, swapped as one, as compiled
+    # paths are cached and may be used by several threads
+    memo = None, key
+
+    def getter(item):
+        nonlocal memo
+        cls, nkey = memo
+        if type(item) is not cls:
+            if not hasattr(type(item), '__keymap__'):
+                return item.get(key, _MISSING) if isinstance(item, Mapping) else _MISSING
+            cls, nkey = memo = type(item), item.__normaliser__(key)
+
+        value = item.__data__.get(item.__keymap__.get(nkey, _MISSING), _MISSING)
+        if value is _MISSING or item.__raw__:
+            # hidden items, or items of lazy objects to be hydrated
+            return item.get(key, _MISSING)
+        return value
+    return getter
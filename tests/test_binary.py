@@ -0,0 +1,134 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import io
+import unittest
+
+from lxdx import Dixt
+from lxdx.binary import MAGIC, Reader, Writer, dumps, loads
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        self.dixt = Dixt({
+            'Group Name': {'numbers': [1, -1, 2 ** 70, -2 ** 70, 0.5, None, True, False]},
+            'text': ['é', b'\x00\xff', (1, {'Group Name': 2})],
+            3: 'int key',
+            (1, 2): 'tuple key',
+            'secret': {'a': 1}
+        })
+
+    def test__to_bytes__round_trip(self):
+        data = self.dixt.to_bytes()
+        self.assertTrue(data.startswith(MAGIC))
+        result = Dixt.from_bytes(data)
+        self.assertEqual(result, self.dixt)
+        self.assertEqual(result.group_name.numbers, self.dixt.group_name.numbers)
+        self.assertIsInstance(result.text[2], tuple)
+        self.assertIsInstance(result.text[2][1], Dixt)
+        self.assertEqual(result.group_name.__key__, 'Group Name')
+        self.assertEqual(loads(dumps(self.dixt), Dixt), self.dixt)
+
+    def test__to_bytes__keeps_hidden_items_and_metadata(self):
+        self.dixt.keymeta('secret', hidden=True)
+        self.dixt.group_name.keymeta('numbers', hidden=True)
+        result = Dixt.from_bytes(self.dixt.to_bytes())
+
+        self.assertNotIn('secret', result)
+        self.assertEqual(result.keymeta('secret'), {'secret': {'hidden': True}})
+        self.dixt.keymeta('secret', hidden=False)
+        result.keymeta('secret', hidden=False)
+        self.assertEqual(result.secret, {'a': 1})
+        self.assertEqual(result.group_name.keymeta('numbers'), {'numbers': {'hidden': True}})
+
+    def test__to_bytes__subclasses_and_lazy_objects(self):
+        class Sub(Dixt):
+            pass
+
+        result = Sub.from_bytes(Dixt.lazy({'a': {'b': [{'c': 1}]}}).to_bytes())
+        self.assertIsInstance(result.a.b[0], Sub)
+        self.assertEqual(result, {'a': {'b': [{'c': 1}]}})
+
+        lazy = Dixt.from_json('{"a": {"b": [1, {"c": 2}]}}', lazy=True)
+        self.assertEqual(Dixt.from_bytes(lazy.to_bytes()), lazy)
+
+    def test__to_bytes__objects_with_the_same_keys(self):
+        dx = Dixt(items=[{'Name': i, 'tags': {'a': i}} for i in range(3)], keys=[{1: 'a'}, {True: 'b'}])
+        data = dx.to_bytes()
+        self.assertEqual(data.count(b'Name'), 1)
+
+        result = Dixt.from_bytes(data)
+        self.assertEqual(result, dx)
+        self.assertEqual([item.name for item in result['items']], [0, 1, 2])
+        self.assertEqual(result['items'][2].tags.__key__, 'tags')
+        self.assertIs(list(result['keys'][1])[0], True)
+
+        result['items'][0].number = 1
+        self.assertNotIn('number', result['items'][1])
+
+    def test__to_bytes__unsupported_values(self):
+        self.assertRaises(TypeError, Dixt(a={1, 2}).to_bytes)
+
+        class Span:
+            raw = decode = None
+
+        self.assertRaises(TypeError, Dixt(a=Span()).to_bytes)
+
+    def test__from_bytes__invalid_data(self):
+        data = self.dixt.to_bytes()
+        invalid_shape = MAGIC + bytes((9, 5))  # DIXT, shape 5 unknown
+        for invalid in [b'', b'XXXX' + data[4:], data[:-1], data + b'\x00', MAGIC + b'\xff', MAGIC, invalid_shape]:
+            with self.assertRaises(ValueError):
+                Dixt.from_bytes(invalid)
+
+    def test__writer__reader(self):
+        file = io.BytesIO()
+        writer = Writer(file)
+        for i in range(3):
+            writer.write(Dixt(number=i, group={'name': f'group {i}'}))
+
+        file.seek(0)
+        self.assertEqual([dx.group.name for dx in Dixt.iter_bytes(file)],
+                         ['group 0', 'group 1', 'group 2'])
+        file.seek(0)
+        self.assertEqual(len(list(Reader(file, Dixt))), 3)
+
+    def test__reader__invalid_data(self):
+        self.assertRaises(ValueError, Reader, io.BytesIO(b'XXXXX'), Dixt)
+
+        file = io.BytesIO()
+        Writer(file).write(self.dixt)
+        truncated = io.BytesIO(file.getvalue()[:-1])
+        with self.assertRaises(ValueError):
+            list(Dixt.iter_bytes(truncated))
+
+
+if __name__ == '__main__':
+    unittest.main()
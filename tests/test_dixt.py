@@ -28,14 +28,22 @@ ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import io
 import json
+import os
+import tempfile
 import unittest
 
+from unittest import mock
+
 from assertpy import assert_that
 from collections import OrderedDict
 from collections.abc import KeysView, ValuesView, ItemsView
 
-from lxdx import Dixt
+import lxdx.dixt
+
+from lxdx import Dixt, key_normaliser
+from lxdx.jsonio import iter_records
 
 
 INVALID_PATHS = {
@@ -58,9 +66,10 @@ INVALID_PATHS = {
         '$.a[2',
         '$.a.b[]',
         '$.a[-1]',
-        '$.a[1:]',
-        '$.a[:1]',
-        '$.a[::]'
+        '$.a[1:2:0]',
+        '$.a[1-]',
+        '$...a',
+        '$.a[*'
     ],
 }
 
@@ -119,6 +128,14 @@ class TestDixt(unittest.TestCase):
         dx = Dixt(zip(['a', 'b'], [1, 2]))
         self.assertEqual(dx, {'a': 1, 'b': 2})
 
+    def test__init__builds_nested_objects_without_changing_input(self):
+        data = {'a': {'b': {'c': [{'d': 1}]}}}
+        dx = Dixt(iter(data.items()), e={'f': 2})
+        self.assertIsInstance(dx.a.b.c[0], Dixt)
+        self.assertIsInstance(dx.e, Dixt)
+        dx.a.b.c[0].d = 100
+        self.assertEqual(data, {'a': {'b': {'c': [{'d': 1}]}}})
+
     def test__init__should_not_change_data_type(self):
         dx = Dixt(a=(1, 2, 3))
         self.assertEqual(dx, {'a': (1, 2, 3)})
@@ -180,6 +197,35 @@ class TestDixt(unittest.TestCase):
         self.assertNotEqual(self.dixt, 1234)
         self.assertNotEqual(self.dixt, {'set'})
         self.assertNotEqual(self.dixt, ['not', 'key-value', 'pair'])
+        self.assertNotEqual(Dixt(), None)
+        self.assertNotEqual(Dixt(), 0)
+
+    def test__equality__keys_compared_before_values(self):
+        value = mock.Mock()
+        value.__eq__ = mock.Mock(return_value=True)
+        dx = Dixt(a=value, b=1)
+
+        self.assertNotEqual(dx, {'a': value, 'c': 1})
+        self.assertNotEqual(dx, Dixt(a=value))
+        self.assertNotEqual(dx, [('a', value)])
+        value.__eq__.assert_not_called()
+
+        nan = float('nan')
+        dx = Dixt(a=nan)
+        self.assertEqual(dx, dx)
+        self.assertEqual(dx, Dixt(a=nan))
+
+    def test__equality__very_deep_objects(self):
+        def nested(depth, leaf):
+            dx = Dixt(leaf=leaf)
+            for i in range(depth):
+                dx = Dixt(child=[dx] if i % 2 else dx)
+            return dx
+
+        this = nested(2000, 1)
+        self.assertEqual(this, nested(2000, 1))
+        self.assertNotEqual(this, nested(2000, 2))
+        self.assertNotEqual(this, nested(1999, 1))
 
     def test__not_operator__return_false_when_empty_and_true_otherwise(self):
         self.assertFalse(Dixt())
@@ -222,6 +268,18 @@ class TestDixt(unittest.TestCase):
         dx |= [(1, 100), (2, 2)]
         self.assertEqual(dx, {1: 100, 2: 2})
 
+    def test__union_operator__in_place_keeps_object_and_hidden_items(self):
+        dx = Dixt(a=1, secret='x')
+        dx.keymeta('secret', hidden=True)
+        original = dx
+        dx |= {'secret': 'y', 'b': {'c': 2}}
+        self.assertIs(dx, original)
+        self.assertEqual(dx, {'a': 1, 'b': {'c': 2}})
+        self.assertEqual(dx.secret, 'y')
+        self.assertEqual(dx.whats_hidden(), ('secret',))
+        self.assertEqual(dx.keymeta('secret'), {'secret': {'hidden': True}})
+        self.assertIsInstance(dx.b, Dixt)
+
     def test__union_operator__raises_error_for_non_supported_types_or_values(self):
         arguments = [
             'string',
@@ -403,6 +461,13 @@ class TestDixt(unittest.TestCase):
                                          extra='info'))
         self.assertEqual(self.dixt.body.__keymap__, {})
 
+    def test__clear__removes_hidden_items(self):
+        self.dixt.keymeta('extra', hidden=True)
+        self.dixt.clear()
+        self.assertEqual(self.dixt.whats_hidden(), ())
+        self.assertEqual(self.dixt.__keymeta__, {})
+        self.assertRaises(AttributeError, lambda: self.dixt.extra)
+
     def test__update__value_is_forced_to_be_none(self):
         dx = Dixt(a=1, b=2)
         dx.update(None)
@@ -428,6 +493,29 @@ class TestDixt(unittest.TestCase):
         dx.update((('x', 24), ('y', 25)))
         self.assertEqual(dx, Dixt(a=1, b=2, x=24, y=25))
 
+    def test__update__normalised_keys_update_existing_items(self):
+        dx = Dixt({'Key One': 1})
+        items = {'key_one': 10, 'Key Two': 2, 'KEY TWO': 20, 'nested': [{'a': 1}]}
+        dx.update(items)
+        self.assertEqual(list(dx.items()), [('Key One', 10), ('Key Two', 20), ('nested', [Dixt(a=1)])])
+        self.assertEqual(dx.key_two, 20)
+        self.assertEqual(dx.nested[0].a, 1)
+        self.assertEqual(list(items), ['key_one', 'Key Two', 'KEY TWO', 'nested'])
+
+    def test__update__hidden_and_lazy_items(self):
+        dx = Dixt(a=1, b=2)
+        dx.keymeta('b', hidden=True)
+        data = {'b': 3, 'c': 4}
+        dx.update(data)
+        self.assertEqual(dx, {'a': 1, 'c': 4})
+        self.assertEqual(data, {'b': 3, 'c': 4})
+        dx.keymeta('b', hidden=False)
+        self.assertEqual(dx.b, 3)
+
+        lazy = Dixt.lazy({'a': {'b': 1}})
+        lazy.update(Dixt.lazy({'c': {'d': 2}}), e={'f': 3})
+        self.assertEqual(lazy.c.d + lazy.e.f, 5)
+
     def test__update__combination_of_dict_and_kwargs(self):
         dx = Dixt(a=1, b=2)
         dx.update({'c': 3}, d={'dd': 44})
@@ -438,6 +526,54 @@ class TestDixt(unittest.TestCase):
         dx.update(Dixt(e=5, f=Dixt(g=7)))
         self.assertEqual(dx, Dixt(a=1, b=2, e=5, f=Dixt(g=7)))
 
+    def test__merge__nested_objects_in_place(self):
+        dx = Dixt({'server': {'Host Name': 'localhost', 'ports': [80]}, 'debug': False})
+        server = dx.server
+        dx.merge({'server': {'host_name': 'example.com', 'tls': {'enabled': True}}, 'debug': True})
+
+        self.assertIs(dx.server, server)
+        self.assertEqual(dx, {'server': {'Host Name': 'example.com', 'ports': [80], 'tls': {'enabled': True}},
+                              'debug': True})
+        self.assertIsInstance(dx.server.tls, Dixt)
+        self.assertEqual(dx.server.tls.__key__, 'tls')
+
+        dx.merge([('server', Dixt(ports=[443])), ('debug', {'level': 1})])
+        self.assertEqual(dx.server.ports, [443])
+        self.assertEqual(dx.debug.level, 1)
+
+    def test__merge__strategies(self):
+        dx = Dixt(a={'b': 1, 'c': [1]}, d='x')
+        dx.merge({'a': {'b': 2, 'c': [{'e': 2}], 'f': 3}, 'd': 'y'}, strategy='keep', lists='append')
+        self.assertEqual(dx, {'a': {'b': 1, 'c': [1, {'e': 2}], 'f': 3}, 'd': 'x'})
+        self.assertIsInstance(dx.a.c[1], Dixt)
+
+        dx.merge({'a': {'b': 10, 'c': [5]}}, strategy=lambda key, current, incoming: current + incoming)
+        self.assertEqual(dx.a.b, 11)
+        self.assertEqual(dx.a.c, [1, {'e': 2}, 5])
+
+        self.assertRaises(ValueError, dx.merge, {}, strategy='unknown')
+        self.assertRaises(ValueError, dx.merge, {}, lists='unknown')
+        self.assertRaises(ValueError, dx.merge, ['not', 'pairs'])
+
+    def test__merge__hidden_and_lazy_items(self):
+        dx = Dixt.lazy({'a': {'b': {'c': 1}}, 'secret': {'key': 'x'}})
+        dx.keymeta('secret', hidden=True)
+        dx.merge({'a': {'b': {'d': 2}}, 'secret': {'key': 'y'}})
+        self.assertEqual(dx.a.b, {'c': 1, 'd': 2})
+        self.assertEqual(dx.secret.key, 'y')
+        self.assertEqual(dx.whats_hidden(), ('secret',))
+
+    def test__merge__source_unchanged(self):
+        source, item = Dixt(x={'y': 1}, items=[]), Dixt(z=1)
+        dx = Dixt(items=[])
+        dx.merge(source)
+        dx.merge({'items': [item]}, lists='append')
+        dx.merge({'x': {'z': 2}})
+        dx['items'][0].z = 3
+        self.assertEqual(dx, {'x': {'y': 1, 'z': 2}, 'items': [{'z': 3}]})
+        self.assertEqual(source, {'x': {'y': 1}, 'items': []})
+        self.assertEqual(item, {'z': 1})
+
     def test__update__combination_of_key_value_pairs_and_kwargs(self):
         dx = Dixt(a=1, b=2)
         dx.update((('e', 5),), x=[1, 2])
@@ -580,6 +716,27 @@ class TestDixt(unittest.TestCase):
         for path, value in queries:
             self.assertEqual(self.dixt.get_from(path), value)
 
+    def test__get_from__multiple_items(self):
+        queries = [
+            ('$.headers.*', ['gzip', 'application/json']),
+            ('$.body.e[*]', [2, {'g': 9.806}]),
+            ('$.body.f.y[1:]', [[8]]),
+            ('$.body.f.y[::-1]', [[8], {'p': 5}]),
+            ('$.body.f.y[*].p', [5]),
+            ('$..p', [5]),
+            ('$..g', [9.806]),
+            ('$.body..x', [None]),
+            ('$.ghost[*]', [])
+        ]
+        for path, value in queries:
+            self.assertEqual(self.dixt.get_from(path), value)
+
+    def test__iter_from__yields_items_lazily(self):
+        items = self.dixt.iter_from('$..content_type')
+        self.assertNotIsInstance(items, list)
+        self.assertEqual(next(items), 'application/json')
+        self.assertRaises(StopIteration, next, items)
+
     def test__get_from__invalid_path(self):
         for exc, queries in INVALID_PATHS.items():
             for path in queries:
@@ -606,6 +763,15 @@ class TestDixt(unittest.TestCase):
         self.assertEqual(self.dixt['body']['f']['y'][1][0], 88)
         self.assertEqual(self.dixt.get_from('$.body.f.y[1][0]'), 88)
 
+    def test__set_by_path__multiple_items(self):
+        self.dixt.set_by_path('$.body.f.y[*]', 0)
+        self.assertEqual(self.dixt.body.f.y, [0, 0])
+
+        self.dixt.set_by_path('$..c_d', 'cd')
+        self.dixt.set_by_path('$.headers.*', 'any')
+        self.assertEqual(self.dixt.body['C-D'], 'cd')
+        self.assertEqual(self.dixt.headers, {'Accept-Encoding': 'any', 'Content-Type': 'any'})
+
     def test__set_by_path__invalid_path(self):
         for exc, queries in INVALID_PATHS.items():
             for path in queries:
@@ -616,11 +782,163 @@ class TestDixt(unittest.TestCase):
         json_equivalent = json.dumps(self.dict_equiv)
         self.assertEqual(self.dixt.json(), json_equivalent)
 
+    def test__json__options(self):
+        self.assertEqual(self.dixt.json(indent=2, sort_keys=True),
+                         json.dumps(self.dict_equiv, indent=2, sort_keys=True))
+        self.assertEqual(Dixt(a='\u00e9').json(ensure_ascii=False), '{"a": "\u00e9"}')
+        self.assertEqual(Dixt(a={1, 2}).json(default=sorted), '{"a": [1, 2]}')
+        self.assertRaises(TypeError, Dixt(a=object()).json)
+
+    def test__json__hidden_items(self):
+        self.dixt.keymeta('extra', hidden=True)
+        self.dixt.headers.keymeta('Accept-Encoding', hidden=True)
+        visible = json.loads(self.dixt.json())
+        self.assertNotIn('extra', visible)
+        self.assertNotIn('Accept-Encoding', visible['headers'])
+        self.assertEqual(json.loads(self.dixt.json(hidden=True)), self.dict_equiv)
+
+    def test__iterencode__dump(self):
+        expected = json.dumps(self.dict_equiv, indent=1)
+        self.assertEqual(''.join(self.dixt.iterencode(indent=1)), expected)
+
+        text, binary = io.StringIO(), io.BytesIO()
+        self.dixt.dump(text, indent=1)
+        self.dixt.dump(binary, indent=1)
+        self.assertEqual(text.getvalue(), expected)
+        self.assertEqual(binary.getvalue(), expected.encode())
+
+    def test__json__lazy_objects(self):
+        data = {'a': {'b': [{'c': 1}]}, 'd': ({'e': 2},)}
+        self.assertEqual(Dixt.lazy(data).json(), json.dumps(data))
+
     def test__from_json(self):
         json_string = json.dumps(self.dict_equiv)
         dx = Dixt.from_json(json_string)
         self.assertEqual(dx, self.dict_equiv)
 
+    def test__from_json__bytes_and_file_objects(self):
+        json_string = json.dumps(self.dict_equiv)
+        for source in [json_string.encode(), io.StringIO(json_string), io.BytesIO(json_string.encode())]:
+            self.assertEqual(Dixt.from_json(source), self.dict_equiv)
+
+    def test__from_json__objects_built_while_parsing(self):
+        dx = Dixt.from_json('{"Group Name": {"Items": [{"ID": 1}]}, "n": [["a", 1]]}')
+        assert_that(dx.group_name).is_instance_of(Dixt)
+        self.assertEqual(dx.get_from('$.group_name.items[0].id'), 1)
+        self.assertEqual(dx.group_name.__key__, 'Group Name')
+        self.assertEqual(dx.n, [['a', 1]])
+
+        class Sub(Dixt):
+            pass
+
+        sub = Sub.from_json('{"a": {"b": [{"c": 1}]}}', parse_int=str)
+        assert_that(sub).is_instance_of(Sub)
+        assert_that(sub.a.b[0]).is_instance_of(Sub)
+        self.assertEqual(sub.a.b[0].c, '1')
+
+    def test__iter_json__records_split_between_chunks(self):
+        records = [{'ID': i, 'Text': '\u00e9\u2603' * i, 'n': [1.5, {'x': i}], 'f': [True, None, -1e-5]}
+                   for i in range(20)] + [{'long': 'x\\"' * 1000, 'n': -float('inf')}]
+        ndjson = '\n'.join(json.dumps(r, ensure_ascii=False) for r in records) + '\n\n'
+        array = ' [ ' + ' ,\n'.join(json.dumps(r, ensure_ascii=False) for r in records) + ' ]\n'
+        for fmt, doc in [('ndjson', ndjson), ('array', array)]:
+            for chunk_size in [1, 3, 64, 100000]:
+                for file in [io.StringIO(doc), io.BytesIO(doc.encode())]:
+                    result = list(Dixt.iter_json(file, format=fmt, chunk_size=chunk_size))
+                    self.assertEqual(result, records)
+                    self.assertEqual(result[3].n[1].x, 3)
+                    self.assertEqual(result[3].text, records[3]['Text'])
+
+    def test__iter_records__numbers_split_between_chunks(self):
+        for doc in ['[2, 3.5]', '[3.5e1, -0.25E-3]', '[{"a": 12.5}, 1e10, 7]']:
+            for fmt, text in [('array', doc), ('ndjson', '\n'.join(map(json.dumps, json.loads(doc))))]:
+                for chunk_size in range(1, 12):
+                    with self.subTest(doc=doc, format=fmt, chunk_size=chunk_size):
+                        records = iter_records(io.StringIO(text), json.JSONDecoder(), format=fmt, chunk_size=chunk_size)
+                        self.assertEqual(list(records), json.loads(doc))
+
+    def test__iter_json__batches(self):
+        ndjson = '\n'.join(json.dumps({'i': i}) for i in range(5))
+        batches = list(Dixt.iter_json(io.StringIO(ndjson), batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(batches[2][0].i, 4)
+        self.assertEqual(list(Dixt.iter_json(io.StringIO('[]'), format='array', batch_size=2)), [])
+
+    def test__iter_json__invalid_documents(self):
+        for doc in ['', '{"a": 1}', '[{"a": 1} {"b": 2}]', '[{"a": 1}] x', '[{"a": 1},]', '[{"a": 1}']:
+            with self.assertRaises(json.JSONDecodeError):
+                list(Dixt.iter_json(io.StringIO(doc), format='array', chunk_size=2))
+        with self.assertRaises(json.JSONDecodeError):
+            list(Dixt.iter_json(io.StringIO('{"a": 1}\n{"a":\n')))
+
+        # raised without reading the rest of the file
+        file = io.StringIO('[{"a" 1}, ' + '{"b": 1}, ' * 1000 + '1]')
+        with self.assertRaises(json.JSONDecodeError):
+            list(Dixt.iter_json(file, format='array', chunk_size=64))
+        self.assertLess(file.tell(), 100)
+
+        self.assertRaises(ValueError, Dixt.iter_json, io.StringIO(), format='xml')
+        self.assertRaises(ValueError, Dixt.iter_json, io.StringIO(), batch_size=0)
+        self.assertRaises(ValueError, Dixt.iter_json, io.StringIO(), chunk_size=0)
+
+    def test__from_json__lazy_documents(self):
+        doc = '{"Name": "x", "big": {"a": [1, {"b": "c"}], "d": {"e":  1}}, "list": [{"K": 1}, {"K": 2}]}'
+        for source in [doc, doc.encode(), io.StringIO(doc)]:
+            dx = Dixt.from_json(source, lazy=True)
+            self.assertEqual(dx, json.loads(doc))
+            self.assertEqual(dx.json(), doc)
+            self.assertEqual(dx.dict(), json.loads(doc))
+
+        self.assertEqual(dx.big.a[1].b, 'c')
+        assert_that(dx.big.d).is_instance_of(Dixt)
+        self.assertEqual(dx.get_from('$.list[?(@.k == 2)].k'), [2])
+        self.assertEqual(list(dx.iter_from('$..e')), [1])
+
+    def test__from_json__lazy_documents_write_unchanged_spans_verbatim(self):
+        doc = '{"a": {"b":  1}, "c": {"d": [1,  2]}, "e": 1}'
+        dx = Dixt.from_json(doc, lazy=True)
+        dx.e = 2
+        self.assertEqual(dx.json(), '{"a": {"b":  1}, "c": {"d": [1,  2]}, "e": 2}')
+        dx.c.d.append(3)
+        self.assertEqual(dx.json(), '{"a": {"b":  1}, "c": {"d": [1, 2, 3]}, "e": 2}')
+        self.assertEqual(''.join(dx.iterencode()), dx.json())
+        self.assertEqual(dx.json(indent=1), json.dumps(json.loads(dx.json()), indent=1))
+        self.assertEqual(dx.json(sort_keys=True), json.dumps(json.loads(dx.json()), sort_keys=True))
+
+    def test__from_json__lazy_documents_not_ascii(self):
+        doc = '{"a": [1, {"c": "\u00e9"}], "b": {"d":  1}}'
+        dx = Dixt.from_json(doc, lazy=True)
+        self.assertEqual(str(dx), str(json.loads(doc)))
+        self.assertEqual(repr(dx), str(dx))
+        self.assertEqual(dx.json(), '{"a": [1, {"c": "\\u00e9"}], "b": {"d":  1}}')
+        self.assertEqual(dx.json(ensure_ascii=False), doc)
+
+    def test__from_json__lazy_invalid_documents(self):
+        for doc in ['{"a": [1}', '{"a": 1', '{"a": 1} x', '{"a" 1}', '{"a": [1,]}', '{"a": 1,}']:
+            with self.assertRaises(json.JSONDecodeError):
+                Dixt.from_json(doc, lazy=True)
+        self.assertRaises(ValueError, Dixt.from_json, '{}', lazy=True, parse_int=str)
+        self.assertEqual(Dixt.from_json('[["a", {"b": 1}]]', lazy=True), {'a': {'b': 1}})
+
+    def test__from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for encoding in ['utf-8', 'utf-8-sig', 'utf-16']:
+                path = os.path.join(directory, f'{encoding}.json')
+                with open(path, 'w', encoding=encoding) as file:
+                    json.dump({'\u00e9': self.dict_equiv}, file, ensure_ascii=False)
+                for mmap, lazy in [(True, False), (True, True), (False, False)]:
+                    dx = Dixt.from_file(path, mmap=mmap, lazy=lazy)
+                    self.assertEqual(dx, {'\u00e9': self.dict_equiv})
+
+            path = os.path.join(directory, 'empty.json')
+            open(path, 'w').close()
+            self.assertRaises(json.JSONDecodeError, Dixt.from_file, path)
+            self.assertRaises(OSError, Dixt.from_file, os.path.join(directory, 'ghost.json'))
+
+    def test__from_json__array_of_key_value_pairs(self):
+        self.assertEqual(Dixt.from_json('[["a", {"b": 1}]]'), {'a': {'b': 1}})
+        self.assertRaises(json.JSONDecodeError, Dixt.from_json, '{"a": ')
+
     def test__submap__supermap(self):
         criteria = [
             {'body': {'e': [2, {'g': 9.806}]}},
@@ -650,6 +968,30 @@ class TestDixt(unittest.TestCase):
                 # noinspection PyTypeChecker
                 Dixt().is_submap_of(criterion)
 
+    def test__submap__supermap__compare_lists(self):
+        self.assertFalse(self.dixt.is_supermap_of({'body': {'f': {'y': [{}, [8]]}}}))
+        self.assertTrue(self.dixt.is_supermap_of({'body': {'f': {'y': [{}, [8]]}}}, compare_lists=True))
+        self.assertFalse(self.dixt.is_supermap_of({'body': {'f': {'y': [{}]}}}, compare_lists=True))
+        self.assertFalse(self.dixt.is_supermap_of({'body': {'f': {'y': [{}, 8]}}}, compare_lists=True))
+        self.assertFalse(self.dixt.is_supermap_of({'extra': ['info']}, compare_lists=True))
+
+    def test__submap__supermap__same_objects_deep_and_lazy_objects(self):
+        self.assertTrue(self.dixt.is_submap_of(self.dixt))
+        self.assertTrue(self.dixt.is_supermap_of(self.dixt.dict()))
+        self.assertFalse(self.dixt.is_supermap_of({'body': 'not a mapping'}))
+
+        deep = current = {}
+        for _ in range(10000):
+            current['next'] = current = {}
+        current['value'] = 1
+        self.assertTrue(Dixt.lazy(deep).is_supermap_of(deep))
+        self.assertFalse(Dixt.lazy(deep).is_supermap_of(Dixt.lazy({'next': {'next': {'value': 1}}})))
+
+        lazy = Dixt.from_json('{"a": {"b": [1, {"c": 2}], "d": 3}}', lazy=True)
+        self.assertTrue(lazy.is_supermap_of({'a': {'b': [1, {}]}}, compare_lists=True))
+        self.assertTrue(Dixt(a={'d': 3}).is_submap_of(lazy))
+        self.assertFalse(lazy.is_supermap_of({'a': {'d': 4}}))
+
     def test__popitem(self):
         """Testing inherited function from MutableMapping."""
         dx = Dixt(a=1, b=2, c=3)
@@ -686,6 +1028,17 @@ class TestDixt(unittest.TestCase):
         self.assertEqual(dx.something, 'new')
         self.assertTrue(dx.is_supermap_of(body | {'something': 'new'}))
 
+    def test__keymeta__hidden_flag__reads_do_not_build_hidden_keys(self):
+        self.dixt.keymeta('extra', 'body', hidden=True)
+        with mock.patch.object(Dixt, 'whats_hidden', side_effect=AssertionError):
+            self.assertEqual(self.dixt.extra, 'info')
+            self.assertEqual(self.dixt['body'].c_d, 1.2)
+            self.dixt.extra = 'more info'
+            self.assertNotIn('extra', self.dixt)
+            del self.dixt.body
+        self.assertEqual(self.dixt.whats_hidden(), ('extra',))
+        self.assertEqual(self.dixt.extra, 'more info')
+
     def test__keymeta__flag_a_non_str_key(self):
         self.dixt[123] = '123'
         self.dixt.keymeta(123, hidden=True)
@@ -766,6 +1119,213 @@ class TestDixt(unittest.TestCase):
         with self.assertRaises(TypeError):
             Dixt(a=100, b={200, 300}).reverse()
 
+    def test__lazy__nested_dicts_are_hydrated_only_when_accessed(self):
+        dx = Dixt.lazy(self.dict_equiv)
+        self.assertIsInstance(dx.__data__['body'], dict)
+        self.assertNotIsInstance(dx.__data__['body'], Dixt)
+
+        self.assertEqual(dx.body.c_d, 1.2)
+        self.assertIsInstance(dx.__data__['body'], Dixt)
+        self.assertNotIsInstance(dx.body.__data__['f'], Dixt)
+        self.assertIs(dx.body, dx.body)
+
+        self.assertEqual(dx.get_from('$.body.f.y[0].p'), 5)
+        self.assertEqual(dx['body']['e'][1].g, 9.806)
+        self.assertIsInstance(dx.body.e[1], Dixt)
+
+    def test__lazy__conversions_and_equality_do_not_hydrate(self):
+        dx = Dixt.lazy(self.dict_equiv)
+        self.assertEqual(dx, self.dict_equiv)
+        self.assertEqual(dx, self.dixt)
+        self.assertEqual(dx.dict(), self.dict_equiv)
+        self.assertEqual(dx.json(), json.dumps(self.dict_equiv))
+        self._assert_obj_tree_has_no_dixt_object(dx.dict())
+        self.assertNotIsInstance(dx.__data__['headers'], Dixt)
+
+    def test__lazy__items_and_values_are_hydrated(self):
+        dx = Dixt.lazy(self.dict_equiv)
+        self.assertIsInstance(dict(dx.items())['headers'], Dixt)
+        self.assertIsInstance(list(dx.values())[1], Dixt)
+
+    def test__lazy__set_and_delete_items(self):
+        dx = Dixt.lazy(a={'b': 1})
+        dx.c = {'d': {'e': 2}}
+        self.assertEqual(dx.c.d.e, 2)
+        dx.a = 'scalar'
+        self.assertNotIn('a', dx.__raw__)
+        del dx.c
+        self.assertEqual(dx, {'a': 'scalar'})
+        self.assertEqual(dx.__raw__, set())
+
+    def test__normaliser__is_cached(self):
+        Dixt.__normaliser__.cache_clear()
+        dx = Dixt({'Some Key': 1})
+        self.assertEqual(dx.some_key, 1)
+        self.assertEqual(dx.some_key, 1)
+        info = Dixt.__normaliser__.cache_info()
+        self.assertEqual(info.misses, 2)
+        self.assertGreaterEqual(info.hits, 1)
+
+    def test__normaliser__falsy_original_keys(self):
+        dx = Dixt({0: 'zero', '': 'empty'})
+        self.assertEqual(dx[0], 'zero')
+        self.assertEqual(dx[''], 'empty')
+        del dx[0]
+        self.assertEqual(dx, {'': 'empty'})
+
+    def test__normaliser__subclass_with_key_normaliser(self):
+        class Dotted(Dixt):
+            __normaliser__ = key_normaliser({'.': '_'}, lower=False)
+
+        dx = Dotted({'a.B': {'c.d': 1}})
+        self.assertIsInstance(dx.a_B, Dotted)
+        self.assertEqual(dx.a_B.c_d, 1)
+        self.assertRaises(AttributeError, lambda: dx.a_b)
+        self.assertTrue(hasattr(Dotted.__normaliser__, 'cache_info'))
+
+    def test__normaliser__subclass_with_function(self):
+        class Upper(Dixt):
+            def __normaliser__(key):
+                return key.upper()
+
+        dx = Upper({'ab': 1})
+        self.assertEqual(dx.AB, 1)
+        self.assertEqual(dx['Ab'], 1)
+        self.assertTrue(hasattr(Upper.__normaliser__, 'cache_info'))
+
+    def test__track__changes_and_checkpoint(self):
+        dx = Dixt({'a': {'b': {'c': 1}}, 'tags': [{'x': 1}], 'z': 0})
+        self.assertRaises(ValueError, dx.changes)
+        dx.track()
+        dx.a.b.c = 2
+        dx.update(z=1, new={'d': 1})
+        dx.new.d = 2
+        dx.tags[0].x = 2
+        del dx.a.b
+        assert_that(dx.changes()).is_equal_to([('a', 'b', 'c'), ('z',), ('new',),
+                                               ('new', 'd'), ('tags',), ('a', 'b')])
+        assert_that(dx.a.changes()).is_equal_to(dx.changes())
+        self.assertEqual(len(dx.checkpoint()), 6)
+        self.assertEqual(dx.changes(), [])
+
+        dx.set_by_path('$.tags[0]', 0)
+        dx.apply_patch([{'op': 'add', 'path': '/a/list', 'value': [1]},
+                        {'op': 'add', 'path': '/a/list/0', 'value': 0}])
+        dx.merge({'a': {'list': [2]}}, lists='append')
+        dx.keymeta('z', hidden=True)
+        dx.new.clear()
+        assert_that(dx.changes()).is_equal_to([('tags',), ('a', 'list'), ('z',), ('new',)])
+
+        dx.track(False)
+        self.assertRaises(ValueError, dx.checkpoint)
+        dx.a.list = []
+        self.assertIsNone(dx.a.__parent__)
+
+    def test__track__failed_patch_operations_are_not_changes(self):
+        dx = Dixt({'a': {'list': [1]}, 'b': 1})
+        dx.track()
+        dx.json()
+        with self.assertRaises(IndexError):
+            dx.apply_patch([{'op': 'replace', 'path': '/b', 'value': 2},
+                            {'op': 'remove', 'path': '/a/list/5'},
+                            {'op': 'remove', 'path': '/missing'}])
+        self.assertEqual(dx.changes(), [('b',)])
+        self.assertEqual(dx.json(), '{"a": {"list": [1]}, "b": 2}')
+
+    def test__track__json_encodes_only_the_changes(self):
+        dx = Dixt({'a': {'b': {'c': 1}, 'd': {'e': [1, {'f': 2}]}}, 1: 'int key'})
+        dx.track()
+        self.assertEqual(dx.json(), json.dumps(dx.dict()))
+
+        with mock.patch('lxdx.dixt.encode_basestring_ascii',
+                        side_effect=json.encoder.encode_basestring_ascii) as encode:
+            dx.a.b.c = 2
+            encoded = dx.json()
+            # only the items 'a', 'b', and 'c'
+            self.assertEqual([args[0] for args, _ in encode.call_args_list], ['a', 'b', 'c'])
+        self.assertEqual(encoded, json.dumps(dx.dict()))
+
+        dx.a.d.e[1].f = 3
+        dx.a.d.e.append(Dixt(g=1))
+        dx.a.d.mark_changed('e')
+        dx.a.d.e[2].g = 2
+        self.assertEqual(dx.json(), json.dumps(dx.dict()))
+        self.assertEqual(list(dx.iterencode()), [dx.json()])
+        self.assertEqual(dx.json(indent=2), json.dumps(dx.dict(), indent=2))
+        self.assertRaises(KeyError, dx.mark_changed, 'nonexistent')
+
+    def test__track__objects_added_to_lists_in_place_are_encoded(self):
+        dx = Dixt(a={'items': []})
+        dx.track()
+        dx.json()
+        dx.a['items'].append(Dixt(b=1))
+        dx.a['items'][0].b = 2
+        self.assertEqual(dx.changes(), [])
+        dx.a.mark_changed('items')
+        self.assertEqual(dx.json(), '{"a": {"items": [{"b": 2}]}}')
+
+    def test__track__objects_held_by_several_items(self):
+        dx = Dixt(a={'b': {'c': 1}})
+        dx.track()
+        dx.q = dx.a
+        dx.json()
+        dx.fingerprint()
+        dx.a.b.c = 9
+        self.assertEqual(dx.json(), '{"a": {"b": {"c": 9}}, "q": {"b": {"c": 9}}}')
+        self.assertEqual(dx.fingerprint(), Dixt(dx.dict()).fingerprint())
+
+    def test__track__lazy_objects(self):
+        dx = Dixt.from_json('{"a": {"b": {"c": 1}}, "d": [{"e": 1}]}', lazy=True)
+        dx.track()
+        self.assertEqual(dx.json(), '{"a": {"b": {"c": 1}}, "d": [{"e": 1}]}')
+        dx.a.b.c = 2
+        self.assertEqual(dx.json(), '{"a": {"b": {"c": 2}}, "d": [{"e": 1}]}')
+        self.assertEqual(dx.changes(), [('a', 'b', 'c')])
+
+    def test__fingerprint(self):
+        dx = Dixt({'a': 1, 'b': {'c': [1, 2.0, {'d': True}], 'e': None}, 3: b'x'})
+        same = Dixt({3: b'x', 'b': {'e': None, 'c': [1.0, 2, {'d': 1}]}, 'a': True})
+        self.assertEqual(dx.fingerprint(), same.fingerprint())
+        self.assertEqual(len(dx.fingerprint()), 64)
+        self.assertEqual(Dixt.from_json('{"a": [1, {"b": 2}]}', lazy=True).fingerprint(),
+                         Dixt(a=[1, {'b': 2}]).fingerprint())
+
+        for other in [{'a': 1, 'b': {'c': [2.0, 1, {'d': True}], 'e': None}, 3: b'x'},
+                      {'a': 1, 'b': {'c': (1, 2.0, {'d': True}), 'e': None}, 3: b'x'},
+                      {'a': 1, 'b': {'c': [1, 2.0, {'d': True}], 'e': 'null'}, 3: b'x'},
+                      {'a': 1, 'b': {'c': [1, 2.0, {'d': True}], 'e': None}, '3': b'x'},
+                      {'a': 1, 'b': {'c': [1, 2.0, {'d': True}], 'e': None}}]:
+            self.assertNotEqual(Dixt(other).fingerprint(), dx.fingerprint())
+
+        same.keymeta('a', hidden=True)
+        self.assertEqual(same.fingerprint(), Dixt({3: b'x', 'b': same.b}).fingerprint())
+        self.assertRaises(TypeError, Dixt(a={1, 2}).fingerprint)
+
+    def test__fingerprint__tracked(self):
+        dx = Dixt({'a': {'b': {'c': 1}, 'd': [{'e': 1}]}, 'f': 'g'})
+        dx.track()
+        before = dx.fingerprint()
+        dx.a.b.c = 2
+        self.assertNotEqual(dx.fingerprint(), before)
+        self.assertEqual(dx.fingerprint(), Dixt(dx.dict()).fingerprint())
+
+        expected = Dixt({'a': {'b': {'c': 2}, 'd': [{'e': 2}]}, 'f': 'g'}).fingerprint()
+        canonical = mock.Mock(side_effect=lxdx.dixt._CANONICAL[str])
+        with mock.patch.dict(lxdx.dixt._CANONICAL, {str: canonical}):
+            dx.a.d[0].e = 2
+            self.assertEqual(dx.fingerprint(), expected)
+        # only the items 'a', 'd', and 'e'
+        self.assertEqual([args[0] for args, _ in canonical.call_args_list], ['a', 'd', 'e'])
+
+        dx.a.d.append(Dixt(h=1))
+        dx.a.mark_changed('d')
+        dx.a.d[1].h = 2
+        dx.a.d.append(Dixt(i=1))
+        dx.a.mark_changed('d')
+        self.assertEqual(dx.fingerprint(), Dixt(dx.dict()).fingerprint())
+        dx.a.d[2].i = 2
+        self.assertEqual(dx.fingerprint(), Dixt(dx.dict()).fingerprint())
+
     def _assert_obj_tree_has_no_dixt_object(self, obj):
         self.assertNotIsInstance(obj, Dixt)
         if isinstance(obj, dict):
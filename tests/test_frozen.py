@@ -0,0 +1,151 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import pickle
+import unittest
+
+from lxdx import Dixt, FrozenDixt
+
+
+class TestFrozenDixt(unittest.TestCase):
+    def setUp(self):
+        self.frozen = FrozenDixt({'Group Name': {'items': [{'id': 1}, {'id': 2}]},
+                                  'other': {'value': 3}}, extra='x')
+
+    def test__init__freezes_nested_values(self):
+        self.assertIsInstance(self.frozen.group_name, FrozenDixt)
+        self.assertIsInstance(self.frozen.group_name['items'], tuple)
+        self.assertIsInstance(self.frozen.group_name['items'][0], FrozenDixt)
+        self.assertEqual(list(self.frozen), ['Group Name', 'other', 'extra'])
+        self.assertEqual(self.frozen['group_name'], self.frozen['Group Name'])
+        self.assertIn('Group Name', self.frozen)
+        self.assertNotIn('group_name', self.frozen)
+        self.assertEqual(FrozenDixt(a=1, A=2), {'a': 2})
+
+    def test__immutable(self):
+        with self.assertRaises(TypeError):
+            self.frozen.extra = 'y'
+        with self.assertRaises(TypeError):
+            del self.frozen.extra
+        with self.assertRaises(TypeError):
+            self.frozen['extra'] = 'y'
+        self.assertRaises(AttributeError, getattr, self.frozen, 'missing')
+        self.assertRaises(KeyError, self.frozen.__getitem__, 'missing')
+
+    def test__set__delete__create_new_versions(self):
+        changed = self.frozen.set('extra', 'y').set('new', 1)
+        self.assertEqual(self.frozen.extra, 'x')
+        self.assertEqual((changed.extra, changed.new), ('y', 1))
+        self.assertEqual(list(changed), ['Group Name', 'other', 'extra', 'new'])
+        self.assertIs(changed.other, self.frozen.other)
+
+        deleted = changed.delete('group_name')
+        self.assertEqual(list(deleted), ['other', 'extra', 'new'])
+        self.assertEqual(len(changed), 4)
+        self.assertRaises(KeyError, deleted.delete, 'group_name')
+        self.assertIs(self.frozen.set('extra', 'x'), self.frozen)
+
+    def test__update__union(self):
+        updated = self.frozen | {'extra': 'y', 'other': {'value': 4}}
+        self.assertEqual(updated.other.value, 4)
+        self.assertEqual(self.frozen.other.value, 3)
+        self.assertIs(updated.group_name, self.frozen.group_name)
+        self.assertEqual(list({'first': 0} | self.frozen), ['first', 'Group Name', 'other', 'extra'])
+        self.assertEqual(self.frozen.update([('extra', 'z')], more=1), {**self.frozen, 'extra': 'z', 'more': 1})
+
+    def test__set_by_path(self):
+        changed = self.frozen.set_by_path('$.group_name.items[1].id', 20)
+        self.assertEqual(changed.group_name['items'][1].id, 20)
+        self.assertEqual(self.frozen.group_name['items'][1].id, 2)
+        self.assertIs(changed.group_name['items'][0], self.frozen.group_name['items'][0])
+        self.assertIs(changed.other, self.frozen.other)
+        self.assertEqual(changed.get_from('$.group_name.items[?(@.id > 10)].id'), [20])
+        self.assertEqual(list(changed.iter_from('$..id')), [1, 20])
+
+        self.assertRaises(ValueError, self.frozen.set_by_path, '$.group_name.items[*].id', 0)
+        self.assertRaises(KeyError, self.frozen.set_by_path, '$.missing.id', 0)
+        self.assertRaises(IndexError, self.frozen.set_by_path, '$.group_name.items[5].id', 0)
+
+    def test__hash__eq(self):
+        same = FrozenDixt({'extra': 'x', 'other': {'value': 3},
+                           'Group Name': {'items': ({'id': 1}, {'id': 2})}})
+        self.assertEqual(hash(same), hash(self.frozen))
+        self.assertEqual(same, self.frozen)
+        self.assertEqual({self.frozen: 1}[same], 1)
+
+        changed = self.frozen.set('extra', 'y')
+        self.assertNotEqual(changed, self.frozen)
+        self.assertEqual(hash(changed.set('extra', 'x')), hash(self.frozen))
+        self.assertEqual(hash(changed.delete('extra')), hash(FrozenDixt(changed.items()).delete('extra')))
+
+        self.assertEqual(self.frozen, self.frozen.thaw())
+        self.assertRaises(TypeError, hash, FrozenDixt(a={1, 2}))
+
+    def test__colliding_keys(self):
+        # hash(-1) == hash(-2)
+        frozen = FrozenDixt({-1: 'a', -2: 'b', 3: 'c'})
+        self.assertEqual((frozen[-1], frozen[-2]), ('a', 'b'))
+        self.assertEqual(frozen.set(-2, 'x')[-2], 'x')
+        self.assertEqual(frozen.delete(-1), {-2: 'b', 3: 'c'})
+        self.assertEqual(frozen.delete(-1).delete(-2).delete(3), {})
+
+    def test__many_items(self):
+        expected = {f'key{i}': i for i in range(2000)}
+        frozen = FrozenDixt(expected)
+        for i in range(0, 2000, 3):
+            frozen = frozen.delete(f'key{i}')
+            del expected[f'key{i}']
+        frozen = frozen.update({f'new{i}': i for i in range(500)})
+        expected.update({f'new{i}': i for i in range(500)})
+        self.assertEqual(list(frozen.items()), list(expected.items()))
+
+    def test__freeze__thaw__pickle(self):
+        dx = Dixt(a={'b': [1, {'c': 2}]}, secret=1)
+        dx.keymeta('secret', hidden=True)
+        frozen = dx.freeze()
+        self.assertEqual(frozen, {'a': {'b': (1, {'c': 2})}})
+
+        thawed = frozen.thaw()
+        self.assertIsInstance(thawed, Dixt)
+        self.assertIsInstance(thawed.a.b, list)
+        self.assertEqual(frozen.dict(), {'a': {'b': [1, {'c': 2}]}})
+        self.assertEqual(pickle.loads(pickle.dumps(self.frozen)), self.frozen)
+
+    def test__subclass__normaliser(self):
+        class Frozen(FrozenDixt):
+            __normaliser__ = str.upper
+
+        frozen = Frozen({'a': {'b': 1}})
+        self.assertIsInstance(frozen.A, Frozen)
+        self.assertEqual(frozen.A.B, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import pickle
+import unittest
+
+from lxdx import Dixt, LayeredDixt
+
+
+class TestLayeredDixt(unittest.TestCase):
+    def setUp(self):
+        self.defaults = Dixt({'Server': {'Host Name': 'localhost', 'port': 80, 'tls': {'enabled': False}},
+                              'debug': False, 'name': 'app'})
+        self.env = Dixt({'server': {'port': 8080}, 'debug': True})
+        self.cli = Dixt({'server': {'tls': {'enabled': True}}})
+        self.view = LayeredDixt(self.cli, self.env, self.defaults)
+
+    def test__get__from_first_layer_with_key(self):
+        self.assertEqual(self.view.debug, True)
+        self.assertEqual(self.view['name'], 'app')
+        self.assertEqual(self.view.get('missing', 0), 0)
+        self.assertRaises(KeyError, self.view.__getitem__, 'missing')
+        self.assertRaises(AttributeError, getattr, self.view, 'missing')
+
+    def test__get__nested_views(self):
+        server = self.view.server
+        self.assertIsInstance(server, LayeredDixt)
+        self.assertEqual((server.host_name, server.port, server.tls.enabled), ('localhost', 8080, True))
+        self.assertIs(self.view.server, server)
+        self.assertIs(LayeredDixt(self.env, self.defaults).server.tls, self.defaults.server.tls)
+
+        self.cli.server = 'shadowed'
+        self.view.refresh()
+        self.assertEqual(self.view.server, 'shadowed')
+
+    def test__contains__iter__len(self):
+        self.assertIn('Server', self.view)
+        self.assertIn('server', self.view)
+        self.assertNotIn('Name', self.view)
+        self.assertEqual(list(self.view), ['server', 'debug', 'name'])
+        self.assertEqual(len(self.view), 3)
+        self.assertEqual(dict(self.view.server), {'Host Name': 'localhost', 'port': 8080,
+                                                  'tls': self.view.server.tls})
+
+    def test__set__delete__first_layer(self):
+        self.view.debug = 'verbose'
+        self.view['Port'] = 1
+        self.assertEqual(self.cli, {'server': {'tls': {'enabled': True}}, 'debug': 'verbose', 'Port': 1})
+        self.assertEqual(self.view.debug, 'verbose')
+
+        del self.view.debug
+        self.assertEqual(self.view.debug, True)
+        self.assertRaises(KeyError, self.view.__delitem__, 'name')
+
+        del self.env['debug']
+        self.assertEqual(self.view.debug, False)
+
+    def test__set__layers_directly(self):
+        self.assertIsNone(self.view.get('new'))
+        self.cli['new'] = 5
+        self.assertEqual((self.view.get('new'), self.view.new), (5, 5))
+
+        self.view.name = 'changed'
+        self.view.server.host_name = 'example.com'
+        self.assertEqual((self.cli.name, self.defaults.name), ('changed', 'app'))
+        self.assertEqual(self.cli.server.host_name, 'example.com')
+
+        # the only layer holding the nested object
+        LayeredDixt(self.env, self.defaults).server.tls.enabled = True
+        self.assertEqual(self.defaults.server.tls.enabled, True)
+
+    def test__nested_views__changed_layers_directly(self):
+        server = self.view.server
+        del self.cli.server
+        self.assertIsNot(self.view.server, server)
+        self.assertEqual(self.view.server.tls.enabled, False)
+
+        self.env.server = {'port': 1}
+        self.assertEqual(self.view.get('server').port, 1)
+
+        del self.env.server
+        self.assertIs(self.view.server, self.defaults.server)
+        self.defaults.server = {'port': 2}
+        self.assertEqual(self.view.server, {'port': 2})
+        del self.defaults.server
+        self.assertIsNone(self.view.get('server'))
+        self.assertRaises(AttributeError, getattr, self.view, 'server')
+
+    def test__push__pop(self):
+        self.view.push({'name': 'other', 'server': {'port': 1}})
+        self.assertIsInstance(self.view.layers[0], Dixt)
+        self.assertEqual((self.view.name, self.view.server.port), ('other', 1))
+
+        self.view.pop()
+        self.assertIs(self.view.pop(), self.cli)
+        self.assertEqual(self.view.server.tls.enabled, False)
+        self.assertEqual(self.view.layers, (self.env, self.defaults))
+        self.assertRaises(TypeError, self.view.push, ['not', 'a', 'mapping'])
+
+        empty = LayeredDixt()
+        self.assertRaises(IndexError, empty.pop)
+        self.assertRaises(KeyError, empty.__setitem__, 'a', 1)
+
+    def test__paths(self):
+        self.assertEqual(self.view.get_from('$.server.port'), 8080)
+        self.assertEqual(self.view.get_from('$..enabled'), [True])
+        self.assertEqual(list(self.view.iter_from('$.server[?(@.enabled)]')), [self.view.server.tls])
+
+    def test__flatten(self):
+        flat = self.view.flatten()
+        self.assertEqual(flat, {'Server': {'Host Name': 'localhost', 'port': 8080, 'tls': {'enabled': True}},
+                                'debug': True, 'name': 'app'})
+        flat.server.port = 0
+        self.assertEqual(self.env.server.port, 8080)
+        self.assertEqual(pickle.loads(pickle.dumps(self.view)).flatten(), self.view.flatten())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,9 +28,10 @@ ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import pickle
 import unittest
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from lxdx import Dixt
 
 
@@ -43,6 +44,86 @@ class TestMisc(unittest.TestCase):
         a.b.c.d = 2
         self.assertNotEqual(a.b.c.d, copied.b.c.d)
 
+    def test__dixt_object__shallow_copy_shares_values(self):
+        a = Dixt({'Some Key': {'c': 1}, 'b': [1]})
+        a.keymeta('b', hidden=True)
+        for copied in [copy(a), a.copy()]:
+            self.assertEqual(copied, a)
+            self.assertIs(copied.some_key, a.some_key)
+            copied.d = 1
+            copied.keymeta('b', hidden=False)
+            self.assertNotIn('d', a)
+            self.assertEqual(a.whats_hidden(), ('b',))
+            self.assertIs(copied.b, a.__hidden__['b'])
+
+    def test__dixt_object__deep_copy_in_one_pass(self):
+        a = Dixt({'Some Key': {'c': [1, [2]], 'e': ([3], 'x')}, 'h': {'i': 1}})
+        a.keymeta('h', hidden=True)
+        for copied in [deepcopy(a), a.copy(deep=True)]:
+            self.assertEqual(copied.dict(), a.dict())
+            self.assertIsNot(copied.some_key, a.some_key)
+            self.assertIsNot(copied.some_key.c[1], a.some_key.c[1])
+            self.assertIsNot(copied.some_key.e[0], a.some_key.e[0])
+            self.assertIs(copied.some_key.e[1], a.some_key.e[1])
+            self.assertEqual(copied.some_key.__key__, 'Some Key')
+            self.assertEqual(copied.keymeta('h'), {'h': {'hidden': True}})
+            copied.keymeta('h', hidden=False)
+            self.assertIsNot(copied.h, a.__hidden__['h'])
+            self.assertEqual(a.whats_hidden(), ('h',))
+
+    def test__lazy_dixt_object__deep_copy(self):
+        a = Dixt.lazy({'a': {'b': 1}})
+        copied = deepcopy(a)
+        copied.a.b = 2
+        self.assertEqual(a.a.b, 1)
+
+    def test__dixt_object__must_have_no_instance_dict(self):
+        dx = Dixt(a=1)
+        self.assertFalse(hasattr(dx, '__dict__'))
+        self.assertIs(dx.__keymeta__, Dixt().__keymeta__)
+        self.assertIs(dx.__hidden__, Dixt().__hidden__)
+
+    def test__dixt_object__must_be_picklable_with_hidden_items(self):
+        a = Dixt(a=1, b={'c': {'d': 4}})
+        a.keymeta('a', hidden=True)
+        b = pickle.loads(pickle.dumps(a))
+        self.assertEqual(b, a)
+        self.assertEqual(b.whats_hidden(), ('a',))
+        self.assertEqual(b.a, 1)
+        self.assertEqual(b.b.c.d, 4)
+
+    def test__dixt_object__must_not_pickle_keymap(self):
+        a = Dixt({'Some Key': {'Other Key': 1}})
+        data = pickle.dumps(a, pickle.HIGHEST_PROTOCOL)
+        self.assertNotIn(b'some_key', data)
+        b = pickle.loads(data)
+        self.assertEqual(b.some_key.other_key, 1)
+        self.assertEqual(b.some_key.__key__, 'Some Key')
+        self.assertIs(b.__keymeta__, Dixt().__keymeta__)
+
+    def test__dixt_object__must_be_picklable_with_out_of_band_buffers(self):
+        blob = bytes(range(256)) * 1024
+        a = Dixt(blob=blob, small=b'x', nested={'blob': blob})
+        buffers = []
+        data = pickle.dumps(a, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 2)
+        self.assertLess(len(data), len(blob))
+
+        b = pickle.loads(data, buffers=buffers)
+        self.assertEqual(b, a)
+        self.assertIs(type(b.blob), bytes)
+        self.assertIs(type(b.nested.blob), bytes)
+        self.assertEqual(pickle.loads(pickle.dumps(a, protocol=5)), a)
+
+    def test__lazy_dixt_object__must_be_picklable(self):
+        a = Dixt.lazy({'a': {'b': 1}, 'c': [{'d': 2}]})
+        b = pickle.loads(pickle.dumps(a))
+        self.assertEqual(b.__raw__, {'a', 'c'})
+        self.assertEqual(b.c[0].d, 2)
+
+        a = Dixt.from_json('{"a": {"b": 1}, "c": [1]}', lazy=True)
+        self.assertEqual(pickle.loads(pickle.dumps(a)).json(), a.json())
+
 
 if __name__ == '__main__':
     unittest.main()
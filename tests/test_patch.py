@@ -0,0 +1,140 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import json
+import unittest
+
+from unittest import mock
+
+from lxdx import Dixt
+from lxdx.patch import apply_patch, diff
+
+
+class TestPatch(unittest.TestCase):
+    def setUp(self):
+        self.dixt = Dixt({
+            'server': {'Host Name': 'localhost', 'ports': [80, 443], 'a/b~c': 1},
+            'users': [{'name': 'Ann'}, {'name': 'Ben'}, {'name': 'Cid'}],
+            'debug': False
+        })
+
+    def assert_patched(self, target):
+        operations = Dixt.diff(self.dixt, target)
+        self.assertEqual(json.loads(json.dumps(operations)), operations)
+        self.dixt.apply_patch(operations)
+        self.assertEqual(self.dixt, target)
+        return operations
+
+    def test__diff__mappings(self):
+        target = self.dixt.dict()
+        target['server']['Host Name'] = 'example.com'
+        target['server']['a/b~c'] = {'x': 1}
+        del target['debug']
+        target['new'] = {'nested': [1]}
+
+        self.assertEqual(self.assert_patched(target), [
+            {'op': 'remove', 'path': '/debug'},
+            {'op': 'add', 'path': '/new', 'value': {'nested': [1]}},
+            {'op': 'replace', 'path': '/server/Host Name', 'value': 'example.com'},
+            {'op': 'replace', 'path': '/server/a~1b~0c', 'value': {'x': 1}},
+        ])
+        self.assertIsInstance(self.dixt.new, Dixt)
+        self.assertEqual(Dixt.diff(self.dixt, self.dixt), [])
+
+    def test__diff__lists(self):
+        target = self.dixt.dict()
+        target['users'].insert(1, {'name': 'Abe'})
+        target['users'][-1]['name'] = 'Cy'
+        target['server']['ports'] = [80]
+
+        self.assertEqual(self.assert_patched(target), [
+            {'op': 'remove', 'path': '/server/ports/1'},
+            {'op': 'replace', 'path': '/users/2/name', 'value': 'Cy'},
+            {'op': 'add', 'path': '/users/1', 'value': {'name': 'Abe'}},
+        ])
+        self.assertIsInstance(self.dixt.users[1], Dixt)
+
+    def test__diff__json_types(self):
+        self.assertEqual(diff({'a': 1, 'b': [True], 'c': {}}, {'a': True, 'b': [1], 'c': []}), [
+            {'op': 'replace', 'path': '/a', 'value': True},
+            {'op': 'replace', 'path': '/b/0', 'value': 1},
+            {'op': 'replace', 'path': '/c', 'value': []},
+        ])
+
+    def test__diff__same_objects_are_skipped(self):
+        target = self.dixt.copy()
+        target.debug = True
+        with mock.patch('lxdx.patch._diff_lists', side_effect=AssertionError):
+            self.assertEqual(Dixt.diff(self.dixt, target), [{'op': 'replace', 'path': '/debug', 'value': True}])
+
+    def test__diff__hidden_and_lazy_items(self):
+        lazy = Dixt.from_json(self.dixt.json(), lazy=True)
+        lazy.keymeta('debug', hidden=True)
+        target = {'server': {'Host Name': 'localhost', 'ports': [8080, 443], 'a/b~c': 1},
+                  'users': [{'name': 'Ann'}, {'name': 'Ben'}, {'name': 'Cid'}]}
+        self.assertEqual(Dixt.diff(lazy, target), [{'op': 'replace', 'path': '/server/ports/0', 'value': 8080}])
+
+    def test__diff__keys_not_strings(self):
+        source = Dixt({1: {'a': [1]}, 'b': {2: 'x'}})
+        target = Dixt({1: {'a': [1]}, 'b': {2: 'x'}, 'c': 3})
+        self.assertEqual(Dixt.diff(source, target), [{'op': 'add', 'path': '/c', 'value': 3}])
+        source.apply_patch(Dixt.diff(source, target))
+        self.assertEqual(source, target)
+
+        for changed in [{1: 'y'}, {1: {'a': [2]}, 'b': {2: 'x'}}, {1: {'a': [1]}, 'b': {}}]:
+            with self.assertRaises(TypeError):
+                Dixt.diff(source, changed)
+
+    def test__apply_patch__whole_object_and_plain_objects(self):
+        self.dixt.apply_patch([{'op': 'replace', 'path': '', 'value': {'a': [1]}}])
+        self.assertEqual(self.dixt, {'a': [1]})
+
+        data = {'a': [1, 2]}
+        apply_patch(data, [{'op': 'add', 'path': '/a/-', 'value': 3}, {'op': 'add', 'path': '/b', 'value': 0}])
+        self.assertEqual(data, {'a': [1, 2, 3], 'b': 0})
+
+    def test__apply_patch__invalid_operations(self):
+        invalid = [
+            ({'op': 'move', 'path': '/debug', 'from': '/x'}, ValueError),
+            ({'op': 'add', 'path': '/debug'}, ValueError),
+            ({'op': 'remove', 'path': ''}, ValueError),
+            ({'op': 'remove', 'path': 'debug'}, ValueError),
+            ({'op': 'remove', 'path': '/users/01'}, ValueError),
+            ({'op': 'remove', 'path': '/users/3'}, IndexError),
+            ({'op': 'replace', 'path': '/missing', 'value': 1}, KeyError),
+            ({'op': 'remove', 'path': '/debug/x'}, KeyError),
+        ]
+        for operation, error in invalid:
+            with self.assertRaises(error):
+                self.dixt.apply_patch([operation])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Copyright (c) 2021, @github.com/hardistones
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification,
+are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors
+   may be used to endorse or promote products derived from this software without
+   specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import unittest
+
+from lxdx import Dixt
+from lxdx.path import CompiledPath, compile_path
+
+
+class TestPath(unittest.TestCase):
+    def setUp(self):
+        self.dixt = Dixt({
+            'Group Name': 'alpha',
+            'items': [{'id': 1, 'Tags': ['a', 'b']}, {'id': 2, 'Tags': []}],
+            'nested': {'list': [[0, {'x': 'y'}]]}
+        })
+
+    def test__compile_path__returns_reusable_accessor(self):
+        path = Dixt.compile_path('$.items[1].id')
+        self.assertIsInstance(path, CompiledPath)
+        self.assertEqual(path.steps, ('items', 1, 'id'))
+        self.assertEqual(path.get(self.dixt), 2)
+        self.assertEqual(path.get(Dixt(items=[{}, {'id': 3}])), 3)
+
+    def test__compile_path__is_cached(self):
+        self.assertIs(compile_path('$.group_name'), Dixt.compile_path('$.group_name'))
+
+    def test__get__normalised_keys_and_nested_lists(self):
+        self.assertEqual(compile_path('$.group_name').get(self.dixt), 'alpha')
+        self.assertEqual(compile_path('$.items[0].tags[1]').get(self.dixt), 'b')
+        self.assertEqual(compile_path('$.nested.list[0][1].x').get(self.dixt), 'y')
+
+    def test__get__default_value_when_not_found(self):
+        self.assertIsNone(compile_path('$.ghost').get(self.dixt, default=None))
+        self.assertEqual(compile_path('$.items[9].id').get(self.dixt, default=0), 0)
+        self.assertEqual(compile_path('$.group_name.x').get(self.dixt, default=0), 0)
+        self.assertRaises(KeyError, compile_path('$.ghost').get, self.dixt)
+        self.assertRaises(IndexError, compile_path('$.items[9]').get, self.dixt)
+
+    def test__get__index_of_non_list_raises_key_error(self):
+        self.assertRaises(KeyError, compile_path('$.nested[0]').get, self.dixt)
+
+    def test__get__plain_dict(self):
+        self.assertEqual(compile_path('$.a[0].b').get({'a': [{'b': 1}]}), 1)
+
+    def test__set__existing_items(self):
+        compile_path('$.items[0].tags[0]').set(self.dixt, 'z')
+        compile_path('$.group_name').set(self.dixt, 'beta')
+        self.assertEqual(self.dixt['items'][0]['Tags'], ['z', 'b'])
+        self.assertEqual(self.dixt['Group Name'], 'beta')
+        self.assertNotIn('group_name', self.dixt)
+
+    def test__set__nonexistent_items_raise_error(self):
+        self.assertRaises(KeyError, compile_path('$.ghost').set, self.dixt, 1)
+        self.assertRaises(IndexError, compile_path('$.items[2]').set, self.dixt, 1)
+        self.assertRaises(KeyError, compile_path('$.items.id').set, self.dixt, 1)
+
+    def test__compile_path__multiple_items(self):
+        path = compile_path('$.items[*].id')
+        self.assertFalse(path.singular)
+        self.assertTrue(compile_path('$.items[0].id').singular)
+        self.assertEqual(path.get(self.dixt), [1, 2])
+        self.assertEqual(list(path.iter(self.dixt)), [1, 2])
+
+    def test__iter__slices(self):
+        numbers = {'n': list(range(10))}
+        self.assertEqual(list(compile_path('$.n[2:5]').iter(numbers)), [2, 3, 4])
+        self.assertEqual(list(compile_path('$.n[-2:]').iter(numbers)), [8, 9])
+        self.assertEqual(list(compile_path('$.n[::4]').iter(numbers)), [0, 4, 8])
+        self.assertEqual(list(compile_path('$.n[20:]').iter(numbers)), [])
+
+    def test__iter__recursive_descent_in_document_order(self):
+        data = Dixt(id=0, a=[{'id': 1, 'b': {'id': 2}}, {'id': 3}], c={'id': 4})
+        self.assertEqual(list(compile_path('$..id').iter(data)), [0, 1, 2, 3, 4])
+        self.assertEqual(list(compile_path('$.a..id').iter(data)), [1, 2, 3])
+
+    def test__iter__recursive_descent_of_very_deep_objects(self):
+        data = leaf = {}
+        for _ in range(5000):
+            leaf['next'] = leaf = {}
+        leaf['id'] = 'deep'
+        self.assertEqual(list(compile_path('$..id').iter(data)), ['deep'])
+
+    def test__iter__skips_nonexistent_items(self):
+        data = {'a': [{'id': 1}, {}, 'x', {'id': None}]}
+        self.assertEqual(list(compile_path('$.a[*].id').iter(data)), [1, None])
+        self.assertEqual(list(compile_path('$.a[9]').iter(data)), [])
+
+    def test__set__multiple_items(self):
+        compile_path('$.items[*].tags').set(self.dixt, [])
+        self.assertEqual(self.dixt.get_from('$.items[*].tags'), [[], []])
+
+        compile_path('$..id').set(self.dixt, 0)
+        self.assertEqual(self.dixt.get_from('$..id'), [0, 0])
+
+        data = {'n': [1, 2, 3, 4]}
+        compile_path('$.n[1::2]').set(data, None)
+        self.assertEqual(data, {'n': [1, None, 3, None]})
+
+    def test__iter__filters(self):
+        orders = Dixt(orders=[{'Status': 'open', 'total': 150},
+                              {'status': 'closed', 'total': 500},
+                              {'status': 'open', 'total': 50},
+                              {'status': 'open', 'total': 'n/a'}])
+        path = compile_path("$.orders[?(@.status == 'open' && @.total > 100)].total")
+        self.assertFalse(path.singular)
+        self.assertEqual(path.get(orders), [150])
+        self.assertEqual(orders.get_from('$.orders[?(100 < @.total)].total'), [150, 500])
+        self.assertEqual(orders.get_from('$.orders[?(@.total <= 50 || !(@.total))].total'), [50])
+        self.assertEqual(orders.get_from('$.orders[?(@.total == "n/a")].status'), ['open'])
+
+    def test__iter__filters_of_members_and_mappings(self):
+        data = {'n': [1, 5, 9], 'm': {'a': {'v': [1]}, 'b': {'v': [3]}, 'c': {}}}
+        self.assertEqual(list(compile_path('$.n[?(@ > 2)]').iter(data)), [5, 9])
+        self.assertEqual(list(compile_path('$.m[?(@.v[0] >= 2)]').iter(data)), [{'v': [3]}])
+        self.assertEqual(list(compile_path('$.m[?(@.v)]').iter(data)), [{'v': [1]}, {'v': [3]}])
+        self.assertEqual(list(compile_path('$.m[?(@.v.x == null)]').iter(data)), [])
+        self.assertEqual(len(list(compile_path('$.m[?(true)]').iter(data))), 3)
+
+    def test__iter__filters_of_items_of_several_classes(self):
+        class Upper(Dixt):
+            __normaliser__ = staticmethod(str.upper)
+
+        items = [Upper(Key=1), Dixt(Key=2), Upper(Key=3), Dixt(Key=4)]
+        path = compile_path('$.items[?(@.key > 0)]')
+        self.assertEqual(path.get({'items': items}), items)
+
+    def test__iter__filters_of_lazy_objects(self):
+        data = Dixt.lazy({'o': [{'a': {'b': 1}}, {'a': {'b': 2}}]})
+        self.assertEqual(data.get_from('$.o[?(@.a.b == 2)].a'), [Dixt(b=2)])
+
+    def test__set__filtered_items(self):
+        compile_path('$.items[?(@.id == 2)].tags').set(self.dixt, ['c'])
+        self.assertEqual(self.dixt.get_from('$.items[*].tags'), [['a', 'b'], ['c']])
+
+        compile_path('$.items[?(@.id > 1)]').set(self.dixt, None)
+        self.assertIsNone(self.dixt['items'][1])
+
+    def test__compile_path__invalid_filters(self):
+        for path in ['$.a[?()]', '$.a[?(@.b ==)]', '$.a[?(@.b', '$.a[?(@.b == 1]',
+                     '$.a[?(@.b = 1)]', '$.a[?(@.b))]', '$.a[?(@.b == x)]', '$.a[?(@.b == 01)]',
+                     r"$.a[?(@.b == '\x')]"]:
+            with self.assertRaises(ValueError):
+                compile_path(path)
+
+    def test__compile_path__invalid_paths(self):
+        for path in ['', '$', '$.', '$[0]', '$[1:]', 'a.b', '$.a.[0]', '$.a[x]',
+                     '$.a b', '$..', '$.a[::0]', '$.a[**]']:
+            with self.assertRaises(ValueError):
+                compile_path(path)
+        self.assertRaises(TypeError, compile_path, 123)
+
+
+if __name__ == '__main__':
+    unittest.main()